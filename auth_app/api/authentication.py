@@ -1,11 +1,23 @@
+from django.utils.translation import gettext_lazy as _
+from rest_framework.exceptions import AuthenticationFailed
 from rest_framework_simplejwt.authentication import JWTAuthentication
 from rest_framework_simplejwt.exceptions import InvalidToken, TokenError
+from rest_framework_simplejwt.settings import api_settings
+from rest_framework_simplejwt.utils import get_md5_hash_password
+
+from auth_app.api.caching import (
+    cache_token,
+    get_cached_token,
+    get_cached_user,
+)
 
 
 class CookieJWTAuthentication(JWTAuthentication):
     """
     Custom JWT Authentication that reads the access token from cookies.
     Silently ignores invalid/expired tokens for AllowAny views.
+    Recently validated tokens are memoized until they expire, and users
+    are looked up through the user cache instead of the database.
     """
 
     def authenticate(self, request):
@@ -19,3 +31,44 @@ class CookieJWTAuthentication(JWTAuthentication):
             return self.get_user(validated_token), validated_token
         except (InvalidToken, TokenError):
             return None
+
+    def get_validated_token(self, raw_token):
+        """
+        Return the memoized token for a raw token validated before.
+        A hit skips signature and claim verification.
+        """
+        validated_token = get_cached_token(raw_token)
+        if validated_token is None:
+            validated_token = super().get_validated_token(raw_token)
+            cache_token(raw_token, validated_token)
+        return validated_token
+
+    def get_user(self, validated_token):
+        """
+        Return the token's user from the user cache.
+        Performs the same checks as JWTAuthentication.get_user.
+        """
+        try:
+            user_id = validated_token[api_settings.USER_ID_CLAIM]
+        except KeyError:
+            raise InvalidToken(
+                _('Token contained no recognizable user identification'))
+
+        user = get_cached_user(user_id)
+        if user is None:
+            raise AuthenticationFailed(
+                _('User not found'), code='user_not_found')
+
+        if api_settings.CHECK_USER_IS_ACTIVE and not user.is_active:
+            raise AuthenticationFailed(
+                _('User is inactive'), code='user_inactive')
+
+        if api_settings.CHECK_REVOKE_TOKEN:
+            if validated_token.get(
+                    api_settings.REVOKE_TOKEN_CLAIM
+            ) != get_md5_hash_password(user.password):
+                raise AuthenticationFailed(
+                    _("The user's password has been changed."),
+                    code='password_changed')
+
+        return user
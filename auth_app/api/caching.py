@@ -0,0 +1,122 @@
+import copy
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+
+from rest_framework_simplejwt.settings import api_settings
+
+
+USER_KEY = 'auth:user:{user_id}'
+
+
+class TTLCache:
+    """
+    Thread-safe, size-bounded in-process LRU cache with expiring entries.
+    Expiry times are absolute UNIX timestamps.
+    """
+
+    def __init__(self, maxsize):
+        self.maxsize = maxsize
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return None
+            value, expires_at = entry
+            if expires_at <= time.time():
+                del self._data[key]
+                return None
+            self._data.move_to_end(key)
+            return value
+
+    def set(self, key, value, expires_at):
+        if self.maxsize <= 0:
+            return
+        with self._lock:
+            self._data[key] = (value, expires_at)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def delete(self, key):
+        with self._lock:
+            self._data.pop(key, None)
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+
+
+_users = TTLCache(settings.AUTH_USER_CACHE_SIZE)
+_tokens = TTLCache(settings.AUTH_TOKEN_CACHE_SIZE)
+
+
+def _token_digest(raw_token):
+    if isinstance(raw_token, str):
+        raw_token = raw_token.encode('utf-8')
+    return hashlib.sha256(raw_token).hexdigest()
+
+
+def get_cached_token(raw_token):
+    """
+    Return the validated token for a raw JWT seen before, or None.
+    """
+    return _tokens.get(_token_digest(raw_token))
+
+
+def cache_token(raw_token, validated_token):
+    """
+    Remember a validated token until its exp claim.
+    """
+    _tokens.set(_token_digest(raw_token), validated_token,
+                validated_token['exp'])
+
+
+def get_cached_user(user_id):
+    """
+    Return the user for a token's user id, or None if it does not exist.
+
+    Looks in the per-process LRU first, then in the shared cache (Redis),
+    then in the database. Shared entries are dropped as soon as the user
+    changes; per-process entries of other workers live at most
+    AUTH_USER_CACHE_LOCAL_TTL seconds, which bounds how long a deactivated
+    user can still be authenticated.
+    """
+    user_id = str(user_id)
+    user = _users.get(user_id)
+    if user is None:
+        key = USER_KEY.format(user_id=user_id)
+        user = cache.get(key)
+        if user is None:
+            user = get_user_model().objects.filter(
+                **{api_settings.USER_ID_FIELD: user_id}).first()
+            if user is None:
+                return None
+            cache.set(key, user, timeout=settings.AUTH_USER_CACHE_TTL)
+        _users.set(user_id, user,
+                   time.time() + settings.AUTH_USER_CACHE_LOCAL_TTL)
+    # Requests must not share (and mutate) the cached instance.
+    return copy.copy(user)
+
+
+def invalidate_user(user_id):
+    """
+    Drop a user from the shared cache and this process' LRU.
+    """
+    _users.delete(str(user_id))
+    cache.delete(USER_KEY.format(user_id=user_id))
+
+
+def clear_local_caches():
+    """
+    Empty the per-process caches (used by tests).
+    """
+    _users.clear()
+    _tokens.clear()
@@ -0,0 +1,29 @@
+import time
+from django.core.cache import cache
+
+from rest_framework_simplejwt.settings import api_settings
+
+
+DENYLIST_KEY = 'auth:denied:{jti}'
+
+
+def _key(token):
+    return DENYLIST_KEY.format(jti=token[api_settings.JTI_CLAIM])
+
+
+def deny_token(token):
+    """
+    Deny a token by its jti until it expires.
+    The entry's TTL is the token's remaining lifetime, so nothing
+    accumulates once the token could not be used anyway.
+    """
+    ttl = int(token['exp'] - time.time()) + 1
+    if ttl > 0:
+        cache.set(_key(token), 1, timeout=ttl)
+
+
+def is_denied(token):
+    """
+    Return True if the token was denied, e.g. on logout or rotation.
+    """
+    return cache.get(_key(token)) is not None
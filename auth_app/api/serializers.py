@@ -1,31 +1,33 @@
 from django.contrib.auth.models import User
+from django.db import IntegrityError, transaction
 
 from rest_framework import serializers
-from rest_framework.validators import UniqueValidator
 from rest_framework_simplejwt.serializers import TokenObtainPairSerializer
 
+from auth_app.api.users import get_user_by_email, users_with_email
+
 
 class RegistrationSerializer(serializers.ModelSerializer):
     """
     Serializer for user registration.
-    Validates that password and confirmed_password match.
+    Validates that password and confirmed_password match and that the
+    email is not taken in any letter case.
     Creates inactive user upon successful validation.
     """
     confirmed_password = serializers.CharField(write_only=True)
-    email = serializers.EmailField(
-        required=True,
-        validators=[
-            UniqueValidator(
-                queryset=User.objects.all(),
-                message="Please check your entries and try again."
-            )
-        ])
+    email = serializers.EmailField(required=True)
     password = serializers.CharField(write_only=True)
 
     class Meta:
         model = User
         fields = ['email', 'password', 'confirmed_password']
 
+    def validate_email(self, value):
+        if users_with_email(value).exists():
+            raise serializers.ValidationError(
+                "Please check your entries and try again.")
+        return value
+
     def validate(self, data):
         if data['password'] != data['confirmed_password']:
             raise serializers.ValidationError(
@@ -35,12 +37,18 @@ class RegistrationSerializer(serializers.ModelSerializer):
     def create(self, validated_data):
         validated_data.pop('confirmed_password', None)
 
-        user = User.objects.create_user(
-            username=validated_data['email'],
-            password=validated_data['password'],
-            email=validated_data['email'],
-            is_active=False
-        )
+        # A concurrent registration of the same email trips the unique index.
+        try:
+            with transaction.atomic():
+                user = User.objects.create_user(
+                    username=validated_data['email'],
+                    password=validated_data['password'],
+                    email=validated_data['email'],
+                    is_active=False
+                )
+        except IntegrityError:
+            raise serializers.ValidationError(
+                {"email": ["Please check your entries and try again."]})
         return user
 
 
@@ -55,13 +63,10 @@ class EmailTokenObtainPairSerializer(TokenObtainPairSerializer):
         self.fields.pop('username', None)
 
     def validate(self, attrs):
-        email = attrs.get('email')
-
-        try:
-            user = User.objects.get(email=email)
-            attrs['username'] = user.username
-        except User.DoesNotExist:
+        user = get_user_by_email(attrs.get('email'))
+        if user is None:
             raise serializers.ValidationError('Invalid credentials')
+        attrs['username'] = user.username
 
         return super().validate(attrs)
 
@@ -1,8 +1,17 @@
 from django.dispatch import receiver, Signal
-from django.core.mail import send_mail
+from django.contrib.auth import get_user_model
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
 from django.template.loader import render_to_string
 from django.conf import settings
+import django_rq
 import os
+from rq import Retry
+
+from rest_framework_simplejwt.settings import api_settings
+
+from auth_app.api.caching import invalidate_user
+from auth_app.tasks import send_email
 
 
 # Custom signal for sending activation email with token
@@ -12,6 +21,22 @@ user_registered = Signal()
 password_reset_requested = Signal()
 
 
+def queue_email(**message):
+    """
+    Enqueue an email on the 'email' RQ queue, retried with backoff.
+    Sends it right away if EMAIL_ASYNC is disabled (e.g. in tests).
+    """
+    if not settings.EMAIL_ASYNC:
+        return send_email(**message)
+    queue = django_rq.get_queue('email', autocommit=True)
+    return queue.enqueue(
+        send_email,
+        retry=Retry(max=len(settings.EMAIL_RETRY_INTERVALS),
+                    interval=settings.EMAIL_RETRY_INTERVALS),
+        **message
+    )
+
+
 @receiver(user_registered)
 def send_activation_email(sender, user, token, **kwargs):
     """
@@ -30,13 +55,11 @@ def send_activation_email(sender, user, token, **kwargs):
         'activation_link': activation_link,
     })
 
-    send_mail(
+    queue_email(
         subject='Activate Your Videoflix Account',
         message=f'Please activate your account by visiting: {activation_link}',
-        from_email=settings.DEFAULT_FROM_EMAIL,
         recipient_list=[user.email],
         html_message=html_message,
-        fail_silently=False,
     )
 
 
@@ -61,11 +84,22 @@ def send_password_reset_email(sender, user, token, **kwargs):
         'reset_link_valid_hours': timeout_hours,
     })
 
-    send_mail(
+    queue_email(
         subject='Reset Your Videoflix Password',
         message=f'Please reset your password by visiting: {reset_link}',
-        from_email=settings.DEFAULT_FROM_EMAIL,
         recipient_list=[user.email],
         html_message=html_message,
-        fail_silently=False,
     )
+
+
+@receiver(post_save, sender=get_user_model())
+@receiver(post_delete, sender=get_user_model())
+def user_changed_handler(sender, instance, **kwargs):
+    """
+    Drop a changed or deleted user from the authentication user cache.
+    Covers deactivation and password changes. Runs again after commit so
+    concurrent requests cannot re-cache the old row.
+    """
+    user_id = getattr(instance, api_settings.USER_ID_FIELD)
+    invalidate_user(user_id)
+    transaction.on_commit(lambda: invalidate_user(user_id))
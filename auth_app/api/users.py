@@ -0,0 +1,25 @@
+from django.contrib.auth import get_user_model
+from django.db.models import Value
+from django.db.models.functions import Lower
+
+
+def users_with_email(email):
+    """
+    Return the users whose email matches case-insensitively.
+
+    Filters on LOWER(email) so PostgreSQL can use the unique functional
+    index auth_user_email_lower_uniq instead of scanning the user table.
+    The index is partial (WHERE email <> ''), so the query repeats that
+    predicate; without it the planner cannot use the index.
+    """
+    return get_user_model().objects.exclude(email='').alias(
+        email_lower=Lower('email')).filter(email_lower=Lower(Value(email)))
+
+
+def get_user_by_email(email):
+    """
+    Return the user with the given email (any case), or None.
+    """
+    if not email:
+        return None
+    return users_with_email(email).first()
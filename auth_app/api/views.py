@@ -1,10 +1,13 @@
 from django.contrib.auth.tokens import default_token_generator
 from django.contrib.auth.models import User
+from django.utils import timezone
 
 from rest_framework.response import Response
 from rest_framework.views import APIView
 from rest_framework.permissions import AllowAny
 from rest_framework import status
+from rest_framework_simplejwt.exceptions import TokenError
+from rest_framework_simplejwt.tokens import RefreshToken
 from rest_framework_simplejwt.views import TokenRefreshView, TokenObtainPairView
 
 from auth_app.api.serializers import (
@@ -13,15 +16,21 @@ from auth_app.api.serializers import (
     PasswordResetSerializer,
     PasswordResetConfirmSerializer
 )
+from auth_app.api.denylist import deny_token, is_denied
 from auth_app.api.signals import user_registered, password_reset_requested
+from auth_app.api.throttling import EmailRateThrottle, IPRateThrottle
+from auth_app.api.users import get_user_by_email
 
 
 class RegisterView(APIView):
     """
     API view to handle user registration.
     Sends activation email with token upon successful registration.
+    Throttled per IP and per email.
     """
     permission_classes = [AllowAny]
+    throttle_classes = [IPRateThrottle, EmailRateThrottle]
+    throttle_scope = 'register'
 
     def post(self, request):
         serializer = RegistrationSerializer(data=request.data)
@@ -62,6 +71,9 @@ class ActivateAccountView(APIView):
 
         if user is not None and default_token_generator.check_token(user, token):
             user.is_active = True
+            # Marks the account as activated for purge_unactivated_users,
+            # and invalidates the one-time activation token.
+            user.last_login = timezone.now()
             user.save()
             return Response({"message": "Account successfully activated."}, status=status.HTTP_200_OK)
         else:
@@ -72,8 +84,11 @@ class CookieTokenObtainPairView(TokenObtainPairView):
     """
     Custom view to handle user login and issue JWT tokens via HttpOnly cookies.
     Accepts email instead of username.
+    Throttled per IP and per email before the password is checked.
     """
     serializer_class = EmailTokenObtainPairSerializer
+    throttle_classes = [IPRateThrottle, EmailRateThrottle]
+    throttle_scope = 'login'
 
     def _set_auth_cookies(self, response, access_token, refresh_token):
         # Set HttpOnly cookies for access and refresh tokens.
@@ -132,22 +147,31 @@ class CookieTokenObtainPairView(TokenObtainPairView):
 class CookieTokenRefreshView(TokenRefreshView):
     """
     Custom view to refresh JWT access token using HttpOnly cookies.
+    Rejects denied refresh tokens. With ROTATE_REFRESH_TOKENS a new
+    refresh token is issued and the used one is denied.
     """
 
     def _get_refresh_token(self, request):
         # Get refresh token from cookies or request data.
         return request.COOKIES.get('refresh_token') or request.data.get('refresh')
 
-    def _set_access_cookie(self, response, access_token):
-        # Set access token cookie on response.
+    def _set_cookie(self, response, key, token):
+        # Set an HttpOnly token cookie on response.
         response.set_cookie(
-            key="access_token",
-            value=str(access_token),
+            key=key,
+            value=str(token),
             httponly=True,
             secure=True,
             samesite='Lax'
         )
 
+    def _is_denied(self, refresh_token):
+        # Check the denylist; malformed tokens are rejected by the serializer.
+        try:
+            return is_denied(RefreshToken(refresh_token))
+        except TokenError:
+            return False
+
     def post(self, request, *args, **kwargs):
         refresh_token = self._get_refresh_token(request)
         if not refresh_token:
@@ -158,8 +182,11 @@ class CookieTokenRefreshView(TokenRefreshView):
 
         serializer = self.get_serializer(data={'refresh': refresh_token})
         try:
-            serializer.is_valid(raise_exception=True)
+            valid = (not self._is_denied(refresh_token) and
+                     serializer.is_valid(raise_exception=True))
         except Exception:
+            valid = False
+        if not valid:
             return Response(
                 {"error": "Refresh token invalid."},
                 status=status.HTTP_401_UNAUTHORIZED
@@ -171,17 +198,29 @@ class CookieTokenRefreshView(TokenRefreshView):
             "access": access_token
         })
 
-        self._set_access_cookie(response, access_token)
+        self._set_cookie(response, 'access_token', access_token)
+
+        rotated_token = serializer.validated_data.get('refresh')
+        if rotated_token:
+            deny_token(RefreshToken(refresh_token, verify=False))
+            self._set_cookie(response, 'refresh_token', rotated_token)
         return response
 
 
 class LogoutView(APIView):
     """
     API view to handle user logout.
-    Deletes JWT cookies.
+    Denies the refresh token and deletes JWT cookies.
     """
 
     def post(self, request):
+        refresh_token = request.COOKIES.get('refresh_token')
+        if refresh_token:
+            try:
+                deny_token(RefreshToken(refresh_token))
+            except TokenError:
+                pass
+
         response = Response({
             "detail": "Logout successful! All tokens will be deleted. Refresh token is now invalid."
         }, status=status.HTTP_200_OK)
@@ -195,18 +234,20 @@ class PasswordResetView(APIView):
     """
     API view to handle password reset request.
     Sends password reset email if user exists.
+    Throttled per IP and per email.
     """
     permission_classes = [AllowAny]
+    throttle_classes = [IPRateThrottle, EmailRateThrottle]
+    throttle_scope = 'password_reset'
 
     def post(self, request):
         serializer = PasswordResetSerializer(data=request.data)
 
         if serializer.is_valid():
-            email = serializer.validated_data['email']
-
-            try:
-                user = User.objects.get(email=email)
+            user = get_user_by_email(serializer.validated_data['email'])
 
+            # Don't reveal that the user doesn't exist for security reasons
+            if user is not None:
                 token = default_token_generator.make_token(user)
 
                 password_reset_requested.send(
@@ -214,9 +255,6 @@ class PasswordResetView(APIView):
                     user=user,
                     token=token
                 )
-            except User.DoesNotExist:
-                # Don't reveal that the user doesn't exist for security reasons
-                pass
 
             return Response({
                 "detail": "An email has been sent to reset your password."
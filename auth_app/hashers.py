@@ -0,0 +1,24 @@
+from django.conf import settings
+from django.contrib.auth.hashers import Argon2PasswordHasher
+
+
+class TunableArgon2PasswordHasher(Argon2PasswordHasher):
+    """
+    Argon2id hasher whose costs come from the ARGON2_* settings.
+
+    Hashes keep Django's 'argon2' format, so they stay readable by the
+    stock hasher. Stored hashes with other parameters (or from another
+    hasher) are upgraded by Django the next time the user logs in.
+    """
+
+    @property
+    def time_cost(self):
+        return settings.ARGON2_TIME_COST
+
+    @property
+    def memory_cost(self):
+        return settings.ARGON2_MEMORY_COST
+
+    @property
+    def parallelism(self):
+        return settings.ARGON2_PARALLELISM
@@ -0,0 +1,84 @@
+import timeit
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand
+from django.db import connection, transaction
+
+from auth_app.api.users import users_with_email
+
+
+class Rollback(Exception):
+    pass
+
+
+class Command(BaseCommand):
+    """
+    Time login email lookups against a table of synthetic users.
+    All users are inserted inside a transaction that is rolled back,
+    so the database is left unchanged.
+    """
+    help = 'Benchmark case-insensitive email lookups on a large user table.'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--users', type=int, default=1_000_000,
+            help='Number of synthetic users (default: 1000000).')
+        parser.add_argument(
+            '--iterations', type=int, default=200,
+            help='Lookups per query (default: 200).')
+
+    def _insert_users(self, count):
+        if connection.vendor == 'postgresql':
+            # Server-side insert; a million rows take seconds.
+            with connection.cursor() as cursor:
+                cursor.execute(
+                    """
+                    INSERT INTO auth_user (
+                        username, email, password, first_name, last_name,
+                        is_superuser, is_staff, is_active, date_joined)
+                    SELECT 'bench-' || n || '@example.com',
+                           'Bench-' || n || '@Example.com',
+                           '!', '', '', false, false, true, now()
+                    FROM generate_series(1, %s) AS n
+                    """, [count])
+                cursor.execute('ANALYZE auth_user')
+            return
+        User = get_user_model()
+        User.objects.bulk_create(
+            (User(username=f'bench-{n}@example.com',
+                  email=f'Bench-{n}@Example.com', password='!')
+             for n in range(1, count + 1)),
+            batch_size=5000)
+
+    def _time(self, label, lookup, iterations):
+        # lookup builds a new queryset per call; a reused queryset would
+        # serve every iteration after the first from its result cache.
+        seconds = timeit.timeit(lambda: list(lookup()), number=iterations)
+        self.stdout.write(
+            f'{label:<24} {seconds / iterations * 1000:8.3f} ms/lookup')
+
+    def handle(self, *args, **options):
+        count, iterations = options['users'], options['iterations']
+        email = f'bench-{count // 2}@example.com'
+        User = get_user_model()
+
+        try:
+            with transaction.atomic():
+                self.stdout.write(f'Inserting {count} users...')
+                self._insert_users(count)
+
+                self._time('LOWER(email) (indexed)',
+                           lambda: users_with_email(email), iterations)
+                self._time('email__iexact',
+                           lambda: User.objects.filter(email__iexact=email),
+                           iterations)
+
+                if connection.vendor == 'postgresql':
+                    with connection.cursor() as cursor:
+                        sql, params = users_with_email(
+                            email).query.sql_with_params()
+                        cursor.execute(f'EXPLAIN {sql}', params)
+                        for (line,) in cursor.fetchall():
+                            self.stdout.write(line)
+                raise Rollback()
+        except Rollback:
+            pass
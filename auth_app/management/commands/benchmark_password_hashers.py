@@ -0,0 +1,83 @@
+import os
+import statistics
+import time
+from concurrent.futures import ThreadPoolExecutor
+from django.contrib.auth.hashers import get_hashers
+from django.core.management.base import BaseCommand
+
+
+PASSWORD = 'correct horse battery staple'
+
+
+def _scaled(hasher, scale):
+    # Copy of the hasher with its main cost multiplied by scale, or None
+    # if the hasher has no cost this command knows how to scale.
+    if hasattr(hasher, 'time_cost'):
+        attrs = {'time_cost': max(1, round(hasher.time_cost * scale))}
+        label = f"t={attrs['time_cost']} m={hasher.memory_cost} p={hasher.parallelism}"
+    elif hasattr(hasher, 'iterations'):
+        attrs = {'iterations': max(1, round(hasher.iterations * scale))}
+        label = f"iterations={attrs['iterations']}"
+    else:
+        return None, None
+    return type(type(hasher).__name__, (type(hasher),), attrs)(), label
+
+
+class Command(BaseCommand):
+    """
+    Measure hash and verify latency and verify throughput of the
+    configured PASSWORD_HASHERS at multiples of their configured cost.
+    Verify throughput approximates the logins per second a worker host
+    can sustain; both hashers release the GIL, so threads use all cores.
+    """
+    help = 'Benchmark the configured password hashers at several costs.'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--scales', default='0.5,1,2',
+            help='Cost multipliers to benchmark (default: 0.5,1,2).')
+        parser.add_argument(
+            '--iterations', type=int, default=10,
+            help='Hashes and verifies per measurement (default: 10).')
+        parser.add_argument(
+            '--threads', type=int, default=os.cpu_count() or 1,
+            help='Concurrent verifies for throughput (default: CPU count).')
+
+    def _latency(self, func, iterations):
+        timings = []
+        for _ in range(iterations):
+            start = time.perf_counter()
+            func()
+            timings.append((time.perf_counter() - start) * 1000)
+        return statistics.mean(timings), max(timings)
+
+    def _throughput(self, hasher, encoded, iterations, threads):
+        count = iterations * threads
+        start = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=threads) as pool:
+            list(pool.map(lambda _: hasher.verify(PASSWORD, encoded),
+                          range(count)))
+        return count / (time.perf_counter() - start)
+
+    def handle(self, *args, **options):
+        scales = [float(scale) for scale in options['scales'].split(',')]
+        iterations, threads = options['iterations'], options['threads']
+
+        self.stdout.write(f'{iterations} iterations, {threads} threads')
+        for configured in get_hashers():
+            for scale in scales:
+                hasher, label = _scaled(configured, scale)
+                if hasher is None:
+                    continue
+                encoded = hasher.encode(PASSWORD, hasher.salt())
+                hash_mean, hash_max = self._latency(
+                    lambda: hasher.encode(PASSWORD, hasher.salt()), iterations)
+                verify_mean, verify_max = self._latency(
+                    lambda: hasher.verify(PASSWORD, encoded), iterations)
+                per_second = self._throughput(
+                    hasher, encoded, iterations, threads)
+                self.stdout.write(
+                    f'{configured.algorithm:<14} x{scale:<4g} {label:<28} '
+                    f'hash {hash_mean:8.1f} ms (max {hash_max:.1f}) '
+                    f'verify {verify_mean:8.1f} ms (max {verify_max:.1f}) '
+                    f'{per_second:8.1f} verifies/s')
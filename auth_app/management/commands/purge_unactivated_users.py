@@ -0,0 +1,48 @@
+import django_rq
+from django.core.management.base import BaseCommand
+
+from auth_app.tasks import find_unactivated_users, purge_unactivated_users
+
+
+class Command(BaseCommand):
+    """
+    Delete registrations never activated within PASSWORD_RESET_TIMEOUT.
+    Run periodically (e.g. daily via cron).
+    """
+    help = 'Delete users that never activated their account.'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--batch-size', type=int, default=None,
+            help='Users per transaction '
+                 '(default: UNACTIVATED_USER_PURGE_BATCH_SIZE).')
+        parser.add_argument(
+            '--enqueue', action='store_true',
+            help='Run as RQ job on the default queue instead of inline.')
+        parser.add_argument(
+            '--dry-run', action='store_true',
+            help='List the users that would be deleted without deleting.')
+
+    def _report(self):
+        users = find_unactivated_users().values_list(
+            'pk', 'email', 'date_joined')
+        count = 0
+        for pk, email, date_joined in users.iterator():
+            self.stdout.write(f'{pk}\t{email}\t{date_joined:%Y-%m-%d %H:%M}')
+            count += 1
+        self.stdout.write(f'Would delete {count} unactivated users.')
+
+    def handle(self, *args, **options):
+        if options['dry_run']:
+            self._report()
+            return
+        if options['enqueue']:
+            queue = django_rq.get_queue('default', autocommit=True)
+            job = queue.enqueue(purge_unactivated_users, options['batch_size'])
+            self.stdout.write(f'Enqueued purge job {job.id}.')
+            return
+
+        metrics = purge_unactivated_users(options['batch_size'])
+        self.stdout.write(self.style.SUCCESS(
+            f"Deleted {metrics['deleted']} unactivated users in "
+            f"{metrics['batches']} batches ({metrics['seconds']:.3f}s)."))
@@ -0,0 +1,71 @@
+import time
+from django.conf import settings
+from django.core.cache import cache
+from django.utils.deprecation import MiddlewareMixin
+
+from rest_framework_simplejwt.exceptions import InvalidToken, TokenError
+from rest_framework_simplejwt.settings import api_settings
+from rest_framework_simplejwt.tokens import RefreshToken
+
+from auth_app.api.authentication import CookieJWTAuthentication
+from auth_app.api.denylist import is_denied
+
+
+SLIDE_KEY = 'auth:slide:{jti}'
+
+
+class SlidingSessionMiddleware(MiddlewareMixin):
+    """
+    Reissue the access token cookie on authenticated responses once it
+    has less than ACCESS_TOKEN_RENEW_BEFORE seconds left.
+
+    The new token is derived from the refresh token cookie, exactly like
+    POST /api/token/refresh/ without rotation, so sessions still end with
+    the refresh token (or on logout). A shared cache entry per access
+    token makes sure only the first of many parallel segment requests
+    reissues it.
+    """
+
+    def _needs_renewal(self, request, response):
+        if not settings.ACCESS_TOKEN_RENEW_BEFORE or response.status_code >= 400:
+            return False
+        if 'access_token' in response.cookies:
+            # Login, refresh and logout set the cookie themselves.
+            return False
+        user = getattr(request, 'user', None)
+        return user is not None and user.is_authenticated
+
+    def _renewed_access_token(self, request):
+        # Return a new access token, or None if not due or not possible.
+        try:
+            access = CookieJWTAuthentication().get_validated_token(
+                request.COOKIES['access_token'])
+            remaining = access['exp'] - time.time()
+            if remaining > settings.ACCESS_TOKEN_RENEW_BEFORE:
+                return None
+            refresh = RefreshToken(request.COOKIES['refresh_token'])
+        except (KeyError, InvalidToken, TokenError):
+            return None
+
+        claim = api_settings.USER_ID_CLAIM
+        if refresh.get(claim) != access.get(claim) or is_denied(refresh):
+            return None
+        jti = access[api_settings.JTI_CLAIM]
+        if not cache.add(SLIDE_KEY.format(jti=jti), 1,
+                         timeout=max(int(remaining), 1)):
+            return None
+        return refresh.access_token
+
+    def process_response(self, request, response):
+        if not self._needs_renewal(request, response):
+            return response
+        access_token = self._renewed_access_token(request)
+        if access_token is not None:
+            response.set_cookie(
+                key='access_token',
+                value=str(access_token),
+                httponly=True,
+                secure=True,
+                samesite='Lax'
+            )
+        return response
@@ -0,0 +1,75 @@
+from django.db import migrations
+
+
+# Unique index on LOWER(email), matching the lookups in auth_app/api/users.py.
+# Users without email (e.g. superusers created without one) are excluded.
+# Built CONCURRENTLY so logins and registrations keep writing to auth_user;
+# that cannot run in a transaction, hence the non-atomic migration. A failed
+# concurrent build leaves an invalid index behind, which is dropped first.
+FORWARD_SQL = [
+    "DROP INDEX CONCURRENTLY IF EXISTS auth_user_email_lower_uniq;",
+    """
+    CREATE UNIQUE INDEX CONCURRENTLY auth_user_email_lower_uniq
+    ON auth_user (LOWER(email)) WHERE email <> '';
+    """,
+]
+
+BACKWARD_SQL = [
+    "DROP INDEX CONCURRENTLY IF EXISTS auth_user_email_lower_uniq;",
+]
+
+DUPLICATES_SQL = """
+    SELECT LOWER(email), array_agg(id ORDER BY id)
+    FROM auth_user
+    WHERE email <> ''
+    GROUP BY LOWER(email)
+    HAVING COUNT(*) > 1
+    ORDER BY LOWER(email);
+"""
+
+# Duplicate groups listed in the error; the count covers all of them.
+MAX_REPORTED_DUPLICATES = 50
+
+
+def _check_duplicates(schema_editor):
+    with schema_editor.connection.cursor() as cursor:
+        cursor.execute(DUPLICATES_SQL)
+        duplicates = cursor.fetchall()
+    if not duplicates:
+        return
+    lines = [f'  {email}: user ids {", ".join(map(str, ids))}'
+             for email, ids in duplicates[:MAX_REPORTED_DUPLICATES]]
+    if len(duplicates) > MAX_REPORTED_DUPLICATES:
+        lines.append(f'  ... and {len(duplicates) - MAX_REPORTED_DUPLICATES} more')
+    raise RuntimeError(
+        f'Cannot create auth_user_email_lower_uniq: {len(duplicates)} emails '
+        'are used by several users when compared case-insensitively. '
+        'Merge or rename these users, then run migrate again:\n'
+        + '\n'.join(lines))
+
+
+def _run_on_postgres(statements, check_duplicates=False):
+    def run(apps, schema_editor):
+        if schema_editor.connection.vendor != 'postgresql':
+            return
+        if check_duplicates:
+            _check_duplicates(schema_editor)
+        for statement in statements:
+            schema_editor.execute(statement)
+    return run
+
+
+class Migration(migrations.Migration):
+
+    atomic = False
+
+    dependencies = [
+        ('auth', '0012_alter_user_first_name_max_length'),
+    ]
+
+    operations = [
+        migrations.RunPython(
+            _run_on_postgres(FORWARD_SQL, check_duplicates=True),
+            _run_on_postgres(BACKWARD_SQL),
+        ),
+    ]
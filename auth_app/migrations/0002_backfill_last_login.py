@@ -0,0 +1,23 @@
+from django.db import migrations
+from django.db.models import F
+
+
+def backfill_last_login(apps, schema_editor):
+    # purge_unactivated_users treats last_login IS NULL as never activated.
+    # Logins did not record it before, so existing users cannot be told
+    # apart: inactive ones may have been deactivated after activating.
+    # Mark every existing user, so the purge only covers new registrations.
+    User = apps.get_model('auth', 'User')
+    User.objects.filter(last_login__isnull=True).update(
+        last_login=F('date_joined'))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('auth_app', '0001_user_email_lower_index'),
+    ]
+
+    operations = [
+        migrations.RunPython(backfill_last_login, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,132 @@
+import logging
+import smtplib
+import time
+from datetime import timedelta
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core.mail import EmailMultiAlternatives, get_connection
+from django.db import transaction
+from django.utils import timezone
+
+
+logger = logging.getLogger(__name__)
+
+# SMTP connection kept open between jobs of a non-forking email worker
+# (rq.worker.SimpleWorker), so consecutive emails skip the handshake.
+_connection = None
+
+
+def _get_connection():
+    global _connection
+    if _connection is None:
+        _connection = get_connection(fail_silently=False)
+        _connection.open()
+    return _connection
+
+
+def close_connection():
+    """
+    Close the persistent SMTP connection; the next email reopens it.
+    """
+    global _connection
+    if _connection is not None:
+        try:
+            _connection.close()
+        except Exception:
+            logger.debug('Closing SMTP connection failed', exc_info=True)
+    _connection = None
+
+
+def _build_message(subject, message, recipient_list, html_message=None,
+                   from_email=None):
+    email = EmailMultiAlternatives(
+        subject=subject,
+        body=message,
+        from_email=from_email or settings.DEFAULT_FROM_EMAIL,
+        to=recipient_list,
+    )
+    if html_message:
+        email.attach_alternative(html_message, 'text/html')
+    return email
+
+
+def send_email(subject, message, recipient_list, html_message=None,
+               from_email=None):
+    """
+    Send one email over the persistent SMTP connection.
+
+    A connection dropped by the server since the last email is reopened
+    once. Any other error closes the connection and is raised, so RQ
+    retries the job with backoff (see EMAIL_RETRY_INTERVALS).
+    """
+    email = _build_message(
+        subject, message, recipient_list, html_message, from_email)
+    try:
+        try:
+            return _get_connection().send_messages([email])
+        except smtplib.SMTPServerDisconnected:
+            close_connection()
+            return _get_connection().send_messages([email])
+    except Exception:
+        close_connection()
+        raise
+
+
+def _unactivated_users(cutoff):
+    # Registered but never activated. Activation and every login set
+    # last_login (migration 0002 backfilled it for all users existing
+    # then), so accounts deactivated after activation are kept.
+    return get_user_model().objects.filter(
+        is_active=False, last_login__isnull=True, date_joined__lt=cutoff)
+
+
+def _purge_cutoff():
+    return timezone.now() - timedelta(seconds=settings.PASSWORD_RESET_TIMEOUT)
+
+
+def find_unactivated_users():
+    """
+    Return the users purge_unactivated_users would delete now,
+    ordered by primary key.
+    """
+    return _unactivated_users(_purge_cutoff()).order_by('pk')
+
+
+def purge_unactivated_users(batch_size=None):
+    """
+    Delete users that never activated their account within
+    PASSWORD_RESET_TIMEOUT (the lifetime of the activation link).
+
+    Walks the table by primary key (keyset pagination) and deletes each
+    batch in its own short transaction, so no lock is held for long and
+    no query scans past the last deleted id. The conditions are checked
+    again on delete, so users activating meanwhile are kept.
+    Returns the metrics also logged: deleted rows, batches and seconds.
+    """
+    batch_size = batch_size or settings.UNACTIVATED_USER_PURGE_BATCH_SIZE
+    cutoff = _purge_cutoff()
+    label = get_user_model()._meta.label
+    started = time.monotonic()
+    last_id, deleted, batches = 0, 0, 0
+
+    while True:
+        ids = list(
+            _unactivated_users(cutoff).filter(pk__gt=last_id)
+            .order_by('pk').values_list('pk', flat=True)[:batch_size])
+        if not ids:
+            break
+        last_id = ids[-1]
+        with transaction.atomic():
+            _, per_model = _unactivated_users(cutoff).filter(
+                pk__in=ids).delete()
+        deleted += per_model.get(label, 0)
+        batches += 1
+
+    metrics = {
+        'deleted': deleted,
+        'batches': batches,
+        'seconds': round(time.monotonic() - started, 3),
+    }
+    logger.info('Purged %(deleted)d unactivated users in %(batches)d '
+                'batches (%(seconds).3fs)', metrics)
+    return metrics
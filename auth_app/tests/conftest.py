@@ -2,6 +2,7 @@
 Pytest configuration and shared fixtures for auth_app tests.
 """
 import pytest
+from django.core.cache import cache
 from django.core.management import call_command
 from rest_framework.test import APIClient
 
@@ -24,6 +25,21 @@ def api_client():
     return APIClient()
 
 
+@pytest.fixture
+def locmem_cache(settings):
+    """
+    Replace the dummy test cache with an empty local-memory cache,
+    for tests of the token denylist, throttles and cached lookups.
+    """
+    settings.CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+            'LOCATION': 'auth-tests',
+        }
+    }
+    cache.clear()
+
+
 @pytest.fixture(autouse=True)
 def email_backend_setup(settings):
     """
@@ -45,3 +61,25 @@ def clear_mail_outbox():
     """
     from django.core import mail
     mail.outbox = []
+
+
+@pytest.fixture(autouse=True)
+def clear_auth_caches():
+    """
+    Empty the per-process authentication caches between tests.
+    """
+    from auth_app.api.caching import clear_local_caches
+    clear_local_caches()
+    yield
+    clear_local_caches()
+
+
+@pytest.fixture(autouse=True)
+def close_smtp_connection():
+    """
+    Drop the persistent email connection so each test opens its own.
+    """
+    from auth_app.tasks import close_connection
+    close_connection()
+    yield
+    close_connection()
@@ -0,0 +1,166 @@
+import pytest
+import time
+from unittest.mock import patch
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.test import RequestFactory
+
+from rest_framework.exceptions import AuthenticationFailed
+from rest_framework_simplejwt.exceptions import InvalidToken
+from rest_framework_simplejwt.tokens import AccessToken
+
+from auth_app.api.authentication import CookieJWTAuthentication
+from auth_app.api.caching import (
+    TTLCache,
+    clear_local_caches,
+    get_cached_token,
+)
+
+
+def _request(user):
+    request = RequestFactory().get('/')
+    request.COOKIES['access_token'] = str(AccessToken.for_user(user))
+    return request
+
+
+@pytest.fixture
+def user(db):
+    """Create an active user for testing."""
+    return User.objects.create_user(
+        username='testuser@example.com',
+        email='testuser@example.com',
+        password='SecurePass123!',
+        is_active=True
+    )
+
+
+class TestTTLCache:
+    """Test suite for the in-process TTL LRU cache."""
+
+    def test_expiry(self):
+        """Test that expired entries are not returned."""
+        lru = TTLCache(maxsize=10)
+        lru.set('fresh', 1, time.time() + 60)
+        lru.set('stale', 2, time.time() - 1)
+
+        assert lru.get('fresh') == 1
+        assert lru.get('stale') is None
+
+    def test_lru_eviction(self):
+        """Test that the least recently used entry is evicted."""
+        lru = TTLCache(maxsize=2)
+        expires_at = time.time() + 60
+        lru.set('a', 1, expires_at)
+        lru.set('b', 2, expires_at)
+        lru.get('a')
+        lru.set('c', 3, expires_at)
+
+        assert lru.get('a') == 1
+        assert lru.get('b') is None
+        assert lru.get('c') == 3
+
+
+@pytest.mark.django_db
+class TestUserCache:
+    """Test suite for the user cache in CookieJWTAuthentication."""
+
+    def test_repeated_requests_skip_database(self, user, locmem_cache, django_assert_num_queries):
+        """Test that only the first request loads the user."""
+        auth = CookieJWTAuthentication()
+
+        with django_assert_num_queries(1):
+            auth.authenticate(_request(user))
+        with django_assert_num_queries(0):
+            authenticated_user, _ = auth.authenticate(_request(user))
+
+        assert authenticated_user.pk == user.pk
+
+    def test_shared_cache_used_by_other_processes(self, user, locmem_cache, django_assert_num_queries):
+        """Test that an empty local LRU falls back to the shared cache."""
+        auth = CookieJWTAuthentication()
+        auth.authenticate(_request(user))
+        clear_local_caches()
+
+        with django_assert_num_queries(0):
+            auth.authenticate(_request(user))
+
+    def test_deactivated_user_rejected(self, user, locmem_cache):
+        """Test that deactivation invalidates the cached user."""
+        auth = CookieJWTAuthentication()
+        auth.authenticate(_request(user))
+
+        user.is_active = False
+        user.save()
+
+        with pytest.raises(AuthenticationFailed):
+            auth.authenticate(_request(user))
+
+    def test_local_entries_expire(self, user, locmem_cache, settings):
+        """Test that local entries of other workers expire after the TTL."""
+        settings.AUTH_USER_CACHE_LOCAL_TTL = 0
+        auth = CookieJWTAuthentication()
+        auth.authenticate(_request(user))
+
+        # Simulate a change made by another process: only Redis is cleared.
+        User.objects.filter(pk=user.pk).update(is_active=False)
+        cache.clear()
+
+        with pytest.raises(AuthenticationFailed):
+            auth.authenticate(_request(user))
+
+    def test_deleted_user_rejected(self, user, locmem_cache):
+        """Test that deleted users are no longer authenticated."""
+        auth = CookieJWTAuthentication()
+        request = _request(user)
+        auth.authenticate(request)
+
+        user.delete()
+
+        with pytest.raises(AuthenticationFailed):
+            auth.authenticate(request)
+
+    def test_cached_instance_not_shared(self, user, locmem_cache):
+        """Test that each request gets its own user instance."""
+        auth = CookieJWTAuthentication()
+
+        first, _ = auth.authenticate(_request(user))
+        second, _ = auth.authenticate(_request(user))
+
+        assert first is not second
+
+
+@pytest.mark.django_db
+class TestTokenMemoization:
+    """Test suite for memoized token validation."""
+
+    def test_repeated_token_not_verified_again(self, user):
+        """Test that a repeated token skips verification."""
+        auth = CookieJWTAuthentication()
+        raw_token = str(AccessToken.for_user(user))
+
+        first = auth.get_validated_token(raw_token)
+        with patch('rest_framework_simplejwt.authentication.JWTAuthentication.get_validated_token') as verify:
+            second = auth.get_validated_token(raw_token)
+
+        verify.assert_not_called()
+        assert second is first
+
+    def test_entries_expire_with_token(self, user):
+        """Test that memoized tokens are not used after exp."""
+        auth = CookieJWTAuthentication()
+        token = AccessToken.for_user(user)
+        raw_token = str(token)
+        auth.get_validated_token(raw_token)
+
+        with patch('auth_app.api.caching.time.time', return_value=token['exp'] + 1):
+            assert get_cached_token(raw_token) is None
+
+    def test_invalid_token_not_cached(self, user):
+        """Test that invalid tokens are rejected every time."""
+        auth = CookieJWTAuthentication()
+        raw_token = str(AccessToken.for_user(user)) + 'tampered'
+
+        for _ in range(2):
+            with pytest.raises(InvalidToken):
+                auth.get_validated_token(raw_token)
+        assert get_cached_token(raw_token) is None
@@ -0,0 +1,133 @@
+import pytest
+import time
+from unittest.mock import patch
+from django.contrib.auth.models import User
+
+from rest_framework import status
+from rest_framework.test import APIClient
+from rest_framework_simplejwt.tokens import RefreshToken
+
+from auth_app.api.denylist import deny_token, is_denied
+
+
+@pytest.fixture(autouse=True)
+def shared_cache(locmem_cache):
+    """Back the denylist with a real cache in every test."""
+
+
+@pytest.fixture
+def user(db):
+    """Create an active user for testing."""
+    return User.objects.create_user(
+        username='testuser@example.com',
+        email='testuser@example.com',
+        password='SecurePass123!',
+        is_active=True
+    )
+
+
+@pytest.fixture
+def logged_in_client(user):
+    """Create a client holding login cookies."""
+    client = APIClient()
+    client.post('/api/login/', {
+        'email': 'testuser@example.com',
+        'password': 'SecurePass123!'
+    })
+    return client
+
+
+@pytest.mark.django_db
+class TestDenylist:
+    """Test suite for the Redis-backed refresh token denylist."""
+
+    def test_deny_token(self, user):
+        """Test that denied tokens are recognised by jti."""
+        token = RefreshToken.for_user(user)
+
+        deny_token(token)
+
+        assert is_denied(token)
+        assert not is_denied(RefreshToken.for_user(user))
+
+    def test_ttl_is_remaining_lifetime(self, user):
+        """Test that entries expire together with the token."""
+        token = RefreshToken.for_user(user)
+
+        with patch('auth_app.api.denylist.cache') as mock_cache:
+            deny_token(token)
+
+        timeout = mock_cache.set.call_args.kwargs['timeout']
+        assert abs(timeout - (token['exp'] - time.time())) <= 2
+
+    def test_expired_token_not_stored(self, user):
+        """Test that expired tokens are not stored at all."""
+        token = RefreshToken.for_user(user)
+        token['exp'] = int(time.time()) - 10
+
+        with patch('auth_app.api.denylist.cache') as mock_cache:
+            deny_token(token)
+
+        mock_cache.set.assert_not_called()
+
+
+@pytest.mark.django_db
+class TestLogoutDenylist:
+    """Test suite for denying refresh tokens on logout."""
+
+    def test_refresh_after_logout_fails(self, logged_in_client):
+        """Test that the refresh token cannot be used after logout."""
+        refresh_token = logged_in_client.cookies['refresh_token'].value
+
+        logged_in_client.post('/api/logout/')
+        response = APIClient().post(
+            '/api/token/refresh/', {'refresh': refresh_token})
+
+        assert response.status_code == status.HTTP_401_UNAUTHORIZED
+
+    def test_logout_with_invalid_cookie(self, api_client):
+        """Test that malformed refresh cookies do not break logout."""
+        api_client.cookies['refresh_token'] = 'not-a-token'
+
+        response = api_client.post('/api/logout/')
+
+        assert response.status_code == status.HTTP_200_OK
+
+
+@pytest.mark.django_db
+class TestRefreshRotation:
+    """Test suite for refresh token rotation."""
+
+    @pytest.fixture(autouse=True)
+    def rotate(self):
+        # simplejwt binds api_settings at import, so override_settings
+        # does not reach the serializer.
+        with patch('rest_framework_simplejwt.serializers.api_settings.'
+                   'ROTATE_REFRESH_TOKENS', True):
+            yield
+
+    def test_rotation_issues_new_refresh_cookie(self, logged_in_client):
+        """Test that refreshing replaces the refresh token cookie."""
+        old_token = logged_in_client.cookies['refresh_token'].value
+
+        response = logged_in_client.post('/api/token/refresh/')
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.cookies['refresh_token'].value != old_token
+
+    def test_old_token_denied_after_rotation(self, logged_in_client):
+        """Test that a rotated refresh token cannot be reused."""
+        old_token = logged_in_client.cookies['refresh_token'].value
+        logged_in_client.post('/api/token/refresh/')
+
+        response = APIClient().post('/api/token/refresh/', {'refresh': old_token})
+
+        assert response.status_code == status.HTTP_401_UNAUTHORIZED
+
+    def test_rotated_token_works(self, logged_in_client):
+        """Test that the new refresh token can be used."""
+        logged_in_client.post('/api/token/refresh/')
+
+        response = logged_in_client.post('/api/token/refresh/')
+
+        assert response.status_code == status.HTTP_200_OK
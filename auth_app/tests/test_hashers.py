@@ -0,0 +1,92 @@
+import pytest
+from io import StringIO
+from django.contrib.auth.hashers import get_hasher, identify_hasher, make_password
+from django.contrib.auth.models import User
+from django.core.management import call_command
+
+from rest_framework import status
+
+from auth_app.hashers import TunableArgon2PasswordHasher
+
+
+@pytest.fixture
+def cheap_argon2(settings):
+    """Use small Argon2 costs to keep the tests fast."""
+    settings.ARGON2_TIME_COST = 1
+    settings.ARGON2_MEMORY_COST = 1024
+    settings.ARGON2_PARALLELISM = 1
+    return settings
+
+
+class TestTunableArgon2PasswordHasher:
+    """Test suite for the settings-driven Argon2 hasher."""
+
+    def test_is_default_hasher(self):
+        """Test that new passwords are hashed with Argon2."""
+        assert isinstance(get_hasher('default'), TunableArgon2PasswordHasher)
+
+    def test_uses_configured_costs(self, cheap_argon2):
+        """Test that hashes carry the ARGON2_* parameters."""
+        hasher = TunableArgon2PasswordHasher()
+        encoded = hasher.encode('secret', hasher.salt())
+
+        decoded = hasher.decode(encoded)
+        assert decoded['time_cost'] == 1
+        assert decoded['memory_cost'] == 1024
+        assert decoded['parallelism'] == 1
+        assert hasher.verify('secret', encoded)
+
+    def test_must_update_after_cost_change(self, cheap_argon2):
+        """Test that changed costs mark stored hashes for rehashing."""
+        hasher = TunableArgon2PasswordHasher()
+        encoded = hasher.encode('secret', hasher.salt())
+        assert not hasher.must_update(encoded)
+
+        cheap_argon2.ARGON2_TIME_COST = 2
+
+        assert hasher.must_update(encoded)
+
+
+@pytest.mark.django_db
+class TestRehashOnLogin:
+    """Test suite for transparent password upgrades on login."""
+
+    def test_pbkdf2_hash_upgraded(self, api_client, cheap_argon2):
+        """Test that a PBKDF2 hash is replaced by Argon2 on login."""
+        user = User.objects.create(
+            username='testuser@example.com',
+            email='testuser@example.com',
+            password=make_password('SecurePass123!', hasher='pbkdf2_sha256'),
+            is_active=True
+        )
+
+        response = api_client.post('/api/login/', {
+            'email': 'testuser@example.com',
+            'password': 'SecurePass123!'
+        })
+
+        assert response.status_code == status.HTTP_200_OK
+        user.refresh_from_db()
+        assert identify_hasher(user.password).algorithm == 'argon2'
+        assert user.check_password('SecurePass123!')
+
+
+class TestBenchmarkPasswordHashers:
+    """Test suite for the benchmark_password_hashers command."""
+
+    def test_reports_each_hasher_and_scale(self, cheap_argon2):
+        """Test that every configured hasher is measured per scale."""
+        cheap_argon2.PASSWORD_HASHERS = [
+            'auth_app.hashers.TunableArgon2PasswordHasher',
+            'django.contrib.auth.hashers.PBKDF2PasswordHasher',
+        ]
+        out = StringIO()
+
+        call_command('benchmark_password_hashers', scales='0.001,0.002',
+                     iterations=1, threads=1, stdout=out)
+
+        lines = out.getvalue().splitlines()[1:]
+        assert len(lines) == 4
+        assert lines[0].startswith('argon2')
+        assert 'iterations=1000 ' in lines[2]
+        assert all('verifies/s' in line for line in lines)
@@ -0,0 +1,146 @@
+import pytest
+from datetime import timedelta
+from importlib import import_module
+from io import StringIO
+from unittest.mock import patch
+from django.apps import apps
+from django.contrib.auth.models import User
+from django.contrib.auth.tokens import default_token_generator
+from django.core.management import call_command
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from auth_app.tasks import purge_unactivated_users
+
+
+def create_user(email, days_old, is_active=False, last_login=None):
+    user = User.objects.create_user(
+        username=email, email=email, password='!', is_active=is_active)
+    User.objects.filter(pk=user.pk).update(
+        date_joined=timezone.now() - timedelta(days=days_old),
+        last_login=last_login)
+    return user
+
+
+@pytest.mark.django_db
+class TestPurgeUnactivatedUsers:
+    """Test suite for deleting abandoned registrations."""
+
+    def test_deletes_expired_registrations(self):
+        """Test that only old, never activated users are deleted."""
+        for i in range(3):
+            create_user(f'old{i}@example.com', days_old=2)
+        recent = create_user('recent@example.com', days_old=0)
+        active = create_user('active@example.com', days_old=5, is_active=True)
+        deactivated = create_user(
+            'deactivated@example.com', days_old=5,
+            last_login=timezone.now() - timedelta(days=4))
+
+        metrics = purge_unactivated_users()
+
+        assert metrics['deleted'] == 3
+        assert set(User.objects.values_list('pk', flat=True)) == {
+            recent.pk, active.pk, deactivated.pk}
+
+    def test_keeps_deactivated_after_login(self):
+        """Test that a user who logged in via JWT and was then deactivated is kept."""
+        user = User.objects.create_user(
+            username='member@example.com', email='member@example.com',
+            password='SecurePass123!', is_active=True)
+        response = APIClient().post('/api/login/', {
+            'email': 'member@example.com', 'password': 'SecurePass123!'})
+        assert response.status_code == 200
+        User.objects.filter(pk=user.pk).update(
+            is_active=False,
+            date_joined=timezone.now() - timedelta(days=30))
+
+        assert purge_unactivated_users()['deleted'] == 0
+        assert User.objects.filter(pk=user.pk).exists()
+
+    def test_keeps_deactivated_after_activation(self):
+        """Test that activating records the account as activated."""
+        user = create_user('new@example.com', days_old=0)
+        token = default_token_generator.make_token(user)
+        response = APIClient().get(f'/api/activate/{user.pk}/{token}/')
+        assert response.status_code == 200
+        User.objects.filter(pk=user.pk).update(
+            is_active=False,
+            date_joined=timezone.now() - timedelta(days=30))
+
+        assert purge_unactivated_users()['deleted'] == 0
+
+    def test_backfill_keeps_existing_deactivated_users(self):
+        """Test that users existing before the backfill are never purged."""
+        legacy = create_user('legacy@example.com', days_old=30)
+        migration = import_module('auth_app.migrations.0002_backfill_last_login')
+
+        migration.backfill_last_login(apps, None)
+
+        assert purge_unactivated_users()['deleted'] == 0
+        assert User.objects.get(pk=legacy.pk).last_login is not None
+
+    def test_uses_password_reset_timeout(self, settings):
+        """Test that the cutoff follows PASSWORD_RESET_TIMEOUT."""
+        settings.PASSWORD_RESET_TIMEOUT = 3 * 86400
+        create_user('two@example.com', days_old=2)
+        create_user('four@example.com', days_old=4)
+
+        assert purge_unactivated_users()['deleted'] == 1
+        assert User.objects.filter(email='two@example.com').exists()
+
+    def test_batches(self):
+        """Test that rows are deleted in batches of bounded size."""
+        for i in range(5):
+            create_user(f'old{i}@example.com', days_old=2)
+
+        metrics = purge_unactivated_users(batch_size=2)
+
+        assert metrics['deleted'] == 5
+        assert metrics['batches'] == 3
+        assert not User.objects.exists()
+
+    def test_nothing_to_delete(self):
+        """Test the metrics when no user qualifies."""
+        metrics = purge_unactivated_users()
+
+        assert metrics['deleted'] == 0
+        assert metrics['batches'] == 0
+
+
+@pytest.mark.django_db
+class TestPurgeCommand:
+    """Test suite for the purge_unactivated_users command."""
+
+    def test_runs_inline(self):
+        """Test that the command reports the deleted rows."""
+        create_user('old@example.com', days_old=2)
+        out = StringIO()
+
+        call_command('purge_unactivated_users', stdout=out)
+
+        assert 'Deleted 1 unactivated users in 1 batches' in out.getvalue()
+
+    @patch('auth_app.management.commands.purge_unactivated_users.django_rq')
+    def test_enqueue(self, mock_django_rq):
+        """Test that --enqueue runs the purge as RQ job."""
+        out = StringIO()
+
+        call_command('purge_unactivated_users', '--enqueue',
+                     '--batch-size', '100', stdout=out)
+
+        queue = mock_django_rq.get_queue.return_value
+        queue.enqueue.assert_called_once_with(purge_unactivated_users, 100)
+        assert 'Enqueued purge job' in out.getvalue()
+
+    def test_dry_run(self):
+        """Test that --dry-run lists the users without deleting them."""
+        old = create_user('old@example.com', days_old=2)
+        create_user('recent@example.com', days_old=0)
+        out = StringIO()
+
+        call_command('purge_unactivated_users', '--dry-run', stdout=out)
+
+        assert f'{old.pk}\told@example.com' in out.getvalue()
+        assert 'recent@example.com' not in out.getvalue()
+        assert 'Would delete 1 unactivated users.' in out.getvalue()
+        assert User.objects.count() == 2
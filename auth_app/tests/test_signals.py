@@ -69,10 +69,10 @@ class TestUserRegisteredSignal:
         html_content = email.alternatives[0][0]
         assert 'activate.html' in html_content or 'uid=' in html_content
 
-    @patch('auth_app.api.signals.send_mail')
-    def test_activation_email_failure_handling(self, mock_send_mail, user):
+    @patch('auth_app.api.signals.send_email')
+    def test_activation_email_failure_handling(self, mock_send_email, user):
         """Test handling of email sending failure."""
-        mock_send_mail.side_effect = Exception('SMTP error')
+        mock_send_email.side_effect = Exception('SMTP error')
         token = default_token_generator.make_token(user)
 
         # Signal should raise exception if email fails
@@ -145,10 +145,10 @@ class TestPasswordResetRequestedSignal:
         html_content = email.alternatives[0][0]
         assert 'confirm_password.html' in html_content or 'uid=' in html_content
 
-    @patch('auth_app.api.signals.send_mail')
-    def test_password_reset_email_failure_handling(self, mock_send_mail, user):
+    @patch('auth_app.api.signals.send_email')
+    def test_password_reset_email_failure_handling(self, mock_send_email, user):
         """Test handling of password reset email failure."""
-        mock_send_mail.side_effect = Exception('SMTP error')
+        mock_send_email.side_effect = Exception('SMTP error')
         token = default_token_generator.make_token(user)
 
         # Signal should raise exception if email fails
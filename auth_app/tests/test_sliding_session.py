@@ -0,0 +1,110 @@
+import pytest
+from datetime import timedelta
+from django.contrib.auth.models import User
+
+from rest_framework.test import APIClient
+from rest_framework_simplejwt.tokens import AccessToken, RefreshToken
+
+from auth_app.api.denylist import deny_token
+
+
+@pytest.fixture(autouse=True)
+def sliding_session(settings, locmem_cache):
+    """Enable renewal with a real cache in every test."""
+    settings.ACCESS_TOKEN_RENEW_BEFORE = 300
+
+
+@pytest.fixture
+def user(db):
+    """Create an active user for testing."""
+    return User.objects.create_user(
+        username='testuser@example.com',
+        email='testuser@example.com',
+        password='SecurePass123!',
+        is_active=True
+    )
+
+
+def make_client(user, access_seconds, refresh=None):
+    """Return a client with cookies of an access token expiring soon."""
+    refresh = refresh or RefreshToken.for_user(user)
+    access = refresh.access_token
+    access.set_exp(lifetime=timedelta(seconds=access_seconds))
+    client = APIClient()
+    client.cookies['access_token'] = str(access)
+    client.cookies['refresh_token'] = str(refresh)
+    return client
+
+
+@pytest.mark.django_db
+class TestSlidingSession:
+    """Test suite for transparent access token renewal."""
+
+    def test_renews_token_close_to_expiry(self, user):
+        """Test that a nearly expired access token is replaced."""
+        client = make_client(user, access_seconds=60)
+
+        response = client.get('/api/video/')
+
+        assert response.status_code == 200
+        renewed = AccessToken(response.cookies['access_token'].value)
+        assert renewed['user_id'] == str(user.id)
+        assert response.cookies['access_token']['httponly']
+
+    def test_fresh_token_not_renewed(self, user):
+        """Test that tokens with enough lifetime left are kept."""
+        client = make_client(user, access_seconds=600)
+
+        response = client.get('/api/video/')
+
+        assert 'access_token' not in response.cookies
+
+    def test_renewed_once_per_token(self, user):
+        """Test that parallel requests with one token renew it once."""
+        client = make_client(user, access_seconds=60)
+
+        first = client.get('/api/video/')
+        client.cookies['access_token'] = first.wsgi_request.COOKIES[
+            'access_token']
+        second = client.get('/api/video/')
+
+        assert 'access_token' in first.cookies
+        assert 'access_token' not in second.cookies
+
+    def test_unauthenticated_not_renewed(self, user):
+        """Test that failed requests never get a new token."""
+        client = make_client(user, access_seconds=60)
+        client.cookies['access_token'] = 'invalid'
+
+        response = client.get('/api/video/')
+
+        assert response.status_code == 401
+        assert 'access_token' not in response.cookies
+
+    def test_denied_refresh_token(self, user):
+        """Test that logged out sessions are not extended."""
+        refresh = RefreshToken.for_user(user)
+        deny_token(refresh)
+        client = make_client(user, access_seconds=60, refresh=refresh)
+
+        response = client.get('/api/video/')
+
+        assert 'access_token' not in response.cookies
+
+    def test_missing_refresh_token(self, user):
+        """Test that sessions without refresh cookie are not extended."""
+        client = make_client(user, access_seconds=60)
+        del client.cookies['refresh_token']
+
+        response = client.get('/api/video/')
+
+        assert 'access_token' not in response.cookies
+
+    def test_disabled(self, user, settings):
+        """Test that ACCESS_TOKEN_RENEW_BEFORE=0 turns renewal off."""
+        settings.ACCESS_TOKEN_RENEW_BEFORE = 0
+        client = make_client(user, access_seconds=60)
+
+        response = client.get('/api/video/')
+
+        assert 'access_token' not in response.cookies
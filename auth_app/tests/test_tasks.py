@@ -0,0 +1,94 @@
+import pytest
+import smtplib
+from django.core import mail
+from unittest.mock import MagicMock, patch
+
+from auth_app.api.signals import queue_email
+from auth_app.tasks import send_email
+
+
+MESSAGE = {
+    'subject': 'Hello',
+    'message': 'Plain text body',
+    'recipient_list': ['testuser@example.com'],
+    'html_message': '<p>HTML body</p>',
+}
+
+
+class TestSendEmail:
+    """Test suite for the send_email task."""
+
+    def test_sends_multipart_email(self):
+        """Test that text and HTML parts are sent."""
+        send_email(**MESSAGE)
+
+        assert len(mail.outbox) == 1
+        assert mail.outbox[0].subject == 'Hello'
+        assert mail.outbox[0].to == ['testuser@example.com']
+        assert mail.outbox[0].alternatives[0][0] == '<p>HTML body</p>'
+
+    def test_reuses_connection(self):
+        """Test that consecutive emails share one SMTP connection."""
+        connection = MagicMock()
+        with patch('auth_app.tasks.get_connection',
+                   return_value=connection) as mock_get_connection:
+            send_email(**MESSAGE)
+            send_email(**MESSAGE)
+
+        mock_get_connection.assert_called_once()
+        connection.open.assert_called_once()
+        assert connection.send_messages.call_count == 2
+
+    def test_reconnects_after_disconnect(self):
+        """Test that a connection dropped by the server is reopened once."""
+        stale, fresh = MagicMock(), MagicMock()
+        stale.send_messages.side_effect = smtplib.SMTPServerDisconnected()
+        with patch('auth_app.tasks.get_connection',
+                   side_effect=[stale, fresh]):
+            send_email(**MESSAGE)
+
+        stale.close.assert_called_once()
+        fresh.send_messages.assert_called_once()
+
+    def test_error_closes_connection_and_raises(self):
+        """Test that failures propagate so RQ can retry the job."""
+        broken, fresh = MagicMock(), MagicMock()
+        broken.send_messages.side_effect = smtplib.SMTPDataError(451, 'busy')
+        with patch('auth_app.tasks.get_connection',
+                   side_effect=[broken, fresh]):
+            with pytest.raises(smtplib.SMTPDataError):
+                send_email(**MESSAGE)
+            send_email(**MESSAGE)
+
+        broken.close.assert_called_once()
+        fresh.send_messages.assert_called_once()
+
+
+class TestQueueEmail:
+    """Test suite for queueing emails on the RQ email queue."""
+
+    def test_sends_inline_when_sync(self, settings):
+        """Test that emails are sent directly without EMAIL_ASYNC."""
+        settings.EMAIL_ASYNC = False
+
+        queue_email(**MESSAGE)
+
+        assert len(mail.outbox) == 1
+
+    @patch('auth_app.api.signals.django_rq')
+    def test_enqueues_with_retry(self, mock_django_rq, settings):
+        """Test that emails are enqueued with backoff retries."""
+        settings.EMAIL_ASYNC = True
+        settings.EMAIL_RETRY_INTERVALS = [10, 60]
+        queue = mock_django_rq.get_queue.return_value
+
+        queue_email(**MESSAGE)
+
+        mock_django_rq.get_queue.assert_called_once_with(
+            'email', autocommit=True)
+        args, kwargs = queue.enqueue.call_args
+        assert args == (send_email,)
+        assert kwargs['retry'].max == 2
+        assert kwargs['retry'].intervals == [10, 60]
+        assert kwargs['subject'] == 'Hello'
+        assert len(mail.outbox) == 0
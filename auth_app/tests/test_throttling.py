@@ -0,0 +1,185 @@
+import pytest
+from unittest.mock import MagicMock, patch
+from django.contrib.auth.models import User
+
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from auth_app.api.throttling import SlidingWindowThrottle
+
+
+RATES = {
+    'login_ip': '5/min',
+    'login_email': '2/min',
+    'register_ip': '2/min',
+    'password_reset_email': '1/min',
+}
+
+
+@pytest.fixture(autouse=True)
+def throttle_rates():
+    # DRF binds THROTTLE_RATES at import, so settings overrides miss it.
+    with patch.object(SlidingWindowThrottle, 'THROTTLE_RATES', RATES):
+        yield
+
+
+@pytest.fixture
+def user(db):
+    """Create an active user for testing."""
+    return User.objects.create_user(
+        username='testuser@example.com',
+        email='testuser@example.com',
+        password='SecurePass123!',
+        is_active=True
+    )
+
+
+def login(client, email, password='WrongPass123!', ip='10.0.0.1', **extra):
+    return client.post('/api/login/', {'email': email, 'password': password},
+                       REMOTE_ADDR=ip, **extra)
+
+
+@pytest.mark.django_db
+class TestCacheFallback:
+    """Test suite for throttling through the Django cache without Redis."""
+
+    def test_login_limited_per_email(self, locmem_cache, user):
+        """Test that the email budget applies across client IPs."""
+        client = APIClient()
+        login(client, 'testuser@example.com', ip='10.0.0.1')
+        login(client, 'TESTUSER@example.com', ip='10.0.0.2')
+
+        response = login(client, 'testuser@example.com', ip='10.0.0.3')
+
+        assert response.status_code == status.HTTP_429_TOO_MANY_REQUESTS
+        assert 'Retry-After' in response
+
+    def test_login_limited_per_ip(self, locmem_cache, user):
+        """Test that the IP budget applies across emails."""
+        client = APIClient()
+        for i in range(5):
+            login(client, f'user{i}@example.com')
+
+        response = login(client, 'other@example.com')
+
+        assert response.status_code == status.HTTP_429_TOO_MANY_REQUESTS
+        assert login(client, 'other@example.com',
+                     ip='10.0.0.2').status_code != 429
+
+    def test_spoofed_forwarded_for_ignored(self, locmem_cache, user):
+        """Test that made-up X-Forwarded-For addresses share one IP bucket."""
+        client = APIClient()
+        for i in range(5):
+            login(client, f'user{i}@example.com',
+                  HTTP_X_FORWARDED_FOR=f'203.0.113.{i}')
+
+        response = login(client, 'other@example.com',
+                         HTTP_X_FORWARDED_FOR='203.0.113.99')
+
+        assert response.status_code == status.HTTP_429_TOO_MANY_REQUESTS
+
+    def test_forwarded_for_behind_proxy(self, locmem_cache, user, settings):
+        """Test that the proxy-appended address is the identity with NUM_PROXIES=1."""
+        settings.REST_FRAMEWORK = {**settings.REST_FRAMEWORK, 'NUM_PROXIES': 1}
+        client = APIClient()
+        for i in range(5):
+            login(client, f'user{i}@example.com',
+                  HTTP_X_FORWARDED_FOR='spoofed, 198.51.100.1')
+
+        blocked = login(client, 'other@example.com',
+                        HTTP_X_FORWARDED_FOR='198.51.100.1')
+        other = login(client, 'other@example.com',
+                      HTTP_X_FORWARDED_FOR='198.51.100.2')
+
+        assert blocked.status_code == status.HTTP_429_TOO_MANY_REQUESTS
+        assert other.status_code != status.HTTP_429_TOO_MANY_REQUESTS
+
+    def test_throttled_before_password_check(self, locmem_cache, user):
+        """Test that throttled logins never reach password hashing."""
+        client = APIClient()
+        login(client, 'testuser@example.com')
+        login(client, 'testuser@example.com')
+
+        with patch('auth_app.api.serializers.get_user_by_email') as lookup:
+            response = login(client, 'testuser@example.com',
+                             password='SecurePass123!')
+
+        assert response.status_code == status.HTTP_429_TOO_MANY_REQUESTS
+        lookup.assert_not_called()
+
+    def test_password_reset_limited_per_email(self, locmem_cache, user):
+        """Test that reset emails are limited per address."""
+        client = APIClient()
+        data = {'email': 'testuser@example.com'}
+        assert client.post('/api/password_reset/', data).status_code == 200
+
+        response = client.post('/api/password_reset/', data)
+
+        assert response.status_code == status.HTTP_429_TOO_MANY_REQUESTS
+
+    def test_register_limited_per_ip(self, locmem_cache):
+        """Test that registrations are limited per IP."""
+        client = APIClient()
+        for _ in range(2):
+            client.post('/api/register/', {'email': 'invalid'})
+
+        response = client.post('/api/register/', {'email': 'invalid'})
+
+        assert response.status_code == status.HTTP_429_TOO_MANY_REQUESTS
+
+    def test_unconfigured_scope_not_throttled(self, locmem_cache):
+        """Test that scopes without a rate are not limited."""
+        client = APIClient()
+        for _ in range(3):
+            response = client.post('/api/password_reset/', {'email': ''})
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+
+@pytest.mark.django_db
+class TestRedisSlidingWindow:
+    """Test suite for the Redis Lua sliding window."""
+
+    def _redis(self, result):
+        redis = MagicMock()
+        redis.register_script.return_value.return_value = result
+        return redis
+
+    def test_allowed(self, user):
+        """Test that allowed requests pass with one script call each."""
+        redis = self._redis([1, 0])
+
+        with patch('auth_app.api.throttling.get_redis', return_value=redis):
+            response = login(APIClient(), 'testuser@example.com',
+                             password='SecurePass123!')
+
+        assert response.status_code == status.HTTP_200_OK
+        script = redis.register_script.return_value
+        assert script.call_count == 2
+        keys = [call.kwargs['keys'][0] for call in script.call_args_list]
+        assert keys[0] == 'throttle:login_ip:10.0.0.1'
+        assert keys[1].startswith('throttle:login_email:')
+        assert 'testuser' not in keys[1]
+        now, window, limit, _member = script.call_args_list[1].kwargs['args']
+        assert (window, limit) == (60000, 2)
+
+    def test_denied_sets_retry_after(self, user):
+        """Test that denied requests report the remaining window."""
+        redis = self._redis([0, 12500])
+
+        with patch('auth_app.api.throttling.get_redis', return_value=redis):
+            response = login(APIClient(), 'testuser@example.com')
+
+        assert response.status_code == status.HTTP_429_TOO_MANY_REQUESTS
+        assert response['Retry-After'] == '13'
+
+    def test_redis_error_fails_open(self, user):
+        """Test that Redis errors do not block logins."""
+        redis = MagicMock()
+        redis.register_script.return_value.side_effect = ConnectionError()
+
+        with patch('auth_app.api.throttling.get_redis', return_value=redis):
+            response = login(APIClient(), 'testuser@example.com',
+                             password='SecurePass123!')
+
+        assert response.status_code == status.HTTP_200_OK
@@ -0,0 +1,172 @@
+import pytest
+from importlib import import_module
+from io import StringIO
+from unittest.mock import MagicMock, patch
+from django.contrib.auth.models import User
+from django.core import mail
+from django.core.management import call_command
+from django.db import IntegrityError, connection
+from django.test.utils import CaptureQueriesContext
+
+from rest_framework import serializers, status
+
+from auth_app.api.serializers import RegistrationSerializer
+from auth_app.api.users import get_user_by_email, users_with_email
+
+
+@pytest.fixture
+def user(db):
+    """Create an active user with a mixed-case email."""
+    return User.objects.create_user(
+        username='TestUser@Example.com',
+        email='TestUser@Example.com',
+        password='SecurePass123!',
+        is_active=True
+    )
+
+
+@pytest.mark.django_db
+class TestEmailLookup:
+    """Test suite for case-insensitive email lookups."""
+
+    def test_matches_any_case(self, user):
+        """Test that lookups ignore the letter case."""
+        assert get_user_by_email('testuser@example.com') == user
+        assert get_user_by_email('TESTUSER@EXAMPLE.COM') == user
+
+    def test_unknown_email(self, user):
+        """Test that unknown or empty emails return None."""
+        assert get_user_by_email('other@example.com') is None
+        assert get_user_by_email('') is None
+
+    def test_filters_on_lower(self, user):
+        """Test that the query compares LOWER(email) for the index."""
+        sql = str(users_with_email('a@example.com').query).upper()
+        assert 'LOWER("AUTH_USER"."EMAIL")' in sql
+
+    def test_matches_partial_index_predicate(self, user):
+        """Test that the query excludes empty emails like the partial index."""
+        sql, params = users_with_email('a@example.com').query.sql_with_params()
+        assert 'NOT ("auth_user"."email" = %s)' in sql
+        assert '' in params
+
+    def test_single_query(self, user, django_assert_num_queries):
+        """Test that a lookup costs one query."""
+        with django_assert_num_queries(1):
+            get_user_by_email('testuser@example.com')
+
+
+@pytest.mark.django_db
+class TestCaseInsensitiveEndpoints:
+    """Test suite for login, reset and registration with mixed case."""
+
+    def test_login_other_case(self, api_client, user):
+        """Test that login accepts the email in another case."""
+        response = api_client.post('/api/login/', {
+            'email': 'testuser@example.com',
+            'password': 'SecurePass123!'
+        })
+
+        assert response.status_code == status.HTTP_200_OK
+
+    def test_password_reset_other_case(self, api_client, user):
+        """Test that reset emails are sent for another case."""
+        response = api_client.post(
+            '/api/password_reset/', {'email': 'TESTUSER@example.com'})
+
+        assert response.status_code == status.HTTP_200_OK
+        assert len(mail.outbox) == 1
+        assert mail.outbox[0].to == [user.email]
+
+    def test_register_duplicate_other_case(self, api_client, user):
+        """Test that an email taken in another case is rejected."""
+        response = api_client.post('/api/register/', {
+            'email': 'testuser@example.com',
+            'password': 'SecurePass123!',
+            'confirmed_password': 'SecurePass123!'
+        })
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert response.data['email'] == [
+            'Please check your entries and try again.']
+
+    def test_register_race(self, db):
+        """Test that a unique index violation becomes a validation error."""
+        serializer = RegistrationSerializer(data={
+            'email': 'new@example.com',
+            'password': 'SecurePass123!',
+            'confirmed_password': 'SecurePass123!'
+        })
+        assert serializer.is_valid()
+
+        with patch.object(User.objects, 'create_user',
+                          side_effect=IntegrityError()):
+            with pytest.raises(serializers.ValidationError) as exc_info:
+                serializer.save()
+
+        assert exc_info.value.detail['email'] == [
+            'Please check your entries and try again.']
+
+
+@pytest.mark.django_db
+class TestBenchmarkEmailLookup:
+    """Test suite for the benchmark_email_lookup command."""
+
+    def test_leaves_database_unchanged(self, user):
+        """Test that the synthetic users are rolled back."""
+        out = StringIO()
+
+        call_command('benchmark_email_lookup', users=50,
+                     iterations=2, stdout=out)
+
+        assert 'ms/lookup' in out.getvalue()
+        assert User.objects.count() == 1
+
+    def test_every_iteration_queries(self, user):
+        """Test that each timed lookup runs its own query."""
+        with CaptureQueriesContext(connection) as queries:
+            call_command('benchmark_email_lookup', users=10,
+                         iterations=3, stdout=StringIO())
+
+        sql = [query['sql'] for query in queries]
+        assert sum('LOWER("auth_user"."email") =' in q for q in sql) == 3
+        assert sum('LIKE' in q for q in sql) == 3
+
+
+class TestEmailIndexMigration:
+    """Test suite for the LOWER(email) index migration on PostgreSQL."""
+
+    migration = import_module('auth_app.migrations.0001_user_email_lower_index')
+
+    def _schema_editor(self, duplicates):
+        schema_editor = MagicMock()
+        schema_editor.connection.vendor = 'postgresql'
+        cursor = schema_editor.connection.cursor.return_value.__enter__.return_value
+        cursor.fetchall.return_value = duplicates
+        return schema_editor
+
+    def test_index_built_concurrently(self):
+        """Test that the index is created outside a transaction."""
+        schema_editor = self._schema_editor([])
+        forward = self.migration.Migration.operations[0].code
+
+        forward(None, schema_editor)
+
+        assert self.migration.Migration.atomic is False
+        statements = [c.args[0] for c in schema_editor.execute.call_args_list]
+        assert 'CREATE UNIQUE INDEX CONCURRENTLY' in statements[-1]
+
+    def test_duplicates_reported(self):
+        """Test that case-insensitive duplicates abort before the index build."""
+        schema_editor = self._schema_editor([
+            ('a@example.com', [1, 7]),
+            ('b@example.com', [3, 4, 9]),
+        ])
+        forward = self.migration.Migration.operations[0].code
+
+        with pytest.raises(RuntimeError) as excinfo:
+            forward(None, schema_editor)
+
+        assert '2 emails' in str(excinfo.value)
+        assert 'b@example.com: user ids 3, 4, 9' in str(excinfo.value)
+        schema_editor.execute.assert_not_called()
@@ -34,5 +34,6 @@ else:
 EOF
 # Worker wird gestartet
 python manage.py rqworker default &
+python manage.py rqworker email --worker-class rq.worker.SimpleWorker --with-scheduler &
 # --reload für schnelle Codeänderungen während der Entwicklung
 exec gunicorn core.wsgi:application --bind 0.0.0.0:8000 --reload
\ No newline at end of file
@@ -32,7 +32,15 @@ if not User.objects.filter(username=username).exists():
 else:
     print(f"Superuser '{username}' already exists.")
 EOF
+# Prewarm popular segments after deploy (runs in the worker container)
+python manage.py prewarm_segments --enqueue || true
+
 # Worker wurde hier entfernt, der wurde in der docker-compose.prod.yml definiert
 echo "Production mode - starting Gunicorn without --reload"
 # kein --reload in der Produktion
+if [ "$ASYNC_STREAMING" = "True" ]; then
+    # ASGI mode: uvicorn workers serve the async HLS views
+    exec gunicorn core.asgi:application --bind 0.0.0.0:8000 \
+        -k uvicorn_worker.UvicornWorker --workers "${GUNICORN_WORKERS:-4}"
+fi
 exec gunicorn core.wsgi:application --bind 0.0.0.0:8000
\ No newline at end of file
@@ -39,5 +39,6 @@ else:
 EOF
 
 python manage.py rqworker default &
+python manage.py rqworker email --worker-class rq.worker.SimpleWorker --with-scheduler &
 
 exec gunicorn core.wsgi:application --bind 0.0.0.0:8000 --reload
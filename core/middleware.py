@@ -0,0 +1,55 @@
+from django.conf import settings
+from django.contrib.auth.middleware import AuthenticationMiddleware
+from django.contrib.messages.middleware import MessageMiddleware
+from django.contrib.sessions.middleware import SessionMiddleware
+from django.middleware.clickjacking import XFrameOptionsMiddleware
+from django.middleware.csrf import CsrfViewMiddleware
+
+
+def is_fast_path(path):
+    """
+    Return True if path belongs to an API_FAST_PATH_PREFIXES route.
+    """
+    return path.startswith(settings.API_FAST_PATH_PREFIXES)
+
+
+class FastPathMixin:
+    """
+    Skips a middleware for API_FAST_PATH_PREFIXES routes.
+
+    These routes are token-authenticated DRF views: they never read the
+    session, messages or request.user set by Django (DRF authenticates
+    itself), are exempt from CSRF and are not rendered in frames.
+    Works for sync and async request handling alike.
+    """
+
+    def __call__(self, request):
+        if is_fast_path(request.path_info):
+            return self.get_response(request)
+        return super().__call__(request)
+
+
+class FastPathSessionMiddleware(FastPathMixin, SessionMiddleware):
+    pass
+
+
+class FastPathCsrfViewMiddleware(FastPathMixin, CsrfViewMiddleware):
+
+    def process_view(self, request, callback, callback_args, callback_kwargs):
+        # Django calls process_view outside __call__.
+        if is_fast_path(request.path_info):
+            return None
+        return super().process_view(
+            request, callback, callback_args, callback_kwargs)
+
+
+class FastPathAuthenticationMiddleware(FastPathMixin, AuthenticationMiddleware):
+    pass
+
+
+class FastPathMessageMiddleware(FastPathMixin, MessageMiddleware):
+    pass
+
+
+class FastPathXFrameOptionsMiddleware(FastPathMixin, XFrameOptionsMiddleware):
+    pass
@@ -0,0 +1,10 @@
+def get_redis():
+    """
+    Return the raw Redis connection behind the default django-redis cache,
+    or None if the cache backend is not Redis (e.g. in tests).
+    """
+    try:
+        from django_redis import get_redis_connection
+        return get_redis_connection('default')
+    except Exception:
+        return None
@@ -0,0 +1,61 @@
+import msgpack
+import orjson
+from django.utils.http import parse_header_parameters
+from rest_framework.renderers import BaseRenderer
+from rest_framework.utils.encoders import JSONEncoder
+
+
+class PreRendered(bytes):
+    """
+    Response body already encoded in the negotiated format.
+    Renderers return it unchanged, e.g. for cached payloads.
+    """
+
+
+# Fallback for types the encoders do not know (lazy strings, Decimal, ...).
+_encoder = JSONEncoder()
+
+
+class ORJSONRenderer(BaseRenderer):
+    """
+    JSON renderer using orjson, a drop-in for DRF's JSONRenderer.
+    """
+    media_type = 'application/json'
+    format = 'json'
+    charset = None
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b''
+        if isinstance(data, PreRendered):
+            return data
+
+        option = orjson.OPT_NON_STR_KEYS
+        if self.get_indent(accepted_media_type, renderer_context):
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(data, default=_encoder.default, option=option)
+
+    def get_indent(self, accepted_media_type, renderer_context):
+        # orjson only supports an indent of two spaces.
+        if accepted_media_type:
+            _, params = parse_header_parameters(accepted_media_type)
+            if params.get('indent', '0') not in ('', '0'):
+                return True
+        return bool((renderer_context or {}).get('indent'))
+
+
+class MessagePackRenderer(BaseRenderer):
+    """
+    MessagePack renderer, selected with Accept: application/msgpack.
+    """
+    media_type = 'application/msgpack'
+    format = 'msgpack'
+    charset = None
+    render_style = 'binary'
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b''
+        if isinstance(data, PreRendered):
+            return data
+        return msgpack.packb(data, default=_encoder.default, use_bin_type=True)
@@ -44,6 +44,7 @@ INSTALLED_APPS = [
     'django.contrib.sessions',
     'django.contrib.messages',
     'django.contrib.staticfiles',
+    'django.contrib.postgres',
     'corsheaders',
     'rest_framework',
     'django_rq',
@@ -55,14 +56,23 @@ MIDDLEWARE = [
     'corsheaders.middleware.CorsMiddleware',
     'django.middleware.security.SecurityMiddleware',
     'whitenoise.middleware.WhiteNoiseMiddleware',
-    'django.contrib.sessions.middleware.SessionMiddleware',
+    'core.middleware.FastPathSessionMiddleware',
     'django.middleware.common.CommonMiddleware',
-    'django.middleware.csrf.CsrfViewMiddleware',
-    'django.contrib.auth.middleware.AuthenticationMiddleware',
-    'django.contrib.messages.middleware.MessageMiddleware',
-    'django.middleware.clickjacking.XFrameOptionsMiddleware',
+    'core.middleware.FastPathCsrfViewMiddleware',
+    'core.middleware.FastPathAuthenticationMiddleware',
+    'core.middleware.FastPathMessageMiddleware',
+    'core.middleware.FastPathXFrameOptionsMiddleware',
+    'auth_app.middleware.SlidingSessionMiddleware',
 ]
 
+# Token-authenticated API routes that skip session, CSRF, auth, message
+# and X-Frame-Options middleware (core/middleware.py). /admin/ and the
+# RQ dashboard keep the full stack.
+API_FAST_PATH_PREFIXES = tuple(
+    prefix for prefix in
+    os.getenv('API_FAST_PATH_PREFIXES', '/api/video/').split(',') if prefix
+)
+
 ROOT_URLCONF = 'core.urls'
 
 TEMPLATES = [
@@ -125,6 +135,10 @@ if TESTING:
         }
     }
 
+# Rendered GET /api/video/ pages. Entries are keyed by a catalog version
+# that Video signals bump, so the timeout only bounds memory usage.
+VIDEO_LIST_CACHE_TIMEOUT = int(os.getenv('VIDEO_LIST_CACHE_TIMEOUT', 3600))
+
 RQ_QUEUES = {
     'default': {
         'HOST': os.environ.get("REDIS_HOST", default="redis"),
@@ -132,12 +146,71 @@ RQ_QUEUES = {
         'DB': os.environ.get("REDIS_DB", default=0),
         'DEFAULT_TIMEOUT': 900,
         'REDIS_CLIENT_KWARGS': {},
-    }
+    },
+    # Activation and password reset emails, processed by a separate
+    # non-forking worker that keeps its SMTP connection open.
+    'email': {
+        'HOST': os.environ.get("REDIS_HOST", default="redis"),
+        'PORT': os.environ.get("REDIS_PORT", default=6379),
+        'DB': os.environ.get("REDIS_DB", default=0),
+        'DEFAULT_TIMEOUT': 60,
+        'REDIS_CLIENT_KWARGS': {},
+    },
 }
 
 RQ_SHOW_ADMIN_LINK = True
 
 
+# Thumbnails
+# Widths (px) of the WebP/JPEG derivatives built for every thumbnail.
+
+THUMBNAIL_WIDTHS = [
+    int(width) for width in
+    os.getenv('THUMBNAIL_WIDTHS', '320,640,1280').split(',')
+]
+THUMBNAIL_QUALITY = int(os.getenv('THUMBNAIL_QUALITY', 80))
+
+
+# HLS streaming
+# ASYNC_STREAMING routes manifest/segment requests to the async views.
+# Only useful when served by an ASGI server (see README "Deployment").
+
+ASYNC_STREAMING = os.getenv('ASYNC_STREAMING', 'False') == 'True'
+
+if ASYNC_STREAMING:
+    # WhiteNoise is sync-only: under ASGI every request would be adapted
+    # through async_to_sync onto the single thread-sensitive thread.
+    # nginx serves /static/ instead (see README "ASGI Streaming Mode").
+    MIDDLEWARE.remove('whitenoise.middleware.WhiteNoiseMiddleware')
+
+# Optional proxy sendfile handoff for async segment responses,
+# e.g. HLS_SENDFILE_HEADER=X-Accel-Redirect with nginx.
+HLS_SENDFILE_HEADER = os.getenv('HLS_SENDFILE_HEADER', '')
+HLS_SENDFILE_PREFIX = os.getenv('HLS_SENDFILE_PREFIX', '/protected-media/')
+
+# Shared-memory hot segment cache, shared by all workers on a host.
+# Disabled with HLS_SEGMENT_CACHE_SLOTS=0. Segments larger than one slot
+# are always served from disk.
+HLS_SEGMENT_CACHE_PATH = os.getenv(
+    'HLS_SEGMENT_CACHE_PATH', '/dev/shm/videoflix-segment-cache')
+HLS_SEGMENT_CACHE_SLOTS = int(os.getenv('HLS_SEGMENT_CACHE_SLOTS', 0))
+HLS_SEGMENT_CACHE_SLOT_SIZE = int(
+    os.getenv('HLS_SEGMENT_CACHE_SLOT_SIZE', 8 * 1024 * 1024))
+
+# Concurrent cache misses for the same segment are coalesced. Across
+# processes the loader holds a short Redis lock (seconds) while others poll.
+HLS_COALESCE_LOCK_TIMEOUT = float(os.getenv('HLS_COALESCE_LOCK_TIMEOUT', 5))
+HLS_COALESCE_POLL_INTERVAL = 0.01
+
+# Page-cache prewarming. A sample of segment requests is counted in hourly
+# Redis buckets; prewarm_popular_segments warms the opening
+# HLS_PREWARM_SECONDS of the HLS_PREWARM_TOP_N most requested titles.
+HLS_DEMAND_SAMPLE_RATE = float(os.getenv('HLS_DEMAND_SAMPLE_RATE', 0.1))
+HLS_DEMAND_WINDOW_HOURS = int(os.getenv('HLS_DEMAND_WINDOW_HOURS', 24))
+HLS_PREWARM_TOP_N = int(os.getenv('HLS_PREWARM_TOP_N', 20))
+HLS_PREWARM_SECONDS = int(os.getenv('HLS_PREWARM_SECONDS', 180))
+
+
 # Password validation
 # https://docs.djangoproject.com/en/5.2/ref/settings/#auth-password-validators
 
@@ -157,6 +230,28 @@ AUTH_PASSWORD_VALIDATORS = [
 ]
 
 
+# Password hashing
+# https://docs.djangoproject.com/en/5.2/topics/auth/passwords/
+# PASSWORD_HASHER picks the hasher for new hashes ('argon2' or 'pbkdf2').
+# Hashes of the other hashers stay valid and are rehashed on next login.
+# Size the costs with: python manage.py benchmark_password_hashers
+
+PASSWORD_HASHER = os.getenv('PASSWORD_HASHER', 'argon2')
+_PASSWORD_HASHERS = {
+    'argon2': 'auth_app.hashers.TunableArgon2PasswordHasher',
+    'pbkdf2': 'django.contrib.auth.hashers.PBKDF2PasswordHasher',
+}
+PASSWORD_HASHERS = [_PASSWORD_HASHERS[PASSWORD_HASHER]] + [
+    hasher for name, hasher in _PASSWORD_HASHERS.items()
+    if name != PASSWORD_HASHER
+] + ['django.contrib.auth.hashers.PBKDF2SHA1PasswordHasher']
+
+# Argon2id costs: passes, memory in KiB, lanes (Django's defaults).
+ARGON2_TIME_COST = int(os.getenv('ARGON2_TIME_COST', 2))
+ARGON2_MEMORY_COST = int(os.getenv('ARGON2_MEMORY_COST', 102400))
+ARGON2_PARALLELISM = int(os.getenv('ARGON2_PARALLELISM', 8))
+
+
 # Internationalization
 # https://docs.djangoproject.com/en/5.2/topics/i18n/
 
@@ -196,11 +291,23 @@ EMAIL_USE_TLS = os.getenv('EMAIL_USE_TLS', 'True') == 'True'
 EMAIL_USE_SSL = os.getenv('EMAIL_USE_SSL', 'False') == 'True'
 DEFAULT_FROM_EMAIL = os.getenv('DEFAULT_FROM_EMAIL', 'noreply@videoflix.com')
 
+# Send emails from the 'email' RQ queue instead of inside the request.
+# Failed sends are retried after each interval (seconds) in turn.
+EMAIL_ASYNC = os.getenv('EMAIL_ASYNC', 'True') == 'True' and not TESTING
+EMAIL_RETRY_INTERVALS = [
+    int(seconds) for seconds in
+    os.getenv('EMAIL_RETRY_INTERVALS', '10,60,300').split(',')
+]
+
 
 # Password reset token timeout (in seconds)
 
 PASSWORD_RESET_TIMEOUT = 86400  # 24 hours
 
+# Users deleted per transaction by purge_unactivated_users.
+UNACTIVATED_USER_PURGE_BATCH_SIZE = int(
+    os.getenv('UNACTIVATED_USER_PURGE_BATCH_SIZE', 500))
+
 
 # REST Framework Configuration
 
@@ -208,16 +315,58 @@ REST_FRAMEWORK = {
     'DEFAULT_AUTHENTICATION_CLASSES': (
         'auth_app.api.authentication.CookieJWTAuthentication',
     ),
+    'DEFAULT_RENDERER_CLASSES': (
+        'core.renderers.ORJSONRenderer',
+        'core.renderers.MessagePackRenderer',
+        'rest_framework.renderers.BrowsableAPIRenderer',
+    ),
+    # Budgets of the sliding-window throttles on login, registration and
+    # password reset (auth_app/api/throttling.py), per client IP and per
+    # submitted email.
+    'DEFAULT_THROTTLE_RATES': {
+        'login_ip': os.getenv('THROTTLE_LOGIN_IP', '20/min'),
+        'login_email': os.getenv('THROTTLE_LOGIN_EMAIL', '5/min'),
+        'register_ip': os.getenv('THROTTLE_REGISTER_IP', '10/hour'),
+        'register_email': os.getenv('THROTTLE_REGISTER_EMAIL', '3/hour'),
+        'password_reset_ip': os.getenv('THROTTLE_PASSWORD_RESET_IP', '10/hour'),
+        'password_reset_email': os.getenv('THROTTLE_PASSWORD_RESET_EMAIL', '3/hour'),
+    },
+    # Proxies in front of the app; the client IP is taken from the
+    # X-Forwarded-For entry appended by the outermost one. 0 uses
+    # REMOTE_ADDR, so clients cannot pick their throttle identity.
+    'NUM_PROXIES': int(os.getenv('API_NUM_PROXIES', 0)),
 }
 
 
+# Authentication caches
+# CookieJWTAuthentication caches users per process (LOCAL_TTL) and in Redis
+# (TTL). A deactivated user is rejected after at most LOCAL_TTL seconds.
+# Validated access tokens are memoized per process until they expire.
+
+AUTH_USER_CACHE_TTL = int(os.getenv('AUTH_USER_CACHE_TTL', 300))
+AUTH_USER_CACHE_LOCAL_TTL = int(os.getenv('AUTH_USER_CACHE_LOCAL_TTL', 30))
+AUTH_USER_CACHE_SIZE = int(os.getenv('AUTH_USER_CACHE_SIZE', 1024))
+AUTH_TOKEN_CACHE_SIZE = int(os.getenv('AUTH_TOKEN_CACHE_SIZE', 4096))
+
+
 # Simple JWT Configuration
 
 SIMPLE_JWT = {
     'ACCESS_TOKEN_LIFETIME': timedelta(minutes=15),
     'REFRESH_TOKEN_LIFETIME': timedelta(days=1),
+    # Issue a new refresh token on every refresh and deny the old one
+    # (Redis denylist, see auth_app/api/denylist.py).
+    'ROTATE_REFRESH_TOKENS': os.getenv('JWT_ROTATE_REFRESH_TOKENS', 'False') == 'True',
+    # last_login tells activated (later deactivated) accounts apart from
+    # never activated ones in purge_unactivated_users.
+    'UPDATE_LAST_LOGIN': True,
 }
 
+# Sliding session: authenticated responses carry a fresh access token
+# cookie once the current one has less than this many seconds left
+# (auth_app/middleware.py). 0 disables it.
+ACCESS_TOKEN_RENEW_BEFORE = int(os.getenv('ACCESS_TOKEN_RENEW_BEFORE', 300))
+
 
 # Enable logging on server
 
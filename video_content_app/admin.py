@@ -1,9 +1,32 @@
 from django.contrib import admin
-from .models import Video
+from .models import Rendition, Video
+from .search import search_filter
+
+
+class RenditionInline(admin.TabularInline):
+    model = Rendition
+    extra = 0
+    can_delete = False
+    readonly_fields = ('resolution', 'width', 'height', 'bitrate',
+                       'segment_count', 'total_bytes')
+
+    def has_add_permission(self, request, obj=None):
+        return False
 
 
 @admin.register(Video)
 class VideoAdmin(admin.ModelAdmin):
     list_display = ('id', 'title', 'category', 'created_at')
+    readonly_fields = ('duration', 'width', 'height')
+    inlines = [RenditionInline]
     list_filter = ('category', 'created_at')
     search_fields = ('title', 'description')
+
+    def get_search_results(self, request, queryset, search_term):
+        """
+        Search through the indexed search vector instead of ILIKE scans.
+        """
+        search_term = search_term.strip()
+        if not search_term:
+            return queryset, False
+        return search_filter(queryset, search_term), False
@@ -0,0 +1,166 @@
+import os
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.http import (
+    Http404,
+    HttpResponse,
+    JsonResponse,
+    StreamingHttpResponse,
+)
+from django.views import View
+
+from rest_framework import status
+from rest_framework.exceptions import AuthenticationFailed
+
+from auth_app.api.authentication import CookieJWTAuthentication
+from video_content_app.models import Video
+from video_content_app.api.views import HLSFileMixin
+from video_content_app.demand import record_segment_request, should_sample
+
+
+STREAM_CHUNK_SIZE = 64 * 1024
+
+
+async def _iter_file(path, chunk_size=STREAM_CHUNK_SIZE):
+    """
+    Yield a file in chunks without blocking the event loop.
+    Each read is handed to a worker thread.
+    """
+    read_in_thread = sync_to_async(lambda f: f.read(chunk_size),
+                                   thread_sensitive=False)
+    f = await sync_to_async(open, thread_sensitive=False)(path, 'rb')
+    try:
+        while True:
+            chunk = await read_in_thread(f)
+            if not chunk:
+                break
+            yield chunk
+    finally:
+        f.close()
+
+
+class AsyncHLSView(HLSFileMixin, View):
+    """
+    Base view for async HLS streaming under ASGI.
+    Authenticates the access token cookie like the DRF views do.
+    """
+    authentication_class = CookieJWTAuthentication
+
+    def _unauthorized(self, detail):
+        # 401 JSON response matching DRF's for the sync views.
+        response = JsonResponse(
+            {"detail": str(detail)},
+            status=status.HTTP_401_UNAUTHORIZED
+        )
+        response['WWW-Authenticate'] = 'Bearer realm="api"'
+        return response
+
+    async def _authenticate(self, request):
+        # Return the authenticated user or None. Raises AuthenticationFailed
+        # for inactive, deleted or password-changed users.
+        authenticator = self.authentication_class()
+        result = await sync_to_async(authenticator.authenticate)(request)
+        if result is None:
+            return None
+        user, _ = result
+        return user
+
+    async def _validate_video(self, movie_id):
+        # Validate that video exists, raise Http404 if not.
+        if not await Video.objects.filter(id=movie_id).aexists():
+            raise Http404("Video not found")
+
+    async def dispatch(self, request, *args, **kwargs):
+        try:
+            user = await self._authenticate(request)
+        except AuthenticationFailed as exc:
+            return self._unauthorized(exc.detail)
+        if user is None:
+            return self._unauthorized(
+                "Authentication credentials were not provided.")
+        request.user = user
+        return await super().dispatch(request, *args, **kwargs)
+
+
+class AsyncVideoManifestView(AsyncHLSView):
+    """
+    Async variant of VideoManifestView.
+    Reads the manifest in a worker thread instead of the event loop.
+    """
+
+    async def get(self, request, movie_id, resolution):
+        await self._validate_video(movie_id)
+        manifest_path = await sync_to_async(
+            self._get_manifest_path, thread_sensitive=False
+        )(movie_id, resolution)
+        try:
+            content = await sync_to_async(
+                self._read_text, thread_sensitive=False)(manifest_path)
+        except OSError:
+            raise Http404("Error reading manifest file")
+        return HttpResponse(
+            content,
+            content_type='application/vnd.apple.mpegurl',
+            status=status.HTTP_200_OK
+        )
+
+    def _read_text(self, path):
+        with open(path, 'r', encoding='utf-8') as f:
+            return f.read()
+
+
+class AsyncVideoSegmentView(AsyncHLSView):
+    """
+    Async variant of VideoSegmentView.
+    Serves hot segments from the shared segment cache. Otherwise streams
+    the segment in chunks, or hands it to the front proxy via
+    HLS_SENDFILE_HEADER (e.g. nginx X-Accel-Redirect) when configured.
+    """
+
+    def _sendfile_response(self, path):
+        # Let the proxy serve the file with sendfile().
+        relative = os.path.relpath(path, settings.MEDIA_ROOT)
+        response = HttpResponse(content_type='video/MP2T')
+        response[settings.HLS_SENDFILE_HEADER] = (
+            settings.HLS_SENDFILE_PREFIX.rstrip('/') + '/' +
+            relative.replace(os.sep, '/')
+        )
+        return response
+
+    async def get(self, request, movie_id, resolution, segment):
+        await self._validate_video(movie_id)
+        entry = await sync_to_async(
+            self._get_segment_entry, thread_sensitive=False
+        )(movie_id, resolution, segment)
+        if should_sample():
+            await sync_to_async(
+                record_segment_request, thread_sensitive=False
+            )(movie_id, resolution, segment)
+        data = self._get_cached_segment(movie_id, resolution, segment)
+        if data is not None:
+            return self._add_index_headers(
+                self._segment_bytes_response(data), entry)
+
+        segment_path = await sync_to_async(
+            self._get_segment_path, thread_sensitive=False
+        )(movie_id, resolution, segment, entry)
+        data = await sync_to_async(
+            self._load_segment, thread_sensitive=False
+        )(movie_id, resolution, segment, segment_path, entry)
+        if data is not None:
+            return self._add_index_headers(
+                self._segment_bytes_response(data), entry)
+
+        if settings.HLS_SENDFILE_HEADER:
+            return self._sendfile_response(segment_path)
+
+        response = StreamingHttpResponse(
+            _iter_file(segment_path),
+            content_type='video/MP2T',
+            status=status.HTTP_200_OK
+        )
+        if entry is None:
+            size = await sync_to_async(
+                os.path.getsize, thread_sensitive=False)(segment_path)
+            response['Content-Length'] = str(size)
+        return self._add_index_headers(response, entry)
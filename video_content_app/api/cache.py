@@ -0,0 +1,131 @@
+import hashlib
+import time
+from django.conf import settings
+from django.core.cache import cache
+
+
+CATALOG_VERSION_KEY = 'video:catalog:version'
+LIST_KEY = 'video:catalog:{version}:{digest}'
+ITEM_KEY = 'video:item:{version}:{host}:{video_id}'
+LOCK_SUFFIX = ':lock'
+LOCK_TIMEOUT = 5
+LOCK_POLL_INTERVAL = 0.05
+
+CACHEABLE_FORMATS = {'json', 'msgpack'}
+
+
+def _fresh_version():
+    # Never reuse an old version number if the counter gets evicted.
+    return int(time.time() * 1000)
+
+
+def get_catalog_version():
+    """
+    Return the current catalog version, initializing it if missing.
+    """
+    version = cache.get(CATALOG_VERSION_KEY)
+    if version is None:
+        cache.add(CATALOG_VERSION_KEY, _fresh_version(), timeout=None)
+        version = cache.get(CATALOG_VERSION_KEY) or _fresh_version()
+    return version
+
+
+def bump_catalog_version():
+    """
+    Invalidate all cached catalog responses by moving to a new version.
+    """
+    try:
+        cache.incr(CATALOG_VERSION_KEY)
+    except ValueError:
+        cache.set(CATALOG_VERSION_KEY, _fresh_version(), timeout=None)
+
+
+def list_cache_key(request, version):
+    """
+    Build the cache key for a catalog response.
+    Depends on the path, query parameters, host and negotiated media type.
+    """
+    params = sorted(request.query_params.lists())
+    raw = '|'.join([
+        request.get_host(),
+        request.path,
+        request.accepted_media_type or '',
+        repr(params),
+    ])
+    digest = hashlib.sha1(raw.encode('utf-8')).hexdigest()[:20]
+    return LIST_KEY.format(version=version, digest=digest)
+
+
+def etag_for_key(key):
+    """
+    Responses are fully determined by their cache key, so it is the ETag.
+    """
+    return '"%s"' % hashlib.sha1(key.encode('utf-8')).hexdigest()[:20]
+
+
+def get_or_lock(key):
+    """
+    Return the cached (content_type, payload) for key, or None.
+
+    On a miss only one caller gets the rebuild lock and returns None at
+    once; concurrent callers wait for it to fill the entry instead of
+    rebuilding the same response (stampede protection). They give up and
+    rebuild themselves after LOCK_TIMEOUT seconds.
+    """
+    entry = cache.get(key)
+    if entry is not None:
+        return entry
+    if cache.add(key + LOCK_SUFFIX, 1, timeout=LOCK_TIMEOUT):
+        return None
+
+    deadline = time.monotonic() + LOCK_TIMEOUT
+    while time.monotonic() < deadline:
+        time.sleep(LOCK_POLL_INTERVAL)
+        entry = cache.get(key)
+        if entry is not None:
+            return entry
+    return None
+
+
+def store(key, content_type, payload):
+    """
+    Cache a rendered response body and release the rebuild lock.
+    """
+    cache.set(key, (content_type, payload),
+              timeout=settings.VIDEO_LIST_CACHE_TIMEOUT)
+    cache.delete(key + LOCK_SUFFIX)
+
+
+def release(key):
+    """
+    Release the rebuild lock without caching, e.g. after an error response,
+    so waiting callers stop polling and build the response themselves.
+    """
+    cache.delete(key + LOCK_SUFFIX)
+
+
+def _item_keys(request, version, video_ids):
+    # Serialized videos contain absolute URLs, so they depend on the host.
+    host = hashlib.sha1(request.get_host().encode('utf-8')).hexdigest()[:8]
+    return {video_id: ITEM_KEY.format(
+        version=version, host=host, video_id=video_id)
+        for video_id in video_ids}
+
+
+def get_items(request, version, video_ids):
+    """
+    Return {video_id: serialized video} for the cached ids.
+    """
+    keys = _item_keys(request, version, video_ids)
+    cached = cache.get_many(keys.values())
+    return {video_id: cached[key] for video_id, key in keys.items()
+            if key in cached}
+
+
+def store_items(request, version, items):
+    """
+    Cache serialized videos given as {video_id: data}.
+    """
+    keys = _item_keys(request, version, items)
+    cache.set_many({keys[video_id]: data for video_id, data in items.items()},
+                   timeout=settings.VIDEO_LIST_CACHE_TIMEOUT)
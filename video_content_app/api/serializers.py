@@ -1,27 +1,176 @@
 from rest_framework import serializers
 
-from video_content_app.models import Video
+from video_content_app.models import Rendition, Video
+
+
+# Model columns backing the computed serializer fields. Each of these
+# fields has a build_<field>(value) method on VideoSerializer.
+FIELD_SOURCES = {
+    'thumbnail_url': 'thumbnail',
+    'thumbnail_srcset': 'thumbnail_variants',
+    'thumbnail_placeholder': 'thumbnail_placeholder',
+}
+
+
+def parse_fields(value):
+    """
+    Parse a comma separated ?fields= value into a list of field names.
+    Returns None if no sparse fieldset was requested.
+    """
+    if not value:
+        return None
+    fields = [name.strip() for name in value.split(',') if name.strip()]
+    unknown = [name for name in fields
+               if name not in VideoSerializer.Meta.fields]
+    if unknown:
+        raise serializers.ValidationError(
+            {'fields': [f'Unknown field: {name}' for name in unknown]})
+    return fields or None
+
+
+class RenditionSerializer(serializers.ModelSerializer):
+    """
+    Serializer for the HLS renditions of a video.
+    """
+
+    class Meta:
+        model = Rendition
+        fields = ['resolution', 'width', 'height', 'bitrate',
+                  'segment_count', 'total_bytes']
 
 
 class VideoSerializer(serializers.ModelSerializer):
     """
     Serializer for Video model.
-    Returns video metadata including thumbnail URL.
+    Returns video metadata including thumbnail URL, srcset strings
+    of the resized thumbnail derivatives per image format and an inline
+    placeholder image, technical metadata and the available renditions.
+    Pass fields=[...] to return only a subset of the fields.
+    Use prefetch_related('renditions') on querysets to avoid N+1 queries.
     """
     thumbnail_url = serializers.SerializerMethodField()
+    thumbnail_srcset = serializers.SerializerMethodField()
+    thumbnail_placeholder = serializers.SerializerMethodField()
+    renditions = RenditionSerializer(many=True, read_only=True)
 
     class Meta:
         model = Video
-        fields = ['id', 'created_at', 'title',
-                  'description', 'thumbnail_url', 'category']
+        fields = ['id', 'created_at', 'title', 'description',
+                  'thumbnail_url', 'thumbnail_srcset',
+                  'thumbnail_placeholder', 'category',
+                  'duration', 'width', 'height', 'renditions']
+
+    def __init__(self, *args, **kwargs):
+        fields = kwargs.pop('fields', None)
+        super().__init__(*args, **kwargs)
+        if fields is not None:
+            for name in set(self.fields) - set(fields):
+                self.fields.pop(name)
+
+    def build_thumbnail_url(self, name):
+        """
+        Return the full URL for a stored thumbnail name, or None.
+        """
+        if not name:
+            return None
+        url = Video._meta.get_field('thumbnail').storage.url(name)
+        request = self.context.get('request')
+        if request is not None:
+            return request.build_absolute_uri(url)
+        return url
+
+    def build_thumbnail_srcset(self, variants):
+        """
+        Return {format: srcset} for stored thumbnail variants, or None.
+        """
+        if not variants:
+            return None
+        return {
+            fmt: ', '.join(
+                f'{self.build_thumbnail_url(name)} {width}w'
+                for width, name in sorted(
+                    widths.items(), key=lambda item: int(item[0])))
+            for fmt, widths in variants.items() if widths
+        } or None
+
+    def build_thumbnail_placeholder(self, placeholder):
+        """
+        Return the placeholder data URI, or None if not built yet.
+        """
+        return placeholder or None
 
     def get_thumbnail_url(self, obj):
         """
         Return full URL for thumbnail if it exists.
         """
-        if obj.thumbnail and obj.thumbnail.name:
-            request = self.context.get('request')
-            if request is not None:
-                return request.build_absolute_uri(obj.thumbnail.url)
-            return obj.thumbnail.url
+        if obj.thumbnail:
+            return self.build_thumbnail_url(obj.thumbnail.name)
         return None
+
+    def get_thumbnail_srcset(self, obj):
+        """
+        Return srcset strings of the thumbnail derivatives if built.
+        """
+        return self.build_thumbnail_srcset(obj.thumbnail_variants)
+
+    def get_thumbnail_placeholder(self, obj):
+        """
+        Return the inline thumbnail placeholder if built.
+        """
+        return self.build_thumbnail_placeholder(obj.thumbnail_placeholder)
+
+
+class VideoValuesSerializer:
+    """
+    Compact projection of VideoSerializer for list endpoints.
+
+    Works on .values() rows holding only the columns of the requested
+    fields, so no model instances are built. Renditions are loaded for
+    all rows with one extra query. The output is identical to
+    VideoSerializer with the same fields.
+    """
+
+    def __init__(self, fields=None, context=None):
+        self.serializer = VideoSerializer(fields=fields, context=context)
+        self.renditions = {}
+
+    def columns(self):
+        """
+        Return the model columns to select for the requested fields.
+        """
+        columns = [
+            'id' if name == 'renditions' else FIELD_SOURCES.get(name, name)
+            for name in self.serializer.fields
+        ]
+        return list(dict.fromkeys(columns))
+
+    def _load_renditions(self, rows):
+        # One query for the renditions of all rows instead of one per row.
+        names = RenditionSerializer.Meta.fields
+        self.renditions = {}
+        for rendition in Rendition.objects.filter(
+                video_id__in=[row['id'] for row in rows]).values(
+                    'video_id', *names):
+            self.renditions.setdefault(rendition['video_id'], []).append(
+                {name: rendition[name] for name in names})
+
+    def to_representation(self, row):
+        data = {}
+        for name, field in self.serializer.fields.items():
+            if name == 'renditions':
+                data[name] = self.renditions.get(row['id'], [])
+                continue
+            value = row[FIELD_SOURCES.get(name, name)]
+            if name in FIELD_SOURCES:
+                data[name] = getattr(self.serializer, f'build_{name}')(value)
+            elif value is None:
+                data[name] = None
+            else:
+                data[name] = field.to_representation(value)
+        return data
+
+    def serialize(self, rows):
+        rows = list(rows)
+        if 'renditions' in self.serializer.fields:
+            self._load_renditions(rows)
+        return [self.to_representation(row) for row in rows]
@@ -1,23 +1,56 @@
 import os
 from django.dispatch import receiver
-from django.db.models.signals import post_save, post_delete
+from django.db.models.signals import post_init, post_save, post_delete
 import django_rq
 from django.conf import settings
 import shutil
 
 from video_content_app.models import Video
+from video_content_app.api.cache import bump_catalog_version
+from video_content_app.segment_index import clear_index_cache
 from video_content_app.tasks import (
     convert_to_hls,
-    delete_original_video
+    delete_original_video,
+    generate_thumbnail_variants,
+    prewarm_video
 )
+from video_content_app.thumbnails import remove_variants
+
+
+def _thumbnail_name(instance):
+    # Read the raw value so deferred thumbnails are not loaded; None if so.
+    if 'thumbnail' not in instance.__dict__:
+        return None
+    value = instance.__dict__['thumbnail']
+    return getattr(value, 'name', value) or ''
+
+
+@receiver(post_init, sender=Video)
+def video_loaded_handler(sender, instance, **kwargs):
+    """
+    Signal handler for post_init signal of Video model.
+    Remembers the thumbnail name to detect replaced thumbnails on save.
+    """
+    instance._saved_thumbnail = _thumbnail_name(instance)
 
 
 @receiver(post_save, sender=Video)
 def video_created_handler(sender, instance, created, **kwargs):
     """
     Signal handler for post_save signal of Video model.
-    Converts video to HLS format with multiple resolutions and deletes the original.
+    Invalidates cached catalog responses.
+    Converts video to HLS format with multiple resolutions, deletes the original
+    and prewarms the opening segments of the new release.
+    Builds thumbnail derivatives when the thumbnail changed.
     """
+    bump_catalog_version()
+    thumbnail = _thumbnail_name(instance)
+    if thumbnail is not None and (
+            thumbnail != instance._saved_thumbnail or (created and thumbnail)):
+        instance._saved_thumbnail = thumbnail
+        queue = django_rq.get_queue('default', autocommit=True)
+        queue.enqueue(generate_thumbnail_variants, instance.id)
+
     if created and instance.video_file:
         queue = django_rq.get_queue('default', autocommit=True)
         job = queue.enqueue(
@@ -27,14 +60,17 @@ def video_created_handler(sender, instance, created, **kwargs):
             instance.video_file.path,
             depends_on=job
         )
+        queue.enqueue(prewarm_video, instance.id, depends_on=job)
 
 
 @receiver(post_delete, sender=Video)
 def video_deleted_handler(sender, instance, **kwargs):
     """
     Signal handler for post_delete signal of Video model.
-    Deletes HLS files and thumbnail.
+    Invalidates cached catalog responses and deletes HLS files and
+    thumbnails.
     """
+    bump_catalog_version()
     if instance.video_file:
         if os.path.isfile(instance.video_file.path):
             os.remove(instance.video_file.path)
@@ -42,7 +78,9 @@ def video_deleted_handler(sender, instance, **kwargs):
     hls_dir = os.path.join(settings.MEDIA_ROOT, 'videos', str(instance.id))
     if os.path.isdir(hls_dir):
         shutil.rmtree(hls_dir)
+    clear_index_cache(instance.id)
 
     if instance.thumbnail:
         if os.path.isfile(instance.thumbnail.path):
             os.remove(instance.thumbnail.path)
+    remove_variants(instance.id)
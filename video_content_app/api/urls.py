@@ -1,12 +1,34 @@
+from django.conf import settings
 from django.urls import path
 
-from .views import VideoListView, VideoManifestView, VideoSegmentView
+from .views import (
+    VideoAutocompleteView,
+    VideoDashboardView,
+    VideoListView,
+    VideoManifestView,
+    VideoSearchView,
+    VideoSegmentView,
+)
+from .async_views import AsyncVideoManifestView, AsyncVideoSegmentView
+
+
+if settings.ASYNC_STREAMING:
+    manifest_view = AsyncVideoManifestView.as_view()
+    segment_view = AsyncVideoSegmentView.as_view()
+else:
+    manifest_view = VideoManifestView.as_view()
+    segment_view = VideoSegmentView.as_view()
 
 
 urlpatterns = [
     path('video/', VideoListView.as_view(), name='video-list'),
+    path('video/dashboard/', VideoDashboardView.as_view(),
+         name='video-dashboard'),
+    path('video/search/', VideoSearchView.as_view(), name='video-search'),
+    path('video/search/autocomplete/', VideoAutocompleteView.as_view(),
+         name='video-autocomplete'),
     path('video/<int:movie_id>/<str:resolution>/index.m3u8',
-         VideoManifestView.as_view(), name='video-manifest'),
+         manifest_view, name='video-manifest'),
     path('video/<int:movie_id>/<str:resolution>/<str:segment>/',
-         VideoSegmentView.as_view(), name='video-segment'),
+         segment_view, name='video-segment'),
 ]
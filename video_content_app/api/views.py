@@ -1,33 +1,179 @@
 import os
-from django.http import FileResponse, HttpResponse, Http404
-from django.conf import settings
+from django.http import (
+    FileResponse,
+    Http404,
+    HttpResponse,
+    HttpResponseNotModified,
+)
+from django.db.models import F, Window
+from django.db.models.functions import RowNumber
+from django.utils.http import parse_etags
 
 from rest_framework import status
+from rest_framework.exceptions import APIException, ValidationError
 from rest_framework.views import APIView
 from rest_framework.response import Response
 from rest_framework.permissions import IsAuthenticated
 
+from core.renderers import PreRendered
 from video_content_app.models import Video
-from video_content_app.api.serializers import VideoSerializer
+from video_content_app.api import cache as list_cache
+from video_content_app.api.pagination import VideoCursorPagination
+from video_content_app.api.serializers import (
+    VideoSerializer,
+    VideoValuesSerializer,
+    parse_fields,
+)
+from video_content_app.search import autocomplete_titles, search_videos
+from video_content_app.segment_cache import get_segment_cache, segment_key
+from video_content_app.coalescing import coalesced_load
+from video_content_app.demand import record_segment_request, should_sample
+from video_content_app.segment_index import (
+    MANIFEST_FILENAME,
+    get_rendition_index,
+    is_valid_resolution,
+    is_valid_segment_name,
+    rendition_dir,
+)
 
 
-class VideoListView(APIView):
+class CatalogCacheMixin:
+    """
+    Caches rendered catalog responses in Redis per catalog version.
+    Adds ETag/If-None-Match support to the views using it.
+    """
+
+    def _get_cache_key(self, request):
+        # Only cache formats that do not contain per-user content.
+        if request.accepted_renderer.format not in list_cache.CACHEABLE_FORMATS:
+            return None
+        version = list_cache.get_catalog_version()
+        return list_cache.list_cache_key(request, version)
+
+    def _cached_response(self, request):
+        # Return a 304 or cached response, or None if it must be built.
+        cache_key = self._get_cache_key(request)
+        if cache_key is None:
+            return None
+
+        etag = list_cache.etag_for_key(cache_key)
+        if etag in parse_etags(request.META.get('HTTP_IF_NONE_MATCH', '')):
+            response = HttpResponseNotModified()
+            response['ETag'] = etag
+            return response
+
+        entry = list_cache.get_or_lock(cache_key)
+        if entry is None:
+            self.cache_key = cache_key
+            return None
+        content_type, payload = entry
+        response = Response(PreRendered(payload), content_type=content_type)
+        response['ETag'] = etag
+        return response
+
+    def handle_exception(self, exc):
+        # Uncaught errors skip finalize_response; release the lock here.
+        cache_key = getattr(self, 'cache_key', None)
+        if cache_key is not None:
+            list_cache.release(cache_key)
+            self.cache_key = None
+        return super().handle_exception(exc)
+
+    def finalize_response(self, request, response, *args, **kwargs):
+        # Store freshly rendered responses in the cache; any other
+        # response only releases the rebuild lock.
+        response = super().finalize_response(
+            request, response, *args, **kwargs)
+        cache_key = getattr(self, 'cache_key', None)
+        if cache_key is None:
+            return response
+        self.cache_key = None
+        if (isinstance(response, Response) and
+                response.status_code == status.HTTP_200_OK):
+            response.render()
+            list_cache.store(
+                cache_key, response['Content-Type'], response.content)
+            response['ETag'] = list_cache.etag_for_key(cache_key)
+        else:
+            list_cache.release(cache_key)
+        return response
+
+
+class VideoListView(CatalogCacheMixin, APIView):
     """
     API view to retrieve all available videos.
     Requires JWT authentication.
     """
     permission_classes = [IsAuthenticated]
+    pagination_class = VideoCursorPagination
+    max_batch_ids = 100
+
+    def _get_ids(self, request):
+        # Parse ?ids=1,2,3 keeping the order and dropping duplicates.
+        raw = request.query_params.get('ids')
+        if raw is None:
+            return None
+        try:
+            ids = [int(part) for part in raw.split(',') if part.strip()]
+        except ValueError:
+            raise ValidationError(
+                {'ids': ['Expected a comma separated list of video ids.']})
+        if len(ids) > self.max_batch_ids:
+            raise ValidationError(
+                {'ids': [f'At most {self.max_batch_ids} ids per request.']})
+        return list(dict.fromkeys(ids))
+
+    def _batch_response(self, request, ids):
+        # Look up videos per id in the cache, load the rest in one query.
+        fields = parse_fields(request.query_params.get('fields'))
+        serializer = VideoValuesSerializer(context={'request': request})
+        version = list_cache.get_catalog_version()
+
+        found = list_cache.get_items(request, version, ids)
+        missing = [video_id for video_id in ids if video_id not in found]
+        if missing:
+            rows = Video.objects.filter(id__in=missing).values(
+                *serializer.columns())
+            loaded = {item['id']: item for item in serializer.serialize(rows)}
+            list_cache.store_items(request, version, loaded)
+            found.update(loaded)
+
+        results = [found[video_id] for video_id in ids if video_id in found]
+        if fields is not None:
+            results = [{name: item[name] for name in item if name in fields}
+                       for item in results]
+        return Response({'results': results}, status=status.HTTP_200_OK)
 
     def get(self, request):
         """
-        GET /api/video/
-        Returns a list of all available videos with metadata.
+        GET /api/video/?cursor=<cursor>&limit=<n>&fields=<a,b>
+        Returns one page of videos with metadata, newest first.
+
+        GET /api/video/?ids=<id,id,...>&fields=<a,b>
+        Returns the given videos in the requested order.
         """
+        ids = self._get_ids(request)
+        if ids is not None:
+            return self._batch_response(request, ids)
+
+        cached = self._cached_response(request)
+        if cached is not None:
+            return cached
+
+        paginator = self.pagination_class()
         try:
-            videos = Video.objects.all()
-            serializer = VideoSerializer(
-                videos, many=True, context={'request': request})
-            return Response(serializer.data, status=status.HTTP_200_OK)
+            serializer = VideoValuesSerializer(
+                fields=parse_fields(request.query_params.get('fields')),
+                context={'request': request})
+            # The cursor needs created_at and id even if not requested.
+            columns = dict.fromkeys(
+                serializer.columns() + ['created_at', 'id'])
+            rows = paginator.paginate_queryset(
+                Video.objects.values(*columns), request, view=self)
+            return paginator.get_paginated_response(
+                serializer.serialize(rows))
+        except APIException:
+            raise
         except Exception:
             return Response(
                 {"detail": "Internal server error"},
@@ -35,12 +181,125 @@ class VideoListView(APIView):
             )
 
 
-class VideoManifestView(APIView):
+class VideoDashboardView(CatalogCacheMixin, APIView):
     """
-    API view to serve HLS manifest (index.m3u8) for a specific video and resolution.
+    API view returning the newest videos per category as dashboard rows.
+    Requires JWT authentication.
+    """
+    permission_classes = [IsAuthenticated]
+    default_per_category = 10
+    max_per_category = 50
+
+    def _get_per_category(self, request):
+        try:
+            per_category = int(request.query_params['per_category'])
+        except (KeyError, ValueError):
+            return self.default_per_category
+        return max(1, min(per_category, self.max_per_category))
+
+    def get(self, request):
+        """
+        GET /api/video/dashboard/?per_category=<n>&fields=<a,b>
+        Returns one row per category with its newest n videos,
+        built from a single query.
+        """
+        cached = self._cached_response(request)
+        if cached is not None:
+            return cached
+
+        per_category = self._get_per_category(request)
+        serializer = VideoValuesSerializer(
+            fields=parse_fields(request.query_params.get('fields')),
+            context={'request': request})
+        videos = Video.objects.annotate(
+            category_rank=Window(
+                RowNumber(),
+                partition_by=[F('category')],
+                order_by=[F('created_at').desc(), F('id').desc()],
+            )
+        ).filter(category_rank__lte=per_category).values(
+            *dict.fromkeys(serializer.columns() + ['category']))
+
+        videos = list(videos)
+        rows = {category: [] for category, _ in Video.CATEGORY_CHOICES}
+        for video, data in zip(videos, serializer.serialize(videos)):
+            rows.setdefault(video['category'], []).append(data)
+
+        return Response([
+            {"category": category, "videos": items}
+            for category, items in rows.items() if items
+        ], status=status.HTTP_200_OK)
+
+
+class BoundedLimitMixin:
+    """
+    Reads a bounded result count from the query string.
+    """
+    limit_query_param = 'limit'
+    default_limit = 20
+    max_limit = 100
+
+    def _get_limit(self, request):
+        try:
+            limit = int(request.query_params[self.limit_query_param])
+        except (KeyError, ValueError):
+            return self.default_limit
+        return max(1, min(limit, self.max_limit))
+
+
+class VideoSearchView(BoundedLimitMixin, APIView):
+    """
+    API view for ranked full-text search over titles and descriptions.
+    Requires JWT authentication.
+    """
+    permission_classes = [IsAuthenticated]
+
+    def get(self, request):
+        """
+        GET /api/video/search/?q=<query>&category=<category>&limit=<n>
+        Returns the best matching videos, optionally within one category.
+        """
+        fields = parse_fields(request.query_params.get('fields'))
+        term = request.query_params.get('q', '').strip()
+        if not term:
+            return Response([], status=status.HTTP_200_OK)
+
+        videos = search_videos(
+            term, category=request.query_params.get('category'))
+        serializer = VideoSerializer(
+            videos.prefetch_related('renditions')[:self._get_limit(request)],
+            many=True, fields=fields,
+            context={'request': request})
+        return Response(serializer.data, status=status.HTTP_200_OK)
+
+
+class VideoAutocompleteView(BoundedLimitMixin, APIView):
+    """
+    API view suggesting video titles for a typed prefix.
     Requires JWT authentication.
     """
     permission_classes = [IsAuthenticated]
+    default_limit = 10
+    max_limit = 20
+
+    def get(self, request):
+        """
+        GET /api/video/search/autocomplete/?q=<prefix>&limit=<n>
+        Returns id and title of videos whose title starts with the prefix.
+        """
+        prefix = request.query_params.get('q', '').strip()
+        if not prefix:
+            return Response([], status=status.HTTP_200_OK)
+        return Response(
+            autocomplete_titles(prefix, self._get_limit(request)),
+            status=status.HTTP_200_OK)
+
+
+class HLSFileMixin:
+    """
+    Shared lookup helpers for the HLS manifest and segment views.
+    Used by both the sync API views and their async counterparts.
+    """
 
     def _validate_video(self, movie_id):
         # Validate that video exists, raise Http404 if not.
@@ -51,13 +310,101 @@ class VideoManifestView(APIView):
 
     def _get_manifest_path(self, movie_id, resolution):
         # Construct and validate manifest file path.
+        # Indexed renditions are known to exist, so they skip the stat().
+        if not is_valid_resolution(resolution):
+            raise Http404("Manifest not found")
         manifest_path = os.path.join(
-            settings.MEDIA_ROOT, 'videos', f'{movie_id}', resolution, 'index.m3u8'
-        )
-        if not os.path.exists(manifest_path):
+            rendition_dir(movie_id, resolution), MANIFEST_FILENAME)
+        if (get_rendition_index(movie_id, resolution) is None and
+                not os.path.exists(manifest_path)):
             raise Http404("Manifest not found")
         return manifest_path
 
+    def _get_segment_entry(self, movie_id, resolution, segment):
+        # Validate the requested names and look the segment up in the
+        # rendition's segment index. Returns None if there is no index.
+        if not (is_valid_resolution(resolution) and
+                is_valid_segment_name(segment)):
+            raise Http404("Segment not found")
+        index = get_rendition_index(movie_id, resolution)
+        if index is None:
+            return None
+        entry = index.segments.get(segment)
+        if entry is None:
+            raise Http404("Segment not found")
+        return entry
+
+    def _get_segment_path(self, movie_id, resolution, segment, entry=None):
+        # Construct and validate segment file path.
+        # Only segments without an index entry need a stat().
+        segment_path = os.path.join(
+            rendition_dir(movie_id, resolution), segment)
+        if entry is None and not os.path.exists(segment_path):
+            raise Http404("Segment not found")
+        return segment_path
+
+    def _add_index_headers(self, response, entry):
+        # Expose size and checksum known from the segment index.
+        if entry is not None:
+            response['Content-Length'] = str(entry.size)
+            response['ETag'] = f'"{entry.checksum}"'
+        return response
+
+    def _segment_cache_key(self, movie_id, resolution, segment, entry):
+        # Indexed segments are keyed by checksum, so cached bytes always
+        # match the Content-Length and ETag of the current index.
+        checksum = entry.checksum if entry is not None else None
+        return segment_key(movie_id, resolution, segment, checksum)
+
+    def _get_cached_segment(self, movie_id, resolution, segment, entry=None):
+        # Return segment bytes from the shared hot segment cache, or None.
+        cache = get_segment_cache()
+        if cache is None:
+            return None
+        return cache.get(
+            self._segment_cache_key(movie_id, resolution, segment, entry))
+
+    def _load_segment(self, movie_id, resolution, segment, path, entry=None):
+        # Read a segment into the shared cache and return its bytes.
+        # Concurrent misses for the same segment share one disk read.
+        # Returns None if caching is disabled or the segment does not fit.
+        # Missing or unreadable files are a 404, as in _serve_segment.
+        cache = get_segment_cache()
+        if cache is None:
+            return None
+        key = self._segment_cache_key(movie_id, resolution, segment, entry)
+
+        def fill():
+            with open(path, 'rb') as f:
+                data = f.read()
+            cache.put(key, data)
+            return data
+
+        try:
+            size = entry.size if entry is not None else os.path.getsize(path)
+            if size > cache.slot_size:
+                return None
+            return coalesced_load(
+                key, fill, lambda: cache.get(key, record_stats=False))
+        except OSError:
+            raise Http404("Error reading segment file")
+
+    def _segment_bytes_response(self, data):
+        # Serve segment bytes that are already in memory.
+        return HttpResponse(
+            data,
+            content_type='video/MP2T',
+            status=status.HTTP_200_OK
+        )
+
+
+class VideoManifestView(HLSFileMixin, APIView):
+    """
+    API view to serve HLS manifest (index.m3u8) for a specific video and resolution.
+    Requires JWT authentication.
+    """
+    permission_classes = [IsAuthenticated]
+
     def _read_manifest(self, path):
         # Read and return manifest file content.
         try:
@@ -78,29 +425,13 @@ class VideoManifestView(APIView):
         return self._read_manifest(manifest_path)
 
 
-class VideoSegmentView(APIView):
+class VideoSegmentView(HLSFileMixin, APIView):
     """
     API view to serve HLS video segments for a specific video and resolution.
     Requires JWT authentication.
     """
     permission_classes = [IsAuthenticated]
 
-    def _validate_video(self, movie_id):
-        # Validate that video exists, raise Http404 if not.
-        try:
-            Video.objects.get(id=movie_id)
-        except Video.DoesNotExist:
-            raise Http404("Video not found")
-
-    def _get_segment_path(self, movie_id, resolution, segment):
-        # Construct and validate segment file path.
-        segment_path = os.path.join(
-            settings.MEDIA_ROOT, 'videos', f'{movie_id}', resolution, segment
-        )
-        if not os.path.exists(segment_path):
-            raise Http404("Segment not found")
-        return segment_path
-
     def _serve_segment(self, path):
         # Serve the video segment file.
         try:
@@ -115,5 +446,17 @@ class VideoSegmentView(APIView):
     def get(self, request, movie_id, resolution, segment):
         # Returns a single HLS video segment for a specific movie and resolution.
         self._validate_video(movie_id)
-        segment_path = self._get_segment_path(movie_id, resolution, segment)
-        return self._serve_segment(segment_path)
+        entry = self._get_segment_entry(movie_id, resolution, segment)
+        if should_sample():
+            record_segment_request(movie_id, resolution, segment)
+        data = self._get_cached_segment(movie_id, resolution, segment, entry)
+        if data is None:
+            segment_path = self._get_segment_path(
+                movie_id, resolution, segment, entry)
+            data = self._load_segment(
+                movie_id, resolution, segment, segment_path, entry)
+            if data is None:
+                return self._add_index_headers(
+                    self._serve_segment(segment_path), entry)
+        return self._add_index_headers(
+            self._segment_bytes_response(data), entry)
@@ -0,0 +1,116 @@
+import logging
+import threading
+import time
+from django.conf import settings
+
+from core.redis_client import get_redis
+
+
+logger = logging.getLogger(__name__)
+
+
+class _Call:
+    """
+    A load in progress that other callers can wait on.
+    """
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+
+
+class SingleFlight:
+    """
+    In-process request coalescing.
+    Concurrent calls for the same key wait for one loader and share its
+    result (or its exception).
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls = {}
+
+    def do(self, key, fn):
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = fn()
+            return call.result
+        except Exception as exc:
+            call.error = exc
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+
+
+_single_flight = SingleFlight()
+
+
+def _wait_for_peer(lookup, timeout):
+    # Poll the shared cache while another process loads the key.
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        data = lookup()
+        if data is not None:
+            return data
+        time.sleep(settings.HLS_COALESCE_POLL_INTERVAL)
+    return None
+
+
+def _load_across_processes(key, load, lookup):
+    # Only one process at a time fills the shared cache for a key.
+    data = lookup()
+    if data is not None:
+        return data
+
+    redis = get_redis()
+    if redis is None:
+        return load()
+
+    timeout = settings.HLS_COALESCE_LOCK_TIMEOUT
+    lock = redis.lock(f'hls:fill:{key}', timeout=timeout)
+    try:
+        acquired = lock.acquire(blocking=False)
+    except Exception:
+        logger.warning('Segment fill lock unavailable, loading %s directly', key)
+        return load()
+
+    if not acquired:
+        data = _wait_for_peer(lookup, timeout)
+        if data is not None:
+            return data
+        return load()
+
+    try:
+        return load()
+    finally:
+        try:
+            lock.release()
+        except Exception:
+            pass
+
+
+def coalesced_load(key, load, lookup):
+    """
+    Load key once even if many requests miss it at the same moment.
+
+    Within a process, concurrent callers share a single loader. Across
+    processes, the loader takes a short Redis lock; processes that lose the
+    race poll lookup() (the shared segment cache) until the winner has
+    filled it, and fall back to load() if the lock expires first.
+    """
+    return _single_flight.do(
+        key, lambda: _load_across_processes(key, load, lookup))
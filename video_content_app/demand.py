@@ -0,0 +1,89 @@
+import logging
+import random
+from datetime import datetime, timedelta, timezone
+from django.conf import settings
+
+from core.redis_client import get_redis
+
+
+logger = logging.getLogger(__name__)
+
+TITLE_KEY = 'hls:demand:titles:{bucket}'
+SEGMENT_KEY = 'hls:demand:segments:{bucket}'
+
+
+def _bucket(moment):
+    return moment.strftime('%Y%m%d%H')
+
+
+def _recent_buckets(hours):
+    now = datetime.now(timezone.utc)
+    return [_bucket(now - timedelta(hours=i)) for i in range(hours)]
+
+
+def should_sample():
+    """
+    Decide whether the current segment request is recorded.
+    """
+    rate = settings.HLS_DEMAND_SAMPLE_RATE
+    return rate > 0 and (rate >= 1 or random.random() < rate)
+
+
+def record_segment_request(movie_id, resolution, segment):
+    """
+    Count a sampled segment request in hourly Redis sorted sets.
+    Uses one pipelined round trip; failures never affect playback.
+    """
+    redis = get_redis()
+    if redis is None:
+        return
+    bucket = _bucket(datetime.now(timezone.utc))
+    ttl = (settings.HLS_DEMAND_WINDOW_HOURS + 1) * 3600
+    title_key = TITLE_KEY.format(bucket=bucket)
+    segment_key = SEGMENT_KEY.format(bucket=bucket)
+    try:
+        pipe = redis.pipeline(transaction=False)
+        pipe.zincrby(title_key, 1, str(movie_id))
+        pipe.zincrby(segment_key, 1, f'{movie_id}/{resolution}/{segment}')
+        pipe.expire(title_key, ttl)
+        pipe.expire(segment_key, ttl)
+        pipe.execute()
+    except Exception:
+        logger.debug('Could not record segment demand', exc_info=True)
+
+
+def _top_members(redis, key_template, limit):
+    # Sum the hourly buckets of the demand window and return the top members.
+    keys = [key_template.format(bucket=b)
+            for b in _recent_buckets(settings.HLS_DEMAND_WINDOW_HOURS)]
+    ranking_key = key_template.format(bucket='ranking')
+    pipe = redis.pipeline()
+    pipe.zunionstore(ranking_key, keys)
+    pipe.zrevrange(ranking_key, 0, limit - 1)
+    pipe.delete(ranking_key)
+    members = pipe.execute()[1]
+    return [m.decode() if isinstance(m, bytes) else m for m in members]
+
+
+def top_titles(limit):
+    """
+    Return the ids of the most requested videos in the demand window.
+    """
+    redis = get_redis()
+    if redis is None:
+        return []
+    return [int(member) for member in _top_members(redis, TITLE_KEY, limit)]
+
+
+def top_segments(limit):
+    """
+    Return (movie_id, resolution, segment) of the most requested segments.
+    """
+    redis = get_redis()
+    if redis is None:
+        return []
+    result = []
+    for member in _top_members(redis, SEGMENT_KEY, limit):
+        movie_id, resolution, segment = member.split('/', 2)
+        result.append((int(movie_id), resolution, segment))
+    return result
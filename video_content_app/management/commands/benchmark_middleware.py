@@ -0,0 +1,72 @@
+import timeit
+from django.conf import settings
+from django.core.handlers.base import BaseHandler
+from django.core.management.base import BaseCommand
+from django.http import HttpResponse
+from django.test import RequestFactory, override_settings
+from django.urls import re_path
+from django.utils.module_loading import import_string
+
+from core.middleware import FastPathMixin
+
+
+def _view(request, *args, **kwargs):
+    return HttpResponse(b'segment', content_type='video/mp2t')
+
+
+# Resolved via request.urlconf, so only the middleware stack is measured.
+urlpatterns = [re_path(r'', _view)]
+
+
+def _stock_middleware():
+    # settings.MIDDLEWARE with every fast-path class replaced by its base.
+    stock = []
+    for path in settings.MIDDLEWARE:
+        cls = import_string(path)
+        if issubclass(cls, FastPathMixin):
+            base = cls.__bases__[1]
+            path = f'{base.__module__}.{base.__qualname__}'
+        stock.append(path)
+    return stock
+
+
+class Command(BaseCommand):
+    """
+    Compare the per-request overhead of the stock middleware stack with
+    the fast-path stack for an HLS segment URL and an admin URL.
+    """
+    help = 'Benchmark middleware overhead with and without the API fast path.'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--requests', type=int, default=20000,
+            help='Requests per measurement (default: 20000).')
+
+    def _measure(self, middleware, path, count):
+        factory = RequestFactory()
+
+        def request():
+            req = factory.get(path, HTTP_COOKIE='access_token=x; csrftoken=y')
+            req.urlconf = __name__
+            handler.get_response(req)
+
+        with override_settings(MIDDLEWARE=middleware,
+                               ALLOWED_HOSTS=['testserver']):
+            handler = BaseHandler()
+            handler.load_middleware()
+            return timeit.timeit(request, number=count) / count * 1e6
+
+    def handle(self, *args, **options):
+        count = options['requests']
+        segment = '/api/video/1/480p/000.ts'
+        stacks = [
+            ('stock', _stock_middleware()),
+            ('fast path', list(settings.MIDDLEWARE)),
+        ]
+
+        self.stdout.write(f'{count} requests per measurement')
+        for path in [segment, '/admin/']:
+            for name, middleware in stacks:
+                micros = self._measure(middleware, path, count)
+                self.stdout.write(
+                    f'{path:<28} {name:<10} {micros:8.1f} us/request')
@@ -0,0 +1,102 @@
+import base64
+import timeit
+from datetime import datetime, timedelta, timezone
+from django.core.management.base import BaseCommand
+
+from rest_framework.renderers import JSONRenderer
+
+from core.renderers import MessagePackRenderer, ORJSONRenderer
+from video_content_app.models import Video
+from video_content_app.segment_index import RESOLUTIONS
+
+
+class Command(BaseCommand):
+    """
+    Compare render time and payload size of the API renderers
+    on a synthetic catalog page shaped like the video list output.
+    """
+    help = 'Benchmark the JSON and MessagePack renderers.'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--videos', type=int, default=200,
+            help='Number of videos per rendered page (default: 200).')
+        parser.add_argument(
+            '--iterations', type=int, default=200,
+            help='Renders per renderer (default: 200).')
+
+    def _srcset(self, i):
+        base = f'http://localhost:8000/media/thumbnail/variants/{i}'
+        return {
+            fmt: ', '.join(f'{base}/{width}.{fmt} {width}w'
+                           for width in (320, 640, 1280))
+            for fmt in ('webp', 'jpeg')
+        }
+
+    def _renditions(self):
+        renditions = []
+        for resolution, spec in RESOLUTIONS.items():
+            width, height = (int(n) for n in spec['size'].split('x'))
+            renditions.append({
+                'resolution': resolution,
+                'width': width,
+                'height': height,
+                'bitrate': int(spec['bitrate'].rstrip('k')) * 1000,
+                'segment_count': 60,
+                'total_bytes': int(spec['bitrate'].rstrip('k')) * 75000,
+            })
+        return renditions
+
+    def _catalog(self, count):
+        # Realistic page: long descriptions, absolute thumbnail URLs,
+        # srcset strings, inline placeholders, metadata and renditions.
+        categories = [c for c, _ in Video.CATEGORY_CHOICES]
+        start = datetime(2024, 1, 1, tzinfo=timezone.utc)
+        placeholder = 'data:image/webp;base64,' + base64.b64encode(
+            bytes(range(256))[:220]).decode('ascii')
+        return {
+            'next': 'http://localhost:8000/api/video/?cursor=MjAyNC0wMS0wMXwx',
+            'results': [
+                {
+                    'id': i,
+                    'created_at': (start + timedelta(minutes=i))
+                    .strftime('%Y-%m-%dT%H:%M:%SZ'),
+                    'title': f'Video title number {i}',
+                    'description': 'A fairly long video description. ' * 12,
+                    'thumbnail_url':
+                        f'http://localhost:8000/media/thumbnail/{i}.jpg',
+                    'thumbnail_srcset': self._srcset(i),
+                    'thumbnail_placeholder': placeholder,
+                    'category': categories[i % len(categories)],
+                    'duration': 600.0 + i,
+                    'width': 1920,
+                    'height': 1080,
+                    'renditions': self._renditions(),
+                }
+                for i in range(count)
+            ],
+        }
+
+    def handle(self, *args, **options):
+        data = self._catalog(options['videos'])
+        iterations = options['iterations']
+        renderers = [
+            ('DRF JSONRenderer', JSONRenderer()),
+            ('ORJSONRenderer', ORJSONRenderer()),
+            ('MessagePackRenderer', MessagePackRenderer()),
+        ]
+
+        self.stdout.write(
+            f"{options['videos']} videos, {iterations} iterations")
+        baseline = None
+        for name, renderer in renderers:
+            payload = renderer.render(data, renderer.media_type)
+            seconds = timeit.timeit(
+                lambda: renderer.render(data, renderer.media_type),
+                number=iterations)
+            per_render = seconds / iterations * 1000
+            baseline = baseline or per_render
+            self.stdout.write(
+                f'{name:<20} {per_render:8.3f} ms/render '
+                f'{baseline / per_render:6.1f}x '
+                f'{len(payload):>9} bytes')
@@ -0,0 +1,43 @@
+import os
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from video_content_app.segment_index import (
+    INDEX_FILENAME,
+    MANIFEST_FILENAME,
+    RESOLUTIONS,
+    build_rendition_index,
+)
+
+
+class Command(BaseCommand):
+    """
+    Write segment indexes for renditions transcoded before indexes existed.
+    """
+    help = 'Build segments.json for every HLS rendition missing one.'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--force', action='store_true',
+            help='Rebuild indexes that already exist.')
+
+    def handle(self, *args, **options):
+        videos_dir = os.path.join(settings.MEDIA_ROOT, 'videos')
+        if not os.path.isdir(videos_dir):
+            self.stdout.write('No HLS renditions found.')
+            return
+
+        built = 0
+        for video_id in sorted(os.listdir(videos_dir)):
+            for resolution in RESOLUTIONS:
+                output_dir = os.path.join(videos_dir, video_id, resolution)
+                if not os.path.isfile(os.path.join(output_dir, MANIFEST_FILENAME)):
+                    continue
+                if (os.path.isfile(os.path.join(output_dir, INDEX_FILENAME))
+                        and not options['force']):
+                    continue
+                build_rendition_index(output_dir)
+                built += 1
+
+        self.stdout.write(self.style.SUCCESS(
+            f'Built {built} segment index(es).'))
@@ -0,0 +1,29 @@
+from django.core.management.base import BaseCommand
+
+from video_content_app.models import Video
+from video_content_app.tasks import generate_thumbnail_variants
+
+
+class Command(BaseCommand):
+    """
+    Build thumbnail derivatives for videos uploaded before they existed.
+    """
+    help = 'Build resized WebP/JPEG thumbnails for every video missing them.'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--force', action='store_true',
+            help='Rebuild derivatives that already exist.')
+
+    def handle(self, *args, **options):
+        videos = Video.objects.exclude(thumbnail='').exclude(thumbnail=None)
+        if not options['force']:
+            videos = videos.filter(thumbnail_variants={})
+
+        built = 0
+        for video_id in videos.values_list('id', flat=True).iterator():
+            if generate_thumbnail_variants(video_id):
+                built += 1
+
+        self.stdout.write(self.style.SUCCESS(
+            f'Built thumbnail variants for {built} video(s).'))
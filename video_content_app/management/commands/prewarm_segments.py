@@ -0,0 +1,31 @@
+import django_rq
+from django.core.management.base import BaseCommand
+
+from video_content_app.tasks import prewarm_popular_segments
+
+
+class Command(BaseCommand):
+    """
+    Prewarm the page cache with the most requested HLS segments.
+    Run on deploy and periodically (e.g. every 15 minutes via cron).
+    """
+    help = 'Prewarm segments of the most requested titles.'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--top', type=int, default=None,
+            help='Number of titles to prewarm (default: HLS_PREWARM_TOP_N).')
+        parser.add_argument(
+            '--enqueue', action='store_true',
+            help='Run as RQ job on the default queue instead of inline.')
+
+    def handle(self, *args, **options):
+        if options['enqueue']:
+            queue = django_rq.get_queue('default', autocommit=True)
+            job = queue.enqueue(prewarm_popular_segments, options['top'])
+            self.stdout.write(f'Enqueued prewarm job {job.id}.')
+            return
+
+        warmed = prewarm_popular_segments(options['top'])
+        self.stdout.write(self.style.SUCCESS(
+            f'Prewarmed {warmed} segment files.'))
@@ -0,0 +1,29 @@
+from django.core.management.base import BaseCommand
+
+from video_content_app.segment_cache import get_segment_cache
+
+
+class Command(BaseCommand):
+    """
+    Print hit/miss counters and usage of the shared hot segment cache.
+    """
+    help = 'Show statistics of the shared-memory HLS segment cache.'
+
+    def handle(self, *args, **options):
+        cache = get_segment_cache()
+        if cache is None:
+            self.stdout.write('Segment cache is disabled '
+                              '(HLS_SEGMENT_CACHE_SLOTS=0).')
+            return
+
+        stats = cache.stats()
+        lookups = stats['hits'] + stats['misses']
+        hit_ratio = stats['hits'] / lookups if lookups else 0.0
+        self.stdout.write(f"Path:       {cache.path}")
+        self.stdout.write(f"Hits:       {stats['hits']}")
+        self.stdout.write(f"Misses:     {stats['misses']}")
+        self.stdout.write(f"Hit ratio:  {hit_ratio:.1%}")
+        self.stdout.write(
+            f"Slots used: {stats['slots_used']}/{stats['slots']}")
+        self.stdout.write(
+            f"Bytes used: {stats['bytes_used']}/{stats['capacity_bytes']}")
@@ -0,0 +1,95 @@
+import json
+import logging
+import subprocess
+from django.db import transaction
+
+from video_content_app.api.cache import bump_catalog_version
+from video_content_app.models import Rendition, Video
+from video_content_app.segment_index import (
+    RESOLUTIONS,
+    clear_index_cache,
+    get_rendition_index,
+)
+
+
+logger = logging.getLogger(__name__)
+
+
+def probe_video(source_path):
+    """
+    Return duration (seconds), width and height of a video via ffprobe.
+    Returns an empty dict if the file cannot be probed.
+    """
+    cmd = [
+        'ffprobe',
+        '-v', 'error',
+        '-select_streams', 'v:0',
+        '-show_entries', 'stream=width,height:format=duration',
+        '-of', 'json',
+        source_path
+    ]
+    try:
+        result = subprocess.run(
+            cmd, check=True, capture_output=True, text=True)
+        data = json.loads(result.stdout)
+    except (OSError, subprocess.CalledProcessError, ValueError):
+        logger.warning('Could not probe %s', source_path, exc_info=True)
+        return {}
+
+    stream = (data.get('streams') or [{}])[0]
+    duration = data.get('format', {}).get('duration')
+    return {
+        'duration': float(duration) if duration else None,
+        'width': stream.get('width'),
+        'height': stream.get('height'),
+    }
+
+
+def _build_rendition(video_id, resolution, index):
+    params = RESOLUTIONS[resolution]
+    width, height = (int(n) for n in params['size'].split('x'))
+    return Rendition(
+        video_id=video_id,
+        resolution=resolution,
+        width=width,
+        height=height,
+        bitrate=int(params['bitrate'].rstrip('k')) * 1000,
+        segment_count=len(index.segments),
+        total_bytes=index.manifest_size + sum(
+            entry.size for entry in index.segments.values()),
+    )
+
+
+def store_video_metadata(video_id, probe=None):
+    """
+    Persist probed metadata and the available renditions of a video.
+
+    Renditions are read from their segment indexes. Without a probed
+    duration it is summed from the segment durations. Values missing
+    from probe are left unchanged.
+    """
+    if not Video.objects.filter(pk=video_id).exists():
+        return None
+
+    clear_index_cache(video_id)
+    renditions, duration = [], None
+    for resolution in RESOLUTIONS:
+        index = get_rendition_index(video_id, resolution)
+        if index is None:
+            continue
+        renditions.append(_build_rendition(video_id, resolution, index))
+        if duration is None:
+            duration = sum(
+                entry.duration or 0.0 for entry in index.segments.values())
+
+    fields = {'duration': duration} if duration else {}
+    fields.update({k: v for k, v in (probe or {}).items() if v is not None})
+
+    with transaction.atomic():
+        if fields:
+            Video.objects.filter(pk=video_id).update(**fields)
+        Rendition.objects.filter(video_id=video_id).delete()
+        Rendition.objects.bulk_create(renditions)
+    # update() and bulk_create() skip the signal handlers.
+    bump_catalog_version()
+    return renditions
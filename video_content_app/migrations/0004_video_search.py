@@ -0,0 +1,71 @@
+import django.contrib.postgres.search
+from django.contrib.postgres.operations import TrigramExtension
+from django.db import migrations
+
+
+FORWARD_SQL = [
+    """
+    CREATE OR REPLACE FUNCTION video_search_vector_update() RETURNS trigger AS $$
+    BEGIN
+        NEW.search_vector :=
+            setweight(to_tsvector('english', coalesce(NEW.title, '')), 'A') ||
+            setweight(to_tsvector('english', coalesce(NEW.description, '')), 'B');
+        RETURN NEW;
+    END
+    $$ LANGUAGE plpgsql;
+    """,
+    """
+    CREATE TRIGGER video_search_vector_trigger
+    BEFORE INSERT OR UPDATE ON video_content_app_video
+    FOR EACH ROW EXECUTE FUNCTION video_search_vector_update();
+    """,
+    # Fires the trigger once for every existing row.
+    "UPDATE video_content_app_video SET title = title;",
+    """
+    CREATE INDEX video_search_vector_idx
+    ON video_content_app_video USING gin (search_vector);
+    """,
+    # Django compiles istartswith/icontains to UPPER(title) LIKE UPPER(...),
+    # so the trigram index is built on the same expression.
+    """
+    CREATE INDEX video_title_trgm_idx
+    ON video_content_app_video USING gin (UPPER(title) gin_trgm_ops);
+    """,
+]
+
+BACKWARD_SQL = [
+    "DROP INDEX IF EXISTS video_title_trgm_idx;",
+    "DROP INDEX IF EXISTS video_search_vector_idx;",
+    "DROP TRIGGER IF EXISTS video_search_vector_trigger "
+    "ON video_content_app_video;",
+    "DROP FUNCTION IF EXISTS video_search_vector_update();",
+]
+
+
+def _run_on_postgres(statements):
+    def run(apps, schema_editor):
+        if schema_editor.connection.vendor != 'postgresql':
+            return
+        for statement in statements:
+            schema_editor.execute(statement)
+    return run
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('video_content_app', '0003_video_category_created_index'),
+    ]
+
+    operations = [
+        TrigramExtension(),
+        migrations.AddField(
+            model_name='video',
+            name='search_vector',
+            field=django.contrib.postgres.search.SearchVectorField(editable=False, null=True),
+        ),
+        migrations.RunPython(
+            _run_on_postgres(FORWARD_SQL),
+            _run_on_postgres(BACKWARD_SQL),
+        ),
+    ]
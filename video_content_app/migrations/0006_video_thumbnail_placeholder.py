@@ -0,0 +1,18 @@
+# Generated by Django 5.2.9 on 2026-10-19 08:26
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('video_content_app', '0005_video_thumbnail_variants'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='video',
+            name='thumbnail_placeholder',
+            field=models.CharField(blank=True, default='', editable=False, max_length=1024),
+        ),
+    ]
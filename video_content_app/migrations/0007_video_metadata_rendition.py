@@ -0,0 +1,46 @@
+# Generated by Django 5.2.9 on 2026-10-19 08:28
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('video_content_app', '0006_video_thumbnail_placeholder'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='video',
+            name='duration',
+            field=models.FloatField(blank=True, editable=False, null=True),
+        ),
+        migrations.AddField(
+            model_name='video',
+            name='height',
+            field=models.PositiveIntegerField(blank=True, editable=False, null=True),
+        ),
+        migrations.AddField(
+            model_name='video',
+            name='width',
+            field=models.PositiveIntegerField(blank=True, editable=False, null=True),
+        ),
+        migrations.CreateModel(
+            name='Rendition',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('resolution', models.CharField(max_length=10)),
+                ('width', models.PositiveIntegerField()),
+                ('height', models.PositiveIntegerField()),
+                ('bitrate', models.PositiveIntegerField(help_text='Video bitrate in bit/s')),
+                ('segment_count', models.PositiveIntegerField()),
+                ('total_bytes', models.PositiveBigIntegerField()),
+                ('video', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='renditions', to='video_content_app.video')),
+            ],
+            options={
+                'ordering': ['video_id', 'height'],
+                'constraints': [models.UniqueConstraint(fields=('video', 'resolution'), name='rendition_video_resolution_uniq')],
+            },
+        ),
+    ]
@@ -1,3 +1,4 @@
+from django.contrib.postgres.search import SearchVectorField
 from django.db import models
 
 
@@ -23,9 +24,57 @@ class Video(models.Model):
         upload_to='thumbnail/', blank=True, null=True)
     category = models.CharField(max_length=50, choices=CATEGORY_CHOICES)
     video_file = models.FileField(upload_to='videos/', blank=True, null=True)
+    # Resized thumbnail derivatives: {format: {width: name}}
+    thumbnail_variants = models.JSONField(
+        default=dict, blank=True, editable=False)
+    # Tiny WebP data URI shown while the thumbnail loads
+    thumbnail_placeholder = models.CharField(
+        max_length=1024, blank=True, default='', editable=False)
+    # Technical metadata of the source, filled in after transcoding
+    duration = models.FloatField(null=True, blank=True, editable=False)
+    width = models.PositiveIntegerField(null=True, blank=True, editable=False)
+    height = models.PositiveIntegerField(
+        null=True, blank=True, editable=False)
+    # Weighted title/description tsvector, maintained by a database trigger
+    search_vector = SearchVectorField(null=True, editable=False)
 
     class Meta:
-        ordering = ['-created_at']
+        ordering = ['-created_at', '-id']
+        indexes = [
+            # Keyset pagination of the video list (see api/pagination.py)
+            models.Index(fields=['-created_at', '-id'],
+                         name='video_created_id_idx'),
+            # Newest videos per category for the dashboard rows
+            models.Index(fields=['category', '-created_at', '-id'],
+                         name='video_category_created_idx'),
+            # The GIN search indexes are Postgres-only and are created in
+            # migration 0004 so the SQLite test database still builds.
+        ]
 
     def __str__(self):
         return self.title
+
+
+class Rendition(models.Model):
+    """
+    Model representing a transcoded HLS rendition of a video.
+    """
+    video = models.ForeignKey(
+        Video, on_delete=models.CASCADE, related_name='renditions')
+    resolution = models.CharField(max_length=10)
+    width = models.PositiveIntegerField()
+    height = models.PositiveIntegerField()
+    bitrate = models.PositiveIntegerField(help_text='Video bitrate in bit/s')
+    segment_count = models.PositiveIntegerField()
+    total_bytes = models.PositiveBigIntegerField()
+
+    class Meta:
+        ordering = ['video_id', 'height']
+        constraints = [
+            models.UniqueConstraint(
+                fields=['video', 'resolution'],
+                name='rendition_video_resolution_uniq'),
+        ]
+
+    def __str__(self):
+        return f'{self.video_id} {self.resolution}'
@@ -0,0 +1,68 @@
+from django.contrib.postgres.search import (
+    SearchQuery,
+    SearchRank,
+    TrigramSimilarity,
+)
+from django.db import connections
+from django.db.models import F, Q
+
+from video_content_app.models import Video
+
+
+SEARCH_CONFIG = 'english'
+
+
+def _is_postgres(queryset):
+    return connections[queryset.db].vendor == 'postgresql'
+
+
+def _search_query(term):
+    return SearchQuery(term, config=SEARCH_CONFIG, search_type='websearch')
+
+
+def search_filter(queryset, term):
+    """
+    Restrict queryset to videos matching term, without ordering.
+
+    On Postgres this matches the indexed search vector or, via the
+    trigram index, titles containing term. Other databases fall back to
+    case-insensitive substring matching.
+    """
+    if _is_postgres(queryset):
+        return queryset.filter(
+            Q(search_vector=_search_query(term)) | Q(title__icontains=term))
+    return queryset.filter(
+        Q(title__icontains=term) | Q(description__icontains=term))
+
+
+def search_videos(term, category=None):
+    """
+    Return videos matching term, best matches first.
+    Title matches rank above description matches.
+    """
+    queryset = Video.objects.all()
+    if category:
+        queryset = queryset.filter(category=category)
+
+    if not _is_postgres(queryset):
+        return search_filter(queryset, term)
+
+    query = _search_query(term)
+    return queryset.filter(search_vector=query).annotate(
+        rank=SearchRank(F('search_vector'), query),
+    ).order_by('-rank', '-created_at', '-id')
+
+
+def autocomplete_titles(prefix, limit):
+    """
+    Return (id, title) dicts of videos whose title starts with prefix.
+    On Postgres the closest titles by trigram similarity come first.
+    """
+    queryset = Video.objects.filter(title__istartswith=prefix)
+    if _is_postgres(queryset):
+        queryset = queryset.annotate(
+            similarity=TrigramSimilarity('title', prefix),
+        ).order_by('-similarity', 'title')
+    else:
+        queryset = queryset.order_by('title')
+    return list(queryset.values('id', 'title')[:limit])
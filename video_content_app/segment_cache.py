@@ -0,0 +1,217 @@
+import fcntl
+import hashlib
+import mmap
+import os
+import struct
+import threading
+from django.conf import settings
+
+MAGIC = b'VFSEGC01'
+WAYS = 4
+
+# magic, sets, ways, slot_size, hits, misses, clock
+HEADER = struct.Struct('<8sIIQQQQ')
+HEADER_SIZE = 64
+# seq, digest, length, last_used, hits
+SLOT = struct.Struct('<Q16sQQQ')
+SLOT_SIZE = 64
+
+_HITS_OFFSET = 24
+_MISSES_OFFSET = 32
+_CLOCK_OFFSET = 40
+
+
+def segment_key(movie_id, resolution, segment, checksum=None):
+    """
+    Build the cache key for a single HLS segment.
+    Pass the checksum from the segment index, so a re-transcoded segment
+    never matches the bytes cached for the old one.
+    """
+    key = f'{movie_id}/{resolution}/{segment}'
+    if checksum is not None:
+        key = f'{key}@{checksum}'
+    return key
+
+
+class SharedSegmentCache:
+    """
+    Size-bounded segment byte cache shared by all worker processes of a host.
+
+    The cache lives in a single mmap'ed file (normally on /dev/shm) split into
+    fixed-size slots. Slots are grouped into 4-way sets by key digest, so a
+    lookup touches at most four slot headers. Eviction is LFU with aging and
+    LRU as tie-breaker, which keeps the hot first segments of popular titles
+    resident while long-tail segments churn through the remaining ways.
+
+    Writers serialize on flock(); readers are lock-free and use a per-slot
+    sequence number to detect a concurrent overwrite. Hit/miss counters are
+    updated without locking and are therefore approximate.
+    """
+
+    def __init__(self, path, slots, slot_size):
+        self.path = path
+        self.sets = max(1, slots // WAYS)
+        self.slots = self.sets * WAYS
+        self.slot_size = slot_size
+        self._table_size = HEADER_SIZE + self.slots * SLOT_SIZE
+        self._size = self._table_size + self.slots * slot_size
+        self._pid = None
+        self._fd = None
+        self._mm = None
+        self._local_lock = threading.Lock()
+
+    def _open(self):
+        # (Re)map the shared file; file locks must not be shared across fork.
+        if self._pid == os.getpid():
+            return
+        with self._local_lock:
+            if self._pid != os.getpid():
+                self._map()
+
+    def _map(self):
+        fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o600)
+        fcntl.flock(fd, fcntl.LOCK_EX)
+        try:
+            if os.fstat(fd).st_size != self._size or not self._valid(fd):
+                os.ftruncate(fd, 0)
+                os.ftruncate(fd, self._size)
+                os.pwrite(fd, HEADER.pack(
+                    MAGIC, self.sets, WAYS, self.slot_size, 0, 0, 0), 0)
+        finally:
+            fcntl.flock(fd, fcntl.LOCK_UN)
+        self._fd = fd
+        self._mm = mmap.mmap(fd, self._size, mmap.MAP_SHARED)
+        self._pid = os.getpid()
+
+    def _valid(self, fd):
+        magic, sets, ways, slot_size = HEADER.unpack(
+            os.pread(fd, HEADER.size, 0))[:4]
+        return (magic, sets, ways, slot_size) == (
+            MAGIC, self.sets, WAYS, self.slot_size)
+
+    def _digest(self, key):
+        return hashlib.blake2b(key.encode(), digest_size=16).digest()
+
+    def _set_slots(self, digest):
+        first = (int.from_bytes(digest[:8], 'little') % self.sets) * WAYS
+        return range(first, first + WAYS)
+
+    def _slot_offset(self, slot):
+        return HEADER_SIZE + slot * SLOT_SIZE
+
+    def _data_offset(self, slot):
+        return self._table_size + slot * self.slot_size
+
+    def _bump(self, offset):
+        # Unlocked increment of a shared counter (lost updates are acceptable).
+        value = struct.unpack_from('<Q', self._mm, offset)[0] + 1
+        struct.pack_into('<Q', self._mm, offset, value)
+        return value
+
+    def get(self, key, record_stats=True):
+        """
+        Return the cached bytes for key, or None on a miss.
+        Pass record_stats=False for internal re-checks that should not
+        count as client lookups.
+        """
+        self._open()
+        mm = self._mm
+        digest = self._digest(key)
+        for slot in self._set_slots(digest):
+            offset = self._slot_offset(slot)
+            seq, slot_digest, length, _, hits = SLOT.unpack_from(mm, offset)
+            if seq & 1 or slot_digest != digest:
+                continue
+            start = self._data_offset(slot)
+            data = mm[start:start + length]
+            if struct.unpack_from('<Q', mm, offset)[0] != seq:
+                break
+            if record_stats:
+                tick = self._bump(_CLOCK_OFFSET)
+                struct.pack_into('<QQ', mm, offset + 32, tick, hits + 1)
+                self._bump(_HITS_OFFSET)
+            return data
+        if record_stats:
+            self._bump(_MISSES_OFFSET)
+        return None
+
+    def put(self, key, data):
+        """
+        Store data under key. Returns False if it does not fit into a slot.
+        """
+        if len(data) > self.slot_size:
+            return False
+        self._open()
+        mm = self._mm
+        digest = self._digest(key)
+        with self._local_lock:
+            fcntl.flock(self._fd, fcntl.LOCK_EX)
+            try:
+                victim = None
+                victim_rank = None
+                for slot in self._set_slots(digest):
+                    offset = self._slot_offset(slot)
+                    seq, slot_digest, length, last_used, hits = SLOT.unpack_from(
+                        mm, offset)
+                    if slot_digest == digest:
+                        return True
+                    rank = (hits, last_used) if length else (-1, 0)
+                    if victim_rank is None or rank < victim_rank:
+                        victim, victim_rank = slot, rank
+                    # Age the set so formerly hot segments can be evicted.
+                    struct.pack_into('<Q', mm, offset + 40, hits >> 1)
+
+                offset = self._slot_offset(victim)
+                seq = struct.unpack_from('<Q', mm, offset)[0]
+                struct.pack_into('<Q', mm, offset, seq + 1)
+                start = self._data_offset(victim)
+                mm[start:start + len(data)] = data
+                tick = self._bump(_CLOCK_OFFSET)
+                SLOT.pack_into(mm, offset, seq + 1, digest, len(data), tick, 0)
+                struct.pack_into('<Q', mm, offset, seq + 2)
+                return True
+            finally:
+                fcntl.flock(self._fd, fcntl.LOCK_UN)
+
+    def stats(self):
+        """
+        Return shared hit/miss counters and slot usage.
+        """
+        self._open()
+        hits, misses = struct.unpack_from('<QQ', self._mm, _HITS_OFFSET)
+        used = 0
+        used_bytes = 0
+        for slot in range(self.slots):
+            length = SLOT.unpack_from(self._mm, self._slot_offset(slot))[2]
+            if length:
+                used += 1
+                used_bytes += length
+        return {
+            'hits': hits,
+            'misses': misses,
+            'slots': self.slots,
+            'slots_used': used,
+            'bytes_used': used_bytes,
+            'capacity_bytes': self.slots * self.slot_size,
+        }
+
+
+_cache = None
+
+
+def get_segment_cache():
+    """
+    Return the process-wide shared segment cache, or None if disabled.
+    Configured via HLS_SEGMENT_CACHE_* settings; SLOTS=0 disables it.
+    """
+    global _cache
+    config = (
+        settings.HLS_SEGMENT_CACHE_PATH,
+        settings.HLS_SEGMENT_CACHE_SLOTS,
+        settings.HLS_SEGMENT_CACHE_SLOT_SIZE,
+    )
+    if config[1] <= 0:
+        return None
+    if _cache is None or _cache[0] != config:
+        _cache = (config, SharedSegmentCache(*config))
+    return _cache[1]
@@ -0,0 +1,159 @@
+import hashlib
+import json
+import os
+import re
+import threading
+import time
+from collections import namedtuple
+from django.conf import settings
+
+
+RESOLUTIONS = {
+    '480p': {'size': '854x480', 'bitrate': '1000k'},
+    '720p': {'size': '1280x720', 'bitrate': '2500k'},
+    '1080p': {'size': '1920x1080', 'bitrate': '5000k'},
+}
+
+INDEX_FILENAME = 'segments.json'
+MANIFEST_FILENAME = 'index.m3u8'
+SEGMENT_NAME_RE = re.compile(r'^[A-Za-z0-9_-]{1,64}\.ts$')
+
+# Renditions without an index (e.g. transcoded before indexes existed, or
+# still transcoding) are re-checked after this many seconds.
+MISSING_INDEX_TTL = 30
+# Loaded indexes are compared against their file after this many seconds,
+# so a rebuilt index (e.g. a re-transcode) reaches every worker process.
+INDEX_REVALIDATE_INTERVAL = 5
+
+SegmentEntry = namedtuple('SegmentEntry', ['size', 'duration', 'checksum'])
+RenditionIndex = namedtuple('RenditionIndex', ['manifest_size', 'segments'])
+
+
+def is_valid_resolution(resolution):
+    return resolution in RESOLUTIONS
+
+
+def is_valid_segment_name(segment):
+    return SEGMENT_NAME_RE.match(segment) is not None
+
+
+def rendition_dir(movie_id, resolution):
+    return os.path.join(
+        settings.MEDIA_ROOT, 'videos', f'{movie_id}', resolution)
+
+
+def parse_manifest(manifest_path):
+    """
+    Return [(segment_name, duration)] of an HLS playlist in order.
+    """
+    segments = []
+    duration = None
+    with open(manifest_path, 'r', encoding='utf-8') as f:
+        for line in f:
+            line = line.strip()
+            if line.startswith('#EXTINF:'):
+                duration = float(line[len('#EXTINF:'):].split(',', 1)[0])
+            elif line and not line.startswith('#'):
+                segments.append((line, duration))
+                duration = None
+    return segments
+
+
+def _checksum(path):
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def build_rendition_index(output_dir):
+    """
+    Write segments.json for a transcoded rendition directory.
+    Stores size, duration and sha256 of every segment listed in the manifest,
+    so the streaming views never need to stat() segment files.
+    """
+    manifest_path = os.path.join(output_dir, MANIFEST_FILENAME)
+    segments = {}
+    for name, duration in parse_manifest(manifest_path):
+        path = os.path.join(output_dir, name)
+        segments[name] = [os.path.getsize(path), duration, _checksum(path)]
+
+    index = {
+        'manifest_size': os.path.getsize(manifest_path),
+        'segments': segments,
+    }
+    tmp_path = os.path.join(output_dir, INDEX_FILENAME + '.tmp')
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(index, f, separators=(',', ':'))
+    os.replace(tmp_path, os.path.join(output_dir, INDEX_FILENAME))
+    return index
+
+
+_lock = threading.Lock()
+_indexes = {}
+
+
+def _index_path(movie_id, resolution):
+    return os.path.join(rendition_dir(movie_id, resolution), INDEX_FILENAME)
+
+
+def _index_version(path):
+    # Changes whenever build_rendition_index replaces the file.
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+
+def _load_index(path):
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            raw = json.load(f)
+    except (OSError, ValueError):
+        return None
+    return RenditionIndex(
+        manifest_size=raw['manifest_size'],
+        segments={name: SegmentEntry(*entry)
+                  for name, entry in raw['segments'].items()},
+    )
+
+
+def get_rendition_index(movie_id, resolution):
+    """
+    Return the cached RenditionIndex for a rendition, or None if the
+    rendition has no index. Indexes are loaded once per process and
+    reloaded when the index file changes.
+    """
+    key = (int(movie_id), resolution)
+    path = _index_path(movie_id, resolution)
+    now = time.monotonic()
+    cached = _indexes.get(key)
+    if cached is not None:
+        index, version, checked = cached
+        ttl = INDEX_REVALIDATE_INTERVAL if index is not None else MISSING_INDEX_TTL
+        if now - checked < ttl:
+            return index
+        if index is not None and _index_version(path) == version:
+            with _lock:
+                _indexes[key] = (index, version, now)
+            return index
+
+    version = _index_version(path)
+    index = _load_index(path) if version is not None else None
+    with _lock:
+        _indexes[key] = (index, version, now)
+    return index
+
+
+def clear_index_cache(movie_id=None):
+    """
+    Drop cached indexes, either for one video or for all videos.
+    """
+    with _lock:
+        if movie_id is None:
+            _indexes.clear()
+        else:
+            for key in [k for k in _indexes if k[0] == int(movie_id)]:
+                del _indexes[key]
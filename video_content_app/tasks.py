@@ -1,22 +1,44 @@
 import subprocess
 import os
+import logging
 from django.conf import settings
 
+from video_content_app.api.cache import bump_catalog_version
+from video_content_app.demand import top_segments, top_titles
+from video_content_app.metadata import probe_video, store_video_metadata
+from video_content_app.models import Video
+from video_content_app.segment_index import (
+    MANIFEST_FILENAME,
+    RESOLUTIONS,
+    build_rendition_index,
+    get_rendition_index,
+    is_valid_resolution,
+    is_valid_segment_name,
+    parse_manifest,
+    rendition_dir,
+)
+from video_content_app.thumbnails import (
+    build_placeholder,
+    build_variants,
+    open_thumbnail,
+    remove_variants,
+)
+
+
+logger = logging.getLogger(__name__)
+
 
 def convert_to_hls(source_path, video_id):
     """
     Convert the given video to HLS format with multiple resolutions.
     Creates directory structure: media/videos/<video_id>/<resolution>/
+    and writes a segment index next to each rendition's manifest.
+    Stores duration, resolution and the renditions on the video afterwards.
     """
     base_dir = os.path.join(settings.MEDIA_ROOT, 'videos', str(video_id))
+    probe = probe_video(source_path)
 
-    resolutions = {
-        '480p': {'size': '854x480', 'bitrate': '1000k'},
-        '720p': {'size': '1280x720', 'bitrate': '2500k'},
-        '1080p': {'size': '1920x1080', 'bitrate': '5000k'},
-    }
-
-    for resolution, params in resolutions.items():
+    for resolution, params in RESOLUTIONS.items():
         output_dir = os.path.join(base_dir, resolution)
         os.makedirs(output_dir, exist_ok=True)
 
@@ -37,6 +59,9 @@ def convert_to_hls(source_path, video_id):
             output_path
         ]
         subprocess.run(cmd, check=True)
+        build_rendition_index(output_dir)
+
+    store_video_metadata(video_id, probe)
 
 
 def delete_original_video(source_path):
@@ -45,3 +70,115 @@ def delete_original_video(source_path):
     """
     if os.path.isfile(source_path):
         os.remove(source_path)
+
+
+def _prewarm_file(path):
+    """
+    Ask the kernel to pull a file into the page cache.
+    Falls back to reading it where posix_fadvise is unavailable.
+    """
+    try:
+        fd = os.open(path, os.O_RDONLY)
+    except OSError:
+        return False
+    try:
+        if hasattr(os, 'posix_fadvise'):
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_WILLNEED)
+        else:
+            while os.read(fd, 1024 * 1024):
+                pass
+        return True
+    finally:
+        os.close(fd)
+
+
+def _opening_segments(video_id, resolution, seconds):
+    # Segment names covering the first `seconds` of a rendition.
+    index = get_rendition_index(video_id, resolution)
+    if index is not None:
+        playlist = [(name, entry.duration)
+                    for name, entry in index.segments.items()]
+    else:
+        manifest_path = os.path.join(
+            rendition_dir(video_id, resolution), MANIFEST_FILENAME)
+        if not os.path.isfile(manifest_path):
+            return []
+        playlist = parse_manifest(manifest_path)
+
+    names = []
+    covered = 0.0
+    for name, duration in playlist:
+        if covered >= seconds:
+            break
+        names.append(name)
+        covered += duration or 0.0
+    return names
+
+
+def prewarm_video(video_id, seconds=None):
+    """
+    Prewarm the opening minutes of every rendition of a video.
+    Enqueued when a new release finishes transcoding.
+    """
+    seconds = seconds or settings.HLS_PREWARM_SECONDS
+    warmed = 0
+    for resolution in RESOLUTIONS:
+        base_dir = rendition_dir(video_id, resolution)
+        for name in _opening_segments(video_id, resolution, seconds):
+            if _prewarm_file(os.path.join(base_dir, name)):
+                warmed += 1
+    return warmed
+
+
+def prewarm_popular_segments(top_n=None):
+    """
+    Prewarm segments by recent demand.
+    Ranks titles and segments from the sampled segment request counters and
+    prewarms the opening minutes of the top N titles plus the top N * 10
+    individual segments. Runs on deploy and periodically.
+    """
+    top_n = top_n or settings.HLS_PREWARM_TOP_N
+    warmed = 0
+    titles = top_titles(top_n)
+    for video_id in titles:
+        warmed += prewarm_video(video_id)
+    for video_id, resolution, segment in top_segments(top_n * 10):
+        if not (is_valid_resolution(resolution) and
+                is_valid_segment_name(segment)):
+            continue
+        path = os.path.join(rendition_dir(video_id, resolution), segment)
+        if _prewarm_file(path):
+            warmed += 1
+    logger.info('Prewarmed %d segment files for %d titles', warmed, len(titles))
+    return warmed
+
+
+def generate_thumbnail_variants(video_id):
+    """
+    Build resized WebP and JPEG derivatives of a video's thumbnail
+    and its inline placeholder.
+    Enqueued whenever a thumbnail is uploaded, replaced or removed.
+    """
+    video = Video.objects.filter(pk=video_id).first()
+    if video is None:
+        return None
+
+    variants, placeholder = {}, ''
+    if video.thumbnail:
+        try:
+            image = open_thumbnail(video.thumbnail.path)
+            variants = build_variants(video_id, image)
+            placeholder = build_placeholder(image)
+        except OSError:
+            logger.warning('Could not build thumbnail variants for video %s',
+                           video_id, exc_info=True)
+            variants = {}
+            remove_variants(video_id)
+    else:
+        remove_variants(video_id)
+
+    # update() skips the post_save handler, so invalidate explicitly.
+    Video.objects.filter(pk=video_id).update(
+        thumbnail_variants=variants, thumbnail_placeholder=placeholder)
+    bump_catalog_version()
+    return variants
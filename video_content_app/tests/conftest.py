@@ -3,11 +3,14 @@ Pytest configuration and shared fixtures for video_content_app tests.
 """
 import pytest
 import os
+from unittest.mock import patch
+from django.core.cache import cache
 from django.core.files.uploadedfile import SimpleUploadedFile
 from django.contrib.auth.models import User
 
 from rest_framework.test import APIClient
 from video_content_app.models import Video
+from video_content_app.segment_index import clear_index_cache
 
 
 @pytest.fixture
@@ -35,6 +38,18 @@ def authenticated_client(api_client, authenticated_user):
     return api_client
 
 
+@pytest.fixture
+def locmem_cache(settings):
+    """Replace the dummy test cache with an empty local-memory cache."""
+    settings.CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+            'LOCATION': 'video-tests',
+        }
+    }
+    cache.clear()
+
+
 @pytest.fixture
 def sample_video(db, tmp_path):
     """Create a sample video for testing."""
@@ -76,3 +91,18 @@ def clear_media_files(settings, tmp_path):
     """Use temporary directory for media files during tests."""
     settings.MEDIA_ROOT = str(tmp_path / 'media')
     os.makedirs(settings.MEDIA_ROOT, exist_ok=True)
+
+
+@pytest.fixture(autouse=True)
+def clear_segment_indexes():
+    """Drop segment indexes cached by earlier tests (video ids are reused)."""
+    clear_index_cache()
+    yield
+    clear_index_cache()
+
+
+@pytest.fixture(autouse=True)
+def rq_queue():
+    """Replace the RQ queue used by the Video signals (no Redis in tests)."""
+    with patch('video_content_app.api.signals.django_rq') as django_rq:
+        yield django_rq.get_queue.return_value
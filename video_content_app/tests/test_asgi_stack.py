@@ -0,0 +1,118 @@
+import asyncio
+import os
+import pytest
+import runpy
+from unittest.mock import patch
+from asgiref.sync import async_to_sync
+from django.core.handlers.asgi import ASGIHandler
+from django.core.signals import request_finished, request_started
+from django.db import close_old_connections
+from django.urls import path
+
+from rest_framework_simplejwt.tokens import AccessToken
+
+from video_content_app.api.async_views import AsyncVideoManifestView
+
+
+# ROOT_URLCONF for these tests: the async view as routed in ASGI mode.
+urlpatterns = [
+    path('api/video/<int:movie_id>/<str:resolution>/index.m3u8',
+         AsyncVideoManifestView.as_view()),
+]
+
+
+def asgi_middleware(monkeypatch):
+    """Return MIDDLEWARE as core/settings.py builds it in ASGI mode."""
+    monkeypatch.setenv('ASYNC_STREAMING', 'True')
+    return runpy.run_path(
+        os.path.join(os.path.dirname(__file__), '..', '..', 'core',
+                     'settings.py'))['MIDDLEWARE']
+
+
+async def asgi_get(handler, path, cookie):
+    """Send one GET request through an ASGI application."""
+    scope = {
+        'type': 'http',
+        'asgi': {'version': '3.0'},
+        'http_version': '1.1',
+        'method': 'GET',
+        'scheme': 'http',
+        'path': path,
+        'raw_path': path.encode(),
+        'query_string': b'',
+        'root_path': '',
+        'headers': [(b'host', b'testserver'), (b'cookie', cookie.encode())],
+        'client': ('127.0.0.1', 40000),
+        'server': ('testserver', 80),
+    }
+    messages = [{'type': 'http.request', 'body': b'', 'more_body': False}]
+    sent = []
+
+    async def receive():
+        if messages:
+            return messages.pop(0)
+        # The client stays connected until the response is sent.
+        await asyncio.Event().wait()
+
+    async def send(message):
+        sent.append(message)
+
+    await handler(scope, receive, send)
+    start = next(m for m in sent if m['type'] == 'http.response.start')
+    body = b''.join(m.get('body', b'') for m in sent
+                    if m['type'] == 'http.response.body')
+    return start['status'], body
+
+
+@pytest.fixture
+def keep_test_connection():
+    # Like Django's test client: request signals must not close the
+    # connection holding the test transaction.
+    request_started.disconnect(close_old_connections)
+    request_finished.disconnect(close_old_connections)
+    yield
+    request_started.connect(close_old_connections)
+    request_finished.connect(close_old_connections)
+
+
+@pytest.mark.django_db
+class TestASGIStack:
+    """Test suite for the full ASGIHandler stack in ASYNC_STREAMING mode."""
+
+    def test_whitenoise_dropped(self, monkeypatch):
+        """Test that the sync-only WhiteNoise middleware is not loaded."""
+        middleware = asgi_middleware(monkeypatch)
+
+        assert 'whitenoise.middleware.WhiteNoiseMiddleware' not in middleware
+
+    def test_no_middleware_adapted(self, monkeypatch, settings):
+        """Test that no middleware forces a sync adaptation."""
+        settings.MIDDLEWARE = asgi_middleware(monkeypatch)
+
+        with patch('django.core.handlers.base.logger') as logger:
+            ASGIHandler()
+
+        messages = [call.args[0] for call in logger.debug.call_args_list]
+        assert not any('adapted' in message for message in messages)
+
+    def test_manifest_through_asgi_handler(
+            self, monkeypatch, settings, authenticated_user, sample_video,
+            keep_test_connection):
+        """Test that a manifest request passes the whole ASGI stack."""
+        settings.MIDDLEWARE = asgi_middleware(monkeypatch)
+        settings.ROOT_URLCONF = __name__
+        settings.ALLOWED_HOSTS = ['testserver']
+        rendition_dir = os.path.join(
+            settings.MEDIA_ROOT, 'videos', str(sample_video.id), '720p')
+        os.makedirs(rendition_dir, exist_ok=True)
+        with open(os.path.join(rendition_dir, 'index.m3u8'), 'w') as f:
+            f.write('#EXTM3U\n')
+        token = AccessToken.for_user(authenticated_user)
+
+        status_code, body = async_to_sync(asgi_get)(
+            ASGIHandler(),
+            f'/api/video/{sample_video.id}/720p/index.m3u8',
+            f'access_token={token}')
+
+        assert status_code == 200
+        assert body == b'#EXTM3U\n'
@@ -0,0 +1,128 @@
+import pytest
+import os
+from asgiref.sync import async_to_sync
+from django.http import Http404
+from django.test import AsyncRequestFactory
+
+from rest_framework import status
+from rest_framework_simplejwt.tokens import AccessToken
+
+from video_content_app.api.async_views import (
+    AsyncVideoManifestView,
+    AsyncVideoSegmentView,
+)
+
+
+def _write_rendition_file(settings, video_id, name, content):
+    rendition_dir = os.path.join(
+        settings.MEDIA_ROOT, 'videos', str(video_id), '720p')
+    os.makedirs(rendition_dir, exist_ok=True)
+    path = os.path.join(rendition_dir, name)
+    with open(path, 'wb') as f:
+        f.write(content)
+    return path
+
+
+async def _consume(response):
+    return b''.join([chunk async for chunk in response.streaming_content])
+
+
+@pytest.mark.django_db
+class TestAsyncStreamingViews:
+    """Test suite for the async HLS views used in ASGI mode."""
+
+    @pytest.fixture
+    def factory(self, authenticated_user):
+        factory = AsyncRequestFactory()
+        factory.cookies['access_token'] = str(
+            AccessToken.for_user(authenticated_user))
+        return factory
+
+    def _call(self, view_class, request, **kwargs):
+        return async_to_sync(view_class.as_view())(request, **kwargs)
+
+    def test_views_are_async(self):
+        """Test that both views are served as coroutines."""
+        assert AsyncVideoManifestView.view_is_async
+        assert AsyncVideoSegmentView.view_is_async
+
+    def test_manifest_unauthenticated(self, sample_video):
+        """Test that requests without access token cookie are rejected."""
+        request = AsyncRequestFactory().get('/')
+        response = self._call(
+            AsyncVideoManifestView, request,
+            movie_id=sample_video.id, resolution='720p')
+
+        assert response.status_code == status.HTTP_401_UNAUTHORIZED
+
+    def test_manifest_inactive_user(self, factory, authenticated_user, sample_video):
+        """Test that tokens of deactivated users get 401 instead of 500."""
+        authenticated_user.is_active = False
+        authenticated_user.save()
+
+        response = self._call(
+            AsyncVideoManifestView, factory.get('/'),
+            movie_id=sample_video.id, resolution='720p')
+
+        assert response.status_code == status.HTTP_401_UNAUTHORIZED
+        assert b'User is inactive' in response.content
+
+    def test_segment_deleted_user(self, factory, authenticated_user, sample_video):
+        """Test that tokens of deleted users get 401 instead of 500."""
+        authenticated_user.delete()
+
+        response = self._call(
+            AsyncVideoSegmentView, factory.get('/'),
+            movie_id=sample_video.id, resolution='720p', segment='000.ts')
+
+        assert response.status_code == status.HTTP_401_UNAUTHORIZED
+
+    def test_manifest_served(self, factory, sample_video, settings):
+        """Test that an existing manifest is returned."""
+        _write_rendition_file(
+            settings, sample_video.id, 'index.m3u8', b'#EXTM3U\n')
+
+        response = self._call(
+            AsyncVideoManifestView, factory.get('/'),
+            movie_id=sample_video.id, resolution='720p')
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response['Content-Type'] == 'application/vnd.apple.mpegurl'
+        assert b'#EXTM3U' in response.content
+
+    def test_segment_nonexistent_video(self, factory):
+        """Test that unknown videos return 404."""
+        with pytest.raises(Http404):
+            self._call(
+                AsyncVideoSegmentView, factory.get('/'),
+                movie_id=99999, resolution='720p', segment='segment0.ts')
+
+    def test_segment_streamed(self, factory, sample_video, settings):
+        """Test that a segment is streamed with its size up front."""
+        content = b'x' * 200000
+        _write_rendition_file(settings, sample_video.id, 'segment0.ts', content)
+
+        response = self._call(
+            AsyncVideoSegmentView, factory.get('/'),
+            movie_id=sample_video.id, resolution='720p', segment='segment0.ts')
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response['Content-Type'] == 'video/MP2T'
+        assert response['Content-Length'] == str(len(content))
+        assert response.is_async
+        assert async_to_sync(_consume)(response) == content
+
+    def test_segment_sendfile_handoff(self, factory, sample_video, settings):
+        """Test that the proxy sendfile header is used when configured."""
+        settings.HLS_SENDFILE_HEADER = 'X-Accel-Redirect'
+        settings.HLS_SENDFILE_PREFIX = '/protected-media/'
+        _write_rendition_file(settings, sample_video.id, 'segment0.ts', b'data')
+
+        response = self._call(
+            AsyncVideoSegmentView, factory.get('/'),
+            movie_id=sample_video.id, resolution='720p', segment='segment0.ts')
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response['X-Accel-Redirect'] == (
+            f'/protected-media/videos/{sample_video.id}/720p/segment0.ts')
+        assert response.content == b''
@@ -0,0 +1,132 @@
+import threading
+import time
+from unittest.mock import MagicMock, patch
+
+from video_content_app.coalescing import SingleFlight, coalesced_load
+
+
+class TestSingleFlight:
+    """Test suite for in-process request coalescing."""
+
+    def test_concurrent_calls_share_one_load(self):
+        """Test that concurrent misses for one key run a single loader."""
+        single_flight = SingleFlight()
+        calls = []
+        started = threading.Event()
+
+        def load():
+            calls.append(1)
+            started.set()
+            time.sleep(0.1)
+            return b'segment'
+
+        results = []
+
+        def worker():
+            results.append(single_flight.do('1/720p/index0.ts', load))
+
+        threads = [threading.Thread(target=worker) for _ in range(8)]
+        threads[0].start()
+        started.wait()
+        for thread in threads[1:]:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert len(calls) == 1
+        assert results == [b'segment'] * 8
+
+    def test_errors_are_shared(self):
+        """Test that waiting callers see the loader's exception."""
+        single_flight = SingleFlight()
+        started = threading.Event()
+        errors = []
+
+        def load():
+            started.set()
+            time.sleep(0.05)
+            raise OSError('disk error')
+
+        def worker():
+            try:
+                single_flight.do('key', load)
+            except OSError as exc:
+                errors.append(exc)
+
+        threads = [threading.Thread(target=worker) for _ in range(3)]
+        threads[0].start()
+        started.wait()
+        for thread in threads[1:]:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert len(errors) == 3
+
+    def test_key_released_after_load(self):
+        """Test that later calls start a new load."""
+        single_flight = SingleFlight()
+        load = MagicMock(return_value=b'data')
+
+        single_flight.do('key', load)
+        single_flight.do('key', load)
+
+        assert load.call_count == 2
+
+
+class TestCoalescedLoad:
+    """Test suite for cross-process coalescing via a Redis lock."""
+
+    def test_without_redis_loads_directly(self):
+        """Test the fallback when the cache backend is not Redis."""
+        load = MagicMock(return_value=b'data')
+
+        with patch('video_content_app.coalescing.get_redis', return_value=None):
+            assert coalesced_load('key', load, lambda: None) == b'data'
+
+        load.assert_called_once()
+
+    def test_already_cached_skips_load(self):
+        """Test that a peer-filled cache entry is used without loading."""
+        load = MagicMock()
+
+        assert coalesced_load('key', load, lambda: b'cached') == b'cached'
+        load.assert_not_called()
+
+    def test_lock_holder_loads_and_releases(self):
+        """Test that the process holding the lock loads and releases it."""
+        redis = MagicMock()
+        redis.lock.return_value.acquire.return_value = True
+        load = MagicMock(return_value=b'data')
+
+        with patch('video_content_app.coalescing.get_redis', return_value=redis):
+            assert coalesced_load('key', load, lambda: None) == b'data'
+
+        load.assert_called_once()
+        redis.lock.return_value.release.assert_called_once()
+
+    def test_waits_for_peer_process(self, settings):
+        """Test that losing the lock race waits for the peer's cache fill."""
+        settings.HLS_COALESCE_LOCK_TIMEOUT = 1
+        redis = MagicMock()
+        redis.lock.return_value.acquire.return_value = False
+        load = MagicMock()
+        lookups = iter([None, None, None, b'peer data'])
+
+        with patch('video_content_app.coalescing.get_redis', return_value=redis):
+            result = coalesced_load('key', load, lambda: next(lookups))
+
+        assert result == b'peer data'
+        load.assert_not_called()
+
+    def test_loads_when_peer_lock_expires(self, settings):
+        """Test the fallback when the peer never fills the cache."""
+        settings.HLS_COALESCE_LOCK_TIMEOUT = 0.05
+        redis = MagicMock()
+        redis.lock.return_value.acquire.return_value = False
+        load = MagicMock(return_value=b'data')
+
+        with patch('video_content_app.coalescing.get_redis', return_value=redis):
+            assert coalesced_load('key', load, lambda: None) == b'data'
+
+        load.assert_called_once()
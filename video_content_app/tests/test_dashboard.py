@@ -0,0 +1,84 @@
+import pytest
+
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from video_content_app.models import Video
+
+
+DASHBOARD_URL = '/api/video/dashboard/'
+
+
+@pytest.fixture
+def category_videos(db):
+    """Create several videos in a few categories."""
+    videos = []
+    for category in ['Drama', 'Action', 'Comedy']:
+        for i in range(4):
+            videos.append(Video.objects.create(
+                title=f'{category} {i}',
+                description=f'{category} description {i}',
+                category=category,
+            ))
+    return videos
+
+
+@pytest.mark.django_db
+class TestVideoDashboardView:
+    """Test suite for the category dashboard endpoint."""
+
+    def test_requires_authentication(self, category_videos):
+        """Test that the dashboard requires authentication."""
+        response = APIClient().get(DASHBOARD_URL)
+
+        assert response.status_code == status.HTTP_401_UNAUTHORIZED
+
+    def test_rows_in_category_order(self, authenticated_client, category_videos):
+        """Test that rows follow the category choices order."""
+        response = authenticated_client.get(DASHBOARD_URL)
+
+        assert response.status_code == status.HTTP_200_OK
+        assert [row['category'] for row in response.data] == [
+            'Action', 'Comedy', 'Drama']
+
+    def test_newest_per_category(self, authenticated_client, category_videos):
+        """Test that each row holds the newest videos of its category."""
+        response = authenticated_client.get(
+            DASHBOARD_URL, {'per_category': 2})
+
+        for row in response.data:
+            titles = [video['title'] for video in row['videos']]
+            category = row['category']
+            assert titles == [f'{category} 3', f'{category} 2']
+
+    def test_single_query(self, authenticated_client, category_videos, django_assert_num_queries):
+        """Test that all rows are loaded in one database query."""
+        with django_assert_num_queries(1):
+            authenticated_client.get(DASHBOARD_URL, {'fields': 'id,title'})
+
+    def test_renditions_single_query(self, authenticated_client, category_videos, django_assert_num_queries):
+        """Test that renditions of all rows cost one extra query."""
+        with django_assert_num_queries(2):
+            authenticated_client.get(DASHBOARD_URL)
+
+    def test_per_category_bounds(self, authenticated_client, category_videos):
+        """Test that invalid per_category values fall back to limits."""
+        response = authenticated_client.get(
+            DASHBOARD_URL, {'per_category': 'abc'})
+        assert len(response.data[0]['videos']) == 4
+
+        response = authenticated_client.get(
+            DASHBOARD_URL, {'per_category': 0})
+        assert len(response.data[0]['videos']) == 1
+
+    def test_cached_until_catalog_changes(self, authenticated_client, category_videos, locmem_cache, django_assert_num_queries):
+        """Test that responses are cached per catalog version."""
+        first = authenticated_client.get(DASHBOARD_URL)
+        with django_assert_num_queries(0):
+            second = authenticated_client.get(DASHBOARD_URL)
+        assert second.content == first.content
+
+        Video.objects.create(
+            title='Horror 0', description='New', category='Horror')
+        response = authenticated_client.get(DASHBOARD_URL)
+        assert 'Horror' in [row['category'] for row in response.data]
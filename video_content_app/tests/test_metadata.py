@@ -0,0 +1,149 @@
+import json
+import os
+import pytest
+import subprocess
+from unittest.mock import patch
+
+from rest_framework import status
+
+from video_content_app.metadata import probe_video, store_video_metadata
+from video_content_app.models import Rendition, Video
+from video_content_app.segment_index import build_rendition_index
+from video_content_app.tasks import convert_to_hls
+
+
+def _write_hls(output_dir, durations):
+    os.makedirs(output_dir, exist_ok=True)
+    lines = ['#EXTM3U']
+    for i, duration in enumerate(durations):
+        lines += [f'#EXTINF:{duration},', f'index{i}.ts']
+        with open(os.path.join(output_dir, f'index{i}.ts'), 'wb') as f:
+            f.write(b'x' * 100)
+    with open(os.path.join(output_dir, 'index.m3u8'), 'w', encoding='utf-8') as f:
+        f.write('\n'.join(lines) + '\n')
+
+
+@pytest.fixture(autouse=True)
+def media_root(settings, tmp_path):
+    settings.MEDIA_ROOT = str(tmp_path)
+    return tmp_path
+
+
+class TestProbeVideo:
+    """Test suite for ffprobe metadata extraction."""
+
+    def test_probe(self):
+        """Test that duration and resolution are parsed."""
+        output = json.dumps({
+            'streams': [{'width': 1920, 'height': 1080}],
+            'format': {'duration': '125.5'},
+        })
+        result = subprocess.CompletedProcess([], 0, stdout=output)
+
+        with patch('video_content_app.metadata.subprocess.run', return_value=result):
+            assert probe_video('movie.mp4') == {
+                'duration': 125.5, 'width': 1920, 'height': 1080}
+
+    def test_probe_failure(self):
+        """Test that probe errors return no metadata."""
+        with patch('video_content_app.metadata.subprocess.run',
+                   side_effect=FileNotFoundError('ffprobe')):
+            assert probe_video('movie.mp4') == {}
+
+
+@pytest.mark.django_db
+class TestStoreVideoMetadata:
+    """Test suite for persisting metadata and renditions."""
+
+    def test_renditions_from_indexes(self, sample_video, media_root):
+        """Test that every indexed rendition is stored with its size."""
+        for resolution in ('480p', '720p'):
+            output_dir = os.path.join(
+                media_root, 'videos', str(sample_video.id), resolution)
+            _write_hls(output_dir, [10.0, 4.5])
+            build_rendition_index(output_dir)
+
+        store_video_metadata(
+            sample_video.id, {'duration': 14.4, 'width': 1920, 'height': 1080})
+
+        video = Video.objects.get(pk=sample_video.id)
+        assert (video.duration, video.width, video.height) == (14.4, 1920, 1080)
+        renditions = list(video.renditions.all())
+        assert [r.resolution for r in renditions] == ['480p', '720p']
+        manifest_size = os.path.getsize(os.path.join(
+            media_root, 'videos', str(sample_video.id), '720p', 'index.m3u8'))
+        assert renditions[1].segment_count == 2
+        assert renditions[1].total_bytes == manifest_size + 200
+        assert renditions[1].bitrate == 2500000
+
+    def test_duration_from_segments(self, sample_video, media_root):
+        """Test that the duration falls back to the segment durations."""
+        output_dir = os.path.join(
+            media_root, 'videos', str(sample_video.id), '480p')
+        _write_hls(output_dir, [10.0, 4.5])
+        build_rendition_index(output_dir)
+
+        store_video_metadata(sample_video.id)
+
+        assert Video.objects.get(pk=sample_video.id).duration == 14.5
+
+    def test_replaces_renditions(self, sample_video, media_root):
+        """Test that storing again does not duplicate renditions."""
+        output_dir = os.path.join(
+            media_root, 'videos', str(sample_video.id), '480p')
+        _write_hls(output_dir, [10.0])
+        build_rendition_index(output_dir)
+
+        store_video_metadata(sample_video.id)
+        store_video_metadata(sample_video.id)
+
+        assert Rendition.objects.filter(video=sample_video).count() == 1
+
+    def test_convert_to_hls_stores_metadata(self, sample_video, media_root):
+        """Test that transcoding stores the probed metadata."""
+        def fake_ffmpeg(cmd, check):
+            _write_hls(os.path.dirname(cmd[-1]), [10.0])
+
+        with patch('video_content_app.tasks.subprocess.run', side_effect=fake_ffmpeg), \
+                patch('video_content_app.tasks.probe_video',
+                      return_value={'duration': 10.0, 'width': 1280, 'height': 720}):
+            convert_to_hls('movie.mp4', sample_video.id)
+
+        video = Video.objects.get(pk=sample_video.id)
+        assert video.width == 1280
+        assert video.renditions.count() == 3
+
+
+@pytest.mark.django_db
+class TestMetadataInApi:
+    """Test suite for metadata in the video list."""
+
+    def _add_renditions(self, videos):
+        for video in videos:
+            Rendition.objects.create(
+                video=video, resolution='720p', width=1280, height=720,
+                bitrate=2500000, segment_count=3, total_bytes=1000)
+
+    def test_list_includes_renditions(self, authenticated_client, multiple_videos):
+        """Test that renditions are returned with each video."""
+        self._add_renditions(multiple_videos)
+
+        response = authenticated_client.get('/api/video/')
+
+        assert response.status_code == status.HTTP_200_OK
+        video = response.data['results'][0]
+        assert video['renditions'] == [{
+            'resolution': '720p', 'width': 1280, 'height': 720,
+            'bitrate': 2500000, 'segment_count': 3, 'total_bytes': 1000}]
+        assert 'duration' in video
+
+    def test_no_n_plus_one(self, authenticated_client, multiple_videos, django_assert_num_queries):
+        """Test that renditions for a page cost a single query."""
+        self._add_renditions(multiple_videos)
+        self._add_renditions([
+            Video.objects.create(title=f'More {i}', description='D', category='Drama')
+            for i in range(5)
+        ])
+
+        with django_assert_num_queries(2):
+            authenticated_client.get('/api/video/')
@@ -0,0 +1,71 @@
+import pytest
+from io import StringIO
+from django.core.management import call_command
+from django.test import Client
+
+from rest_framework import status
+
+from core.middleware import is_fast_path
+
+
+class TestIsFastPath:
+    """Test suite for matching fast-path routes."""
+
+    def test_matches_configured_prefixes(self, settings):
+        """Test that only configured prefixes take the fast path."""
+        settings.API_FAST_PATH_PREFIXES = ('/api/video/',)
+
+        assert is_fast_path('/api/video/1/480p/index.m3u8')
+        assert not is_fast_path('/api/login/')
+        assert not is_fast_path('/admin/')
+
+
+@pytest.mark.django_db
+class TestFastPathMiddleware:
+    """Test suite for skipping session, CSRF and frame middleware."""
+
+    def test_api_skips_middleware(self, authenticated_client):
+        """Test that fast-path responses bypass the skipped middleware."""
+        response = authenticated_client.get('/api/video/')
+
+        assert response.status_code == status.HTTP_200_OK
+        assert 'X-Frame-Options' not in response
+        assert not hasattr(response.wsgi_request, 'session')
+
+    def test_other_api_routes_keep_stack(self, api_client):
+        """Test that routes outside the prefixes keep all middleware."""
+        response = api_client.post('/api/logout/')
+
+        assert response['X-Frame-Options'] == 'DENY'
+        assert hasattr(response.wsgi_request, 'session')
+
+    def test_admin_keeps_csrf(self):
+        """Test that admin forms are still CSRF protected."""
+        client = Client(enforce_csrf_checks=True)
+
+        response = client.post('/admin/login/', {
+            'username': 'admin', 'password': 'secret'})
+
+        assert response.status_code == status.HTTP_403_FORBIDDEN
+
+    def test_admin_uses_session(self):
+        """Test that the admin still gets sessions and frame headers."""
+        response = Client().get('/admin/login/')
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response['X-Frame-Options'] == 'DENY'
+        assert hasattr(response.wsgi_request, 'session')
+
+
+class TestBenchmarkMiddleware:
+    """Test suite for the benchmark_middleware command."""
+
+    def test_reports_both_stacks(self):
+        """Test that stock and fast-path stacks are measured."""
+        out = StringIO()
+
+        call_command('benchmark_middleware', requests=5, stdout=out)
+
+        lines = out.getvalue().splitlines()[1:]
+        assert len(lines) == 4
+        assert 'stock' in lines[0] and 'fast path' in lines[1]
@@ -0,0 +1,117 @@
+import pytest
+import os
+from unittest.mock import MagicMock, patch
+
+from video_content_app import demand
+from video_content_app.segment_index import build_rendition_index, rendition_dir
+from video_content_app.tasks import (
+    prewarm_popular_segments,
+    prewarm_video,
+)
+
+
+def _write_rendition(video_id, durations, resolution='720p'):
+    output_dir = rendition_dir(video_id, resolution)
+    os.makedirs(output_dir, exist_ok=True)
+    lines = ['#EXTM3U']
+    for i, duration in enumerate(durations):
+        lines += [f'#EXTINF:{duration},', f'index{i}.ts']
+        with open(os.path.join(output_dir, f'index{i}.ts'), 'wb') as f:
+            f.write(b'segment')
+    with open(os.path.join(output_dir, 'index.m3u8'), 'w', encoding='utf-8') as f:
+        f.write('\n'.join(lines) + '\n')
+    return output_dir
+
+
+class TestDemandSampling:
+    """Test suite for sampled segment demand counters."""
+
+    def test_sample_rate_bounds(self, settings):
+        """Test that sample rates of 0 and 1 are honoured."""
+        settings.HLS_DEMAND_SAMPLE_RATE = 0
+        assert demand.should_sample() is False
+
+        settings.HLS_DEMAND_SAMPLE_RATE = 1
+        assert demand.should_sample() is True
+
+    def test_record_uses_single_pipeline(self):
+        """Test that a request is counted per title and per segment."""
+        redis = MagicMock()
+        pipe = redis.pipeline.return_value
+
+        with patch('video_content_app.demand.get_redis', return_value=redis):
+            demand.record_segment_request(7, '720p', 'index0.ts')
+
+        members = [c.args[2] for c in pipe.zincrby.call_args_list]
+        assert members == ['7', '7/720p/index0.ts']
+        pipe.execute.assert_called_once()
+
+    def test_record_without_redis(self):
+        """Test that recording is a no-op without Redis."""
+        with patch('video_content_app.demand.get_redis', return_value=None):
+            demand.record_segment_request(7, '720p', 'index0.ts')
+
+    def test_top_titles(self):
+        """Test that ranked members are returned as video ids."""
+        redis = MagicMock()
+        redis.pipeline.return_value.execute.return_value = [
+            2, [b'5', b'3'], 1]
+
+        with patch('video_content_app.demand.get_redis', return_value=redis):
+            assert demand.top_titles(2) == [5, 3]
+
+
+@pytest.mark.django_db
+class TestPrewarm:
+    """Test suite for page-cache prewarming."""
+
+    @pytest.fixture
+    def fadvise(self):
+        with patch('video_content_app.tasks.os.posix_fadvise', create=True) as mock:
+            yield mock
+
+    def test_prewarm_opening_minutes(self, settings, fadvise):
+        """Test that only segments covering the opening seconds are warmed."""
+        build_rendition_index(_write_rendition(1, [10.0] * 30))
+
+        warmed = prewarm_video(1, seconds=60)
+
+        assert warmed == 6
+        assert fadvise.call_count == 6
+
+    def test_prewarm_without_index(self, fadvise):
+        """Test that renditions without index use the manifest."""
+        _write_rendition(1, [10.0, 10.0, 10.0])
+
+        assert prewarm_video(1, seconds=15) == 2
+
+    def test_prewarm_popular(self, settings, fadvise):
+        """Test that top titles and top segments are warmed."""
+        settings.HLS_PREWARM_SECONDS = 10
+        _write_rendition(1, [10.0, 10.0])
+        _write_rendition(2, [10.0, 10.0, 10.0])
+
+        with patch('video_content_app.tasks.top_titles', return_value=[1]), \
+                patch('video_content_app.tasks.top_segments', return_value=[
+                    (2, '720p', 'index2.ts'),
+                    (2, '720p', '../../etc/passwd'),
+                ]):
+            warmed = prewarm_popular_segments(top_n=1)
+
+        assert warmed == 2
+
+
+@pytest.mark.django_db
+class TestSegmentDemandRecording:
+    """Test suite for demand sampling in the segment view."""
+
+    def test_segment_request_recorded(self, authenticated_client, sample_video, settings):
+        """Test that sampled segment requests are recorded."""
+        settings.HLS_DEMAND_SAMPLE_RATE = 1
+        build_rendition_index(_write_rendition(sample_video.id, [10.0]))
+
+        with patch('video_content_app.api.views.record_segment_request') as record:
+            authenticated_client.get(
+                f'/api/video/{sample_video.id}/720p/index0.ts/')
+
+        record.assert_called_once_with(sample_video.id, '720p', 'index0.ts')
@@ -0,0 +1,85 @@
+import json
+import msgpack
+import pytest
+from django.core.management import call_command
+from io import StringIO
+
+from rest_framework import status
+from rest_framework.renderers import JSONRenderer
+
+from core.renderers import MessagePackRenderer, ORJSONRenderer, PreRendered
+
+
+MSGPACK = 'application/msgpack'
+
+
+class TestRenderers:
+    """Test suite for the orjson and MessagePack renderers."""
+
+    def test_orjson_matches_drf_output(self):
+        """Test that orjson renders the same bytes as DRF's renderer."""
+        data = {'results': [{'id': 1, 'title': 'Über', 'thumbnail_url': None}]}
+
+        assert ORJSONRenderer().render(data) == JSONRenderer().render(data)
+
+    def test_orjson_indent(self):
+        """Test that an indent in the Accept header is honoured."""
+        rendered = ORJSONRenderer().render(
+            {'id': 1}, 'application/json; indent=4')
+
+        assert rendered == b'{\n  "id": 1\n}'
+
+    def test_pre_rendered_passthrough(self):
+        """Test that pre-rendered payloads are not encoded again."""
+        payload = PreRendered(b'{"cached":true}')
+
+        assert ORJSONRenderer().render(payload) is payload
+        assert MessagePackRenderer().render(payload) is payload
+
+    def test_msgpack_roundtrip(self):
+        """Test that MessagePack output decodes to the input data."""
+        data = {'results': [{'id': 1, 'title': 'Video'}], 'next': None}
+
+        assert msgpack.unpackb(MessagePackRenderer().render(data)) == data
+
+
+@pytest.mark.django_db
+@pytest.mark.usefixtures('locmem_cache')
+class TestVideoListNegotiation:
+    """Test suite for content negotiation on the video list."""
+
+    def test_msgpack_accept_header(self, authenticated_client, multiple_videos):
+        """Test that clients can request MessagePack via Accept."""
+        response = authenticated_client.get('/api/video/', HTTP_ACCEPT=MSGPACK)
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response['Content-Type'] == MSGPACK
+        data = msgpack.unpackb(response.content)
+        assert len(data['results']) == 3
+
+    def test_formats_cached_separately(self, authenticated_client, multiple_videos, django_assert_num_queries):
+        """Test that cached JSON and MessagePack pages do not mix."""
+        authenticated_client.get('/api/video/')
+        authenticated_client.get('/api/video/', HTTP_ACCEPT=MSGPACK)
+
+        with django_assert_num_queries(0):
+            as_json = authenticated_client.get('/api/video/')
+            as_msgpack = authenticated_client.get(
+                '/api/video/', HTTP_ACCEPT=MSGPACK)
+
+        assert as_json['Content-Type'] == 'application/json'
+        assert json.loads(as_json.content) == msgpack.unpackb(
+            as_msgpack.content)
+
+
+class TestBenchmarkRenderersCommand:
+    """Test suite for the benchmark_renderers command."""
+
+    def test_reports_all_renderers(self):
+        """Test that every renderer is measured."""
+        out = StringIO()
+        call_command('benchmark_renderers', videos=5, iterations=2, stdout=out)
+
+        output = out.getvalue()
+        for name in ('DRF JSONRenderer', 'ORJSONRenderer', 'MessagePackRenderer'):
+            assert name in output
@@ -0,0 +1,133 @@
+import pytest
+from unittest.mock import patch
+from django.contrib.admin.sites import site
+from django.test import RequestFactory
+
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from video_content_app.models import Video
+from video_content_app.search import autocomplete_titles, search_videos
+
+
+SEARCH_URL = '/api/video/search/'
+AUTOCOMPLETE_URL = '/api/video/search/autocomplete/'
+
+
+@pytest.fixture
+def searchable_videos(db):
+    """Create videos with distinct titles and descriptions."""
+    return [
+        Video.objects.create(
+            title='Ocean Deep', description='A documentary about whales',
+            category='Documentary'),
+        Video.objects.create(
+            title='Ocean Heist', description='Thieves on a cruise ship',
+            category='Action'),
+        Video.objects.create(
+            title='Mountain Climb', description='Reaching the ocean of clouds',
+            category='Documentary'),
+    ]
+
+
+@pytest.mark.django_db
+class TestVideoSearchView:
+    """Test suite for the video search endpoint."""
+
+    def test_requires_authentication(self, searchable_videos):
+        """Test that search requires authentication."""
+        response = APIClient().get(SEARCH_URL, {'q': 'ocean'})
+
+        assert response.status_code == status.HTTP_401_UNAUTHORIZED
+
+    def test_matches_title_and_description(self, authenticated_client, searchable_videos):
+        """Test that titles and descriptions are searched."""
+        response = authenticated_client.get(SEARCH_URL, {'q': 'ocean'})
+
+        assert response.status_code == status.HTTP_200_OK
+        assert len(response.data) == 3
+
+    def test_category_filter(self, authenticated_client, searchable_videos):
+        """Test that results can be restricted to one category."""
+        response = authenticated_client.get(
+            SEARCH_URL, {'q': 'ocean', 'category': 'Action'})
+
+        assert [v['title'] for v in response.data] == ['Ocean Heist']
+
+    def test_empty_query(self, authenticated_client, searchable_videos):
+        """Test that an empty query returns no results."""
+        response = authenticated_client.get(SEARCH_URL, {'q': '  '})
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data == []
+
+    def test_limit(self, authenticated_client, searchable_videos):
+        """Test that the number of results is limited."""
+        response = authenticated_client.get(
+            SEARCH_URL, {'q': 'ocean', 'limit': 1})
+
+        assert len(response.data) == 1
+
+
+@pytest.mark.django_db
+class TestVideoAutocompleteView:
+    """Test suite for the title autocomplete endpoint."""
+
+    def test_prefix_match(self, authenticated_client, searchable_videos):
+        """Test that only titles starting with the prefix are suggested."""
+        response = authenticated_client.get(AUTOCOMPLETE_URL, {'q': 'oce'})
+
+        assert response.status_code == status.HTTP_200_OK
+        assert [v['title'] for v in response.data] == [
+            'Ocean Deep', 'Ocean Heist']
+        assert set(response.data[0]) == {'id', 'title'}
+
+    def test_empty_prefix(self, authenticated_client, searchable_videos):
+        """Test that an empty prefix returns no suggestions."""
+        response = authenticated_client.get(AUTOCOMPLETE_URL)
+
+        assert response.data == []
+
+
+@pytest.mark.django_db
+class TestPostgresSearch:
+    """Test suite for the Postgres search query construction."""
+
+    @pytest.fixture(autouse=True)
+    def postgres(self):
+        with patch('video_content_app.search._is_postgres', return_value=True):
+            yield
+
+    def test_search_uses_ranked_vector(self):
+        """Test that search filters on the vector and orders by rank."""
+        sql = str(search_videos('ocean', category='Action').query)
+
+        assert 'websearch_to_tsquery' in sql
+        assert 'ts_rank' in sql
+        assert 'search_vector' in sql
+
+    def test_autocomplete_orders_by_similarity(self):
+        """Test that suggestions are ordered by trigram similarity."""
+        with patch('video_content_app.search.Video.objects') as objects:
+            autocomplete_titles('oce', 10)
+
+        queryset = objects.filter.return_value
+        objects.filter.assert_called_once_with(title__istartswith='oce')
+        queryset.annotate.return_value.order_by.assert_called_once_with(
+            '-similarity', 'title')
+
+
+@pytest.mark.django_db
+class TestVideoAdminSearch:
+    """Test suite for the admin search integration."""
+
+    def test_admin_search(self, searchable_videos):
+        """Test that the admin search uses the search helper."""
+        model_admin = site._registry[Video]
+        request = RequestFactory().get('/admin/video_content_app/video/')
+
+        queryset, use_distinct = model_admin.get_search_results(
+            request, Video.objects.all(), 'heist')
+
+        assert [v.title for v in queryset] == ['Ocean Heist']
+        assert use_distinct is False
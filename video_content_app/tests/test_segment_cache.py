@@ -0,0 +1,182 @@
+import pytest
+import hashlib
+import os
+from io import StringIO
+from django.core.management import call_command
+
+from rest_framework import status
+
+from video_content_app.segment_cache import (
+    SharedSegmentCache,
+    get_segment_cache,
+    segment_key,
+)
+from video_content_app.segment_index import (
+    build_rendition_index,
+    clear_index_cache,
+)
+
+
+@pytest.fixture
+def cache_path(tmp_path):
+    return str(tmp_path / 'segment-cache')
+
+
+class TestSharedSegmentCache:
+    """Test suite for the shared-memory segment cache."""
+
+    def test_put_and_get(self, cache_path):
+        """Test that stored bytes are returned on lookup."""
+        cache = SharedSegmentCache(cache_path, slots=8, slot_size=1024)
+
+        assert cache.get('1/720p/index0.ts') is None
+        assert cache.put('1/720p/index0.ts', b'segment data') is True
+        assert cache.get('1/720p/index0.ts') == b'segment data'
+
+    def test_shared_between_instances(self, cache_path):
+        """Test that a second mapping of the same file sees the entries."""
+        writer = SharedSegmentCache(cache_path, slots=8, slot_size=1024)
+        reader = SharedSegmentCache(cache_path, slots=8, slot_size=1024)
+
+        writer.put('1/720p/index0.ts', b'shared')
+
+        assert reader.get('1/720p/index0.ts') == b'shared'
+
+    def test_rejects_oversized_segments(self, cache_path):
+        """Test that segments larger than a slot are not cached."""
+        cache = SharedSegmentCache(cache_path, slots=8, slot_size=16)
+
+        assert cache.put('1/720p/index0.ts', b'x' * 17) is False
+        assert cache.get('1/720p/index0.ts') is None
+
+    def test_hit_miss_counters(self, cache_path):
+        """Test that hits and misses are counted."""
+        cache = SharedSegmentCache(cache_path, slots=8, slot_size=1024)
+        cache.put('a', b'1')
+
+        cache.get('a')
+        cache.get('a')
+        cache.get('b')
+
+        stats = cache.stats()
+        assert stats['hits'] == 2
+        assert stats['misses'] == 1
+        assert stats['slots_used'] == 1
+        assert stats['bytes_used'] == 1
+
+    def test_size_bounded_eviction(self, cache_path):
+        """Test that the cache never holds more entries than slots."""
+        cache = SharedSegmentCache(cache_path, slots=4, slot_size=64)
+
+        for i in range(20):
+            cache.put(f'1/720p/index{i}.ts', b'x' * 10)
+
+        assert cache.stats()['slots_used'] == 4
+
+    def test_frequently_used_entries_survive(self, cache_path):
+        """Test that hot entries are not evicted by one-off segments."""
+        cache = SharedSegmentCache(cache_path, slots=4, slot_size=64)
+        cache.put('hot', b'hot')
+        for _ in range(10):
+            cache.get('hot')
+
+        for i in range(3):
+            cache.put(f'cold{i}', b'cold')
+        cache.put('cold3', b'cold')
+
+        assert cache.get('hot') == b'hot'
+
+    def test_disabled_by_default_in_tests(self, settings):
+        """Test that no cache is created when slots are 0."""
+        settings.HLS_SEGMENT_CACHE_SLOTS = 0
+
+        assert get_segment_cache() is None
+
+
+@pytest.mark.django_db
+class TestSegmentViewWithCache:
+    """Test suite for serving segments through the shared cache."""
+
+    @pytest.fixture(autouse=True)
+    def enable_cache(self, settings, cache_path):
+        settings.HLS_SEGMENT_CACHE_PATH = cache_path
+        settings.HLS_SEGMENT_CACHE_SLOTS = 8
+        settings.HLS_SEGMENT_CACHE_SLOT_SIZE = 1024
+
+    def _write_segment(self, settings, video_id, content):
+        segment_dir = os.path.join(
+            settings.MEDIA_ROOT, 'videos', str(video_id), '720p')
+        os.makedirs(segment_dir, exist_ok=True)
+        path = os.path.join(segment_dir, 'segment0.ts')
+        with open(path, 'wb') as f:
+            f.write(content)
+        return path
+
+    def _index_rendition(self, path):
+        with open(os.path.join(os.path.dirname(path), 'index.m3u8'), 'w') as f:
+            f.write('#EXTM3U\n#EXTINF:4.0,\nsegment0.ts\n#EXT-X-ENDLIST\n')
+        build_rendition_index(os.path.dirname(path))
+
+    def test_hit_served_without_disk(self, authenticated_client, sample_video, settings):
+        """Test that a cached segment is served after the file is gone."""
+        path = self._write_segment(settings, sample_video.id, b'segment bytes')
+        url = f'/api/video/{sample_video.id}/720p/segment0.ts/'
+
+        first = authenticated_client.get(url)
+        os.remove(path)
+        second = authenticated_client.get(url)
+
+        assert first.status_code == status.HTTP_200_OK
+        assert second.status_code == status.HTTP_200_OK
+        assert second['Content-Type'] == 'video/MP2T'
+        assert second.content == b'segment bytes'
+        assert get_segment_cache().get(
+            segment_key(sample_video.id, '720p', 'segment0.ts')) == b'segment bytes'
+
+    def test_indexed_segment_missing_on_disk(self, authenticated_client, sample_video, settings):
+        """Test that an indexed but deleted segment is a 404, not a 500."""
+        path = self._write_segment(settings, sample_video.id, b'segment bytes')
+        self._index_rendition(path)
+        os.remove(path)
+
+        response = authenticated_client.get(
+            f'/api/video/{sample_video.id}/720p/segment0.ts/')
+
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+
+    def test_retranscoded_segment_not_served_stale(self, authenticated_client, sample_video, settings):
+        """Test that cached bytes of a replaced segment never get the new index headers."""
+        path = self._write_segment(settings, sample_video.id, b'old segment')
+        self._index_rendition(path)
+        url = f'/api/video/{sample_video.id}/720p/segment0.ts/'
+        authenticated_client.get(url)
+
+        self._write_segment(settings, sample_video.id, b'new, longer segment')
+        self._index_rendition(path)
+        clear_index_cache()
+        response = authenticated_client.get(url)
+
+        assert response.content == b'new, longer segment'
+        assert response['Content-Length'] == str(len(b'new, longer segment'))
+        assert response['ETag'] == (
+            '"%s"' % hashlib.sha256(b'new, longer segment').hexdigest())
+
+    def test_large_segment_streamed_from_disk(self, authenticated_client, sample_video, settings):
+        """Test that segments larger than a slot bypass the cache."""
+        content = b'x' * 2048
+        self._write_segment(settings, sample_video.id, content)
+
+        response = authenticated_client.get(
+            f'/api/video/{sample_video.id}/720p/segment0.ts/')
+
+        assert response.status_code == status.HTTP_200_OK
+        assert b''.join(response.streaming_content) == content
+        assert get_segment_cache().stats()['slots_used'] == 0
+
+    def test_stats_command(self):
+        """Test that the stats command reports the counters."""
+        out = StringIO()
+        call_command('segment_cache_stats', stdout=out)
+
+        assert 'Hits:' in out.getvalue()
+        assert 'Slots used: 0/8' in out.getvalue()
@@ -0,0 +1,153 @@
+import pytest
+import hashlib
+import os
+from io import StringIO
+from django.core.management import call_command
+
+from rest_framework import status
+
+from video_content_app import segment_index
+from video_content_app.segment_index import (
+    INDEX_FILENAME,
+    build_rendition_index,
+    get_rendition_index,
+    rendition_dir,
+)
+
+
+MANIFEST = """#EXTM3U
+#EXT-X-VERSION:3
+#EXT-X-TARGETDURATION:10
+#EXTINF:10.000000,
+index0.ts
+#EXTINF:4.500000,
+index1.ts
+#EXT-X-ENDLIST
+"""
+
+
+def _write_rendition(video_id, resolution='720p'):
+    output_dir = rendition_dir(video_id, resolution)
+    os.makedirs(output_dir, exist_ok=True)
+    with open(os.path.join(output_dir, 'index.m3u8'), 'w', encoding='utf-8') as f:
+        f.write(MANIFEST)
+    for name, content in (('index0.ts', b'first segment'), ('index1.ts', b'last')):
+        with open(os.path.join(output_dir, name), 'wb') as f:
+            f.write(content)
+    return output_dir
+
+
+@pytest.mark.django_db
+class TestSegmentIndex:
+    """Test suite for the per-rendition segment index."""
+
+    def test_build_index(self):
+        """Test that sizes, durations and checksums are recorded."""
+        output_dir = _write_rendition(1)
+
+        index = build_rendition_index(output_dir)
+
+        assert os.path.isfile(os.path.join(output_dir, INDEX_FILENAME))
+        assert index['segments']['index0.ts'] == [
+            13, 10.0, hashlib.sha256(b'first segment').hexdigest()]
+        assert index['segments']['index1.ts'][:2] == [4, 4.5]
+
+    def test_index_is_cached(self):
+        """Test that the index is read once and then served from memory."""
+        output_dir = _write_rendition(1)
+        build_rendition_index(output_dir)
+
+        first = get_rendition_index(1, '720p')
+        os.remove(os.path.join(output_dir, INDEX_FILENAME))
+
+        assert get_rendition_index(1, '720p') is first
+        assert first.segments['index0.ts'].size == 13
+
+    def test_rebuilt_index_is_reloaded(self, monkeypatch):
+        """Test that a rebuilt index replaces the cached one without clearing it."""
+        output_dir = _write_rendition(1)
+        build_rendition_index(output_dir)
+        first = get_rendition_index(1, '720p')
+        with open(os.path.join(output_dir, 'index0.ts'), 'wb') as f:
+            f.write(b're-encoded first segment')
+        build_rendition_index(output_dir)
+
+        assert get_rendition_index(1, '720p') is first
+        monkeypatch.setattr(segment_index, 'INDEX_REVALIDATE_INTERVAL', 0)
+        rebuilt = get_rendition_index(1, '720p')
+
+        assert rebuilt.segments['index0.ts'].size == 24
+        assert get_rendition_index(1, '720p') is rebuilt
+
+    def test_missing_index(self):
+        """Test that renditions without index return None."""
+        assert get_rendition_index(1, '720p') is None
+
+    def test_build_command(self):
+        """Test that the backfill command indexes existing renditions."""
+        output_dir = _write_rendition(1)
+        out = StringIO()
+
+        call_command('build_segment_index', stdout=out)
+
+        assert os.path.isfile(os.path.join(output_dir, INDEX_FILENAME))
+        assert 'Built 1 segment index(es).' in out.getvalue()
+
+
+@pytest.mark.django_db
+class TestIndexedSegmentView:
+    """Test suite for serving segments through the segment index."""
+
+    @pytest.fixture
+    def indexed_video(self, sample_video):
+        build_rendition_index(_write_rendition(sample_video.id))
+        return sample_video
+
+    def test_segment_headers_from_index(self, authenticated_client, indexed_video):
+        """Test that size and checksum headers come from the index."""
+        response = authenticated_client.get(
+            f'/api/video/{indexed_video.id}/720p/index0.ts/')
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response['Content-Length'] == '13'
+        assert response['ETag'] == (
+            '"%s"' % hashlib.sha256(b'first segment').hexdigest())
+        assert b''.join(response.streaming_content) == b'first segment'
+
+    def test_unindexed_segment_rejected(self, authenticated_client, indexed_video):
+        """Test that files missing from the index are not served."""
+        stray = os.path.join(rendition_dir(indexed_video.id, '720p'), 'stray.ts')
+        with open(stray, 'wb') as f:
+            f.write(b'stray')
+
+        response = authenticated_client.get(
+            f'/api/video/{indexed_video.id}/720p/stray.ts/')
+
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+
+    @pytest.mark.parametrize('resolution, segment', [
+        ('999p', 'index0.ts'),
+        ('720p', 'index.m3u8'),
+        ('720p', '..'),
+    ])
+    def test_invalid_names_rejected(self, authenticated_client, sample_video, resolution, segment):
+        """Test that invalid rendition or segment names return 404."""
+        response = authenticated_client.get(
+            f'/api/video/{sample_video.id}/{resolution}/{segment}/')
+
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+
+    def test_manifest_served_from_index(self, authenticated_client, indexed_video):
+        """Test that manifests of indexed renditions are served."""
+        response = authenticated_client.get(
+            f'/api/video/{indexed_video.id}/720p/index.m3u8')
+
+        assert response.status_code == status.HTTP_200_OK
+        assert 'index0.ts' in response.content.decode('utf-8')
+
+    def test_invalid_manifest_resolution(self, authenticated_client, sample_video):
+        """Test that unknown renditions return 404."""
+        response = authenticated_client.get(
+            f'/api/video/{sample_video.id}/4k/index.m3u8')
+
+        assert response.status_code == status.HTTP_404_NOT_FOUND
@@ -1,7 +1,13 @@
 import pytest
+from django.test import RequestFactory
+from rest_framework.exceptions import ValidationError
 
 from video_content_app.models import Video
-from video_content_app.api.serializers import VideoSerializer
+from video_content_app.api.serializers import (
+    VideoSerializer,
+    VideoValuesSerializer,
+    parse_fields,
+)
 
 
 @pytest.mark.django_db
@@ -129,3 +135,42 @@ class TestVideoSerializer:
         # First item should be the most recently created
         assert serializer.data[0]['title'] == 'Second'
         assert serializer.data[1]['title'] == 'First'
+
+
+@pytest.mark.django_db
+class TestSparseFieldsets:
+    """Test suite for sparse fieldsets and the values projection."""
+
+    def test_parse_fields(self):
+        """Test parsing of the comma separated fields parameter."""
+        assert parse_fields(None) is None
+        assert parse_fields(' id , title,') == ['id', 'title']
+
+    def test_parse_unknown_field(self):
+        """Test that unknown fields are rejected."""
+        with pytest.raises(ValidationError):
+            parse_fields('id,secret')
+
+    def test_serializer_subset(self, sample_video):
+        """Test that the serializer only returns requested fields."""
+        data = VideoSerializer(sample_video, fields=['id', 'title']).data
+
+        assert set(data) == {'id', 'title'}
+
+    def test_values_projection_matches_serializer(self, sample_video, multiple_videos):
+        """Test that values rows serialize exactly like model instances."""
+        request = RequestFactory().get('/')
+        projection = VideoValuesSerializer(context={'request': request})
+        rows = Video.objects.values(*projection.columns())
+
+        expected = VideoSerializer(
+            Video.objects.all(), many=True, context={'request': request}).data
+
+        assert projection.serialize(rows) == expected
+
+    def test_values_projection_columns(self):
+        """Test that only the columns of requested fields are selected."""
+        projection = VideoValuesSerializer(
+            fields=['thumbnail_url', 'title'])
+
+        assert projection.columns() == ['title', 'thumbnail']
@@ -0,0 +1,241 @@
+import io
+import os
+import pytest
+from io import StringIO
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.core.management import call_command
+from django.test import RequestFactory
+from PIL import Image
+
+from video_content_app.api.serializers import VideoSerializer
+from video_content_app.models import Video
+from video_content_app.tasks import generate_thumbnail_variants
+from video_content_app.thumbnails import (
+    build_placeholder,
+    build_variants,
+    open_thumbnail,
+    variants_dir,
+)
+
+
+def _jpeg(width=2000, height=1000, name='thumb.jpg'):
+    exif = Image.Exif()
+    exif[0x010F] = 'Camera Maker'
+    buffer = io.BytesIO()
+    Image.new('RGB', (width, height), (200, 30, 30)).save(
+        buffer, format='JPEG', exif=exif)
+    return SimpleUploadedFile(name, buffer.getvalue(), content_type='image/jpeg')
+
+
+@pytest.fixture(autouse=True)
+def media_root(settings, tmp_path):
+    settings.MEDIA_ROOT = str(tmp_path)
+    settings.THUMBNAIL_WIDTHS = [320, 640, 1280]
+    return tmp_path
+
+
+@pytest.mark.django_db
+class TestBuildVariants:
+    """Test suite for the thumbnail derivative pipeline."""
+
+    def test_widths_and_formats(self):
+        """Test that every width is written as WebP and JPEG."""
+        video = Video.objects.create(
+            title='Video', description='Desc', category='Action',
+            thumbnail=_jpeg())
+
+        variants = build_variants(
+            video.id, open_thumbnail(video.thumbnail.path))
+
+        assert set(variants) == {'webp', 'jpeg'}
+        assert list(variants['webp']) == ['320', '640', '1280']
+        assert variants['jpeg']['640'] == f'thumbnail/variants/{video.id}/640.jpg'
+        for fmt in variants.values():
+            for name in fmt.values():
+                assert os.path.isfile(os.path.join(variants_dir(video.id), os.path.basename(name)))
+
+    def test_progressive_jpeg_without_metadata(self):
+        """Test that JPEGs are progressive and metadata is stripped."""
+        video = Video.objects.create(
+            title='Video', description='Desc', category='Action',
+            thumbnail=_jpeg())
+
+        build_variants(video.id, open_thumbnail(video.thumbnail.path))
+
+        with Image.open(os.path.join(variants_dir(video.id), '320.jpg')) as image:
+            assert image.width == 320
+            assert image.info.get('progressive')
+            assert 'exif' not in image.info
+
+    def test_placeholder(self):
+        """Test that the placeholder is a tiny inline WebP."""
+        placeholder = build_placeholder(Image.new('RGB', (1280, 720)))
+
+        assert placeholder.startswith('data:image/webp;base64,')
+        assert len(placeholder) < 400
+
+    def test_no_upscaling(self):
+        """Test that small thumbnails are not enlarged."""
+        video = Video.objects.create(
+            title='Video', description='Desc', category='Action',
+            thumbnail=_jpeg(width=200, height=100))
+
+        variants = build_variants(
+            video.id, open_thumbnail(video.thumbnail.path))
+
+        assert list(variants['webp']) == ['200']
+
+
+@pytest.mark.django_db
+class TestThumbnailTask:
+    """Test suite for the generate_thumbnail_variants task."""
+
+    def test_variants_stored(self):
+        """Test that the task stores the variants on the video."""
+        video = Video.objects.create(
+            title='Video', description='Desc', category='Action',
+            thumbnail=_jpeg())
+
+        generate_thumbnail_variants(video.id)
+
+        video.refresh_from_db()
+        assert list(video.thumbnail_variants['jpeg']) == ['320', '640', '1280']
+        assert video.thumbnail_placeholder.startswith('data:image/webp')
+
+    def test_unreadable_image(self):
+        """Test that invalid images leave no variants behind."""
+        video = Video.objects.create(
+            title='Video', description='Desc', category='Action',
+            thumbnail=SimpleUploadedFile('bad.jpg', b'not an image'))
+
+        assert generate_thumbnail_variants(video.id) == {}
+        assert not os.path.isdir(variants_dir(video.id))
+
+    def test_missing_video(self):
+        """Test that deleted videos are ignored."""
+        assert generate_thumbnail_variants(999) is None
+
+
+@pytest.mark.django_db
+class TestThumbnailSignals:
+    """Test suite for enqueueing thumbnail derivative builds."""
+
+    def _enqueued(self, rq_queue):
+        return [c.args for c in rq_queue.enqueue.call_args_list
+                if c.args[0] is generate_thumbnail_variants]
+
+    def test_enqueued_on_upload(self, rq_queue):
+        """Test that uploading a thumbnail enqueues the task."""
+        video = Video.objects.create(
+            title='Video', description='Desc', category='Action',
+            thumbnail=_jpeg())
+
+        assert self._enqueued(rq_queue) == [
+            (generate_thumbnail_variants, video.id)]
+
+    def test_not_enqueued_without_change(self, rq_queue):
+        """Test that saves without thumbnail changes enqueue nothing."""
+        video = Video.objects.create(
+            title='Video', description='Desc', category='Action',
+            thumbnail=_jpeg())
+        rq_queue.reset_mock()
+
+        video.title = 'Renamed'
+        video.save()
+        Video.objects.get(pk=video.pk).save()
+
+        assert self._enqueued(rq_queue) == []
+
+    def test_enqueued_on_replace(self, rq_queue):
+        """Test that replacing a thumbnail enqueues the task again."""
+        video = Video.objects.create(
+            title='Video', description='Desc', category='Action',
+            thumbnail=_jpeg())
+        rq_queue.reset_mock()
+
+        video = Video.objects.get(pk=video.pk)
+        video.thumbnail = _jpeg(name='other.jpg')
+        video.save()
+
+        assert len(self._enqueued(rq_queue)) == 1
+
+    def test_deferred_thumbnail_not_loaded(self, rq_queue, django_assert_num_queries):
+        """Test that deferred thumbnails are not fetched on load."""
+        Video.objects.create(title='Video', description='Desc', category='Action')
+
+        with django_assert_num_queries(1):
+            list(Video.objects.only('id', 'title'))
+
+    def test_variants_removed_on_delete(self):
+        """Test that deleting a video removes its derivatives."""
+        video = Video.objects.create(
+            title='Video', description='Desc', category='Action',
+            thumbnail=_jpeg())
+        generate_thumbnail_variants(video.id)
+
+        Video.objects.get(pk=video.pk).delete()
+
+        assert not os.path.isdir(variants_dir(video.id))
+
+
+@pytest.mark.django_db
+class TestThumbnailSrcset:
+    """Test suite for the srcset map in VideoSerializer."""
+
+    def test_srcset(self):
+        """Test that variants are exposed as srcset strings per format."""
+        video = Video.objects.create(
+            title='Video', description='Desc', category='Action',
+            thumbnail=_jpeg())
+        generate_thumbnail_variants(video.id)
+        video.refresh_from_db()
+
+        data = VideoSerializer(
+            video, context={'request': RequestFactory().get('/')}).data
+
+        base = f'http://testserver/media/thumbnail/variants/{video.id}'
+        assert data['thumbnail_srcset']['webp'] == (
+            f'{base}/320.webp 320w, {base}/640.webp 640w, '
+            f'{base}/1280.webp 1280w')
+
+    def test_srcset_without_variants(self):
+        """Test that videos without variants return null."""
+        video = Video.objects.create(
+            title='Video', description='Desc', category='Action')
+
+        data = VideoSerializer(video).data
+        assert data['thumbnail_srcset'] is None
+        assert data['thumbnail_placeholder'] is None
+
+    def test_placeholder_inline(self):
+        """Test that the placeholder is included in the API response."""
+        video = Video.objects.create(
+            title='Video', description='Desc', category='Action',
+            thumbnail=_jpeg())
+        generate_thumbnail_variants(video.id)
+        video.refresh_from_db()
+
+        data = VideoSerializer(video).data
+
+        assert data['thumbnail_placeholder'] == video.thumbnail_placeholder
+
+
+@pytest.mark.django_db
+class TestBuildThumbnailVariantsCommand:
+    """Test suite for the build_thumbnail_variants command."""
+
+    def test_backfill(self):
+        """Test that only videos missing variants are processed."""
+        video = Video.objects.create(
+            title='Video', description='Desc', category='Action',
+            thumbnail=_jpeg())
+        Video.objects.create(title='No thumb', description='Desc', category='Drama')
+
+        out = StringIO()
+        call_command('build_thumbnail_variants', stdout=out)
+        call_command('build_thumbnail_variants', stdout=out)
+
+        video.refresh_from_db()
+        assert video.thumbnail_variants
+        assert 'for 1 video(s)' in out.getvalue()
+        assert 'for 0 video(s)' in out.getvalue()
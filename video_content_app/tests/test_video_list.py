@@ -1,7 +1,9 @@
 import pytest
+from unittest.mock import patch
 from django.contrib.auth.models import User
 
 from rest_framework import status
+from rest_framework.test import APIClient
 
 from video_content_app.models import Video
 
@@ -15,10 +17,10 @@ class TestVideoListView:
         response = authenticated_client.get('/api/video/')
 
         assert response.status_code == status.HTTP_200_OK
-        assert len(response.data) == 3
+        assert len(response.data['results']) == 3
 
         # Check that videos are ordered by created_at (descending)
-        titles = [video['title'] for video in response.data]
+        titles = [video['title'] for video in response.data['results']]
         assert 'Test Video' in titles[0]
 
     def test_list_videos_unauthenticated(self, api_client, multiple_videos):
@@ -32,16 +34,16 @@ class TestVideoListView:
         response = authenticated_client.get('/api/video/')
 
         assert response.status_code == status.HTTP_200_OK
-        assert len(response.data) == 0
+        assert len(response.data['results']) == 0
 
     def test_list_videos_contains_metadata(self, authenticated_client, sample_video):
         """Test that video list contains all required metadata."""
         response = authenticated_client.get('/api/video/')
 
         assert response.status_code == status.HTTP_200_OK
-        assert len(response.data) == 1
+        assert len(response.data['results']) == 1
 
-        video_data = response.data[0]
+        video_data = response.data['results'][0]
         assert 'id' in video_data
         assert 'title' in video_data
         assert 'description' in video_data
@@ -57,7 +59,7 @@ class TestVideoListView:
         response = authenticated_client.get('/api/video/')
 
         assert response.status_code == status.HTTP_200_OK
-        video_data = response.data[0]
+        video_data = response.data['results'][0]
 
         # Should contain a URL if thumbnail exists
         if sample_video.thumbnail:
@@ -86,12 +88,12 @@ class TestVideoListView:
         response = authenticated_client.get('/api/video/')
 
         assert response.status_code == status.HTTP_200_OK
-        assert len(response.data) == 3
+        assert len(response.data['results']) == 3
 
         # Newest should be first
-        assert response.data[0]['title'] == 'Third Video'
-        assert response.data[1]['title'] == 'Second Video'
-        assert response.data[2]['title'] == 'First Video'
+        assert response.data['results'][0]['title'] == 'Third Video'
+        assert response.data['results'][1]['title'] == 'Second Video'
+        assert response.data['results'][2]['title'] == 'First Video'
 
     def test_list_videos_filter_by_category(self, authenticated_client, multiple_videos):
         """Test filtering videos by category."""
@@ -100,7 +102,7 @@ class TestVideoListView:
         assert response.status_code == status.HTTP_200_OK
 
         # Check that different categories exist
-        categories = [video['category'] for video in response.data]
+        categories = [video['category'] for video in response.data['results']]
         assert 'Action' in categories
         assert 'Comedy' in categories
         assert 'Drama' in categories
@@ -128,4 +130,273 @@ class TestVideoListView:
         response = authenticated_client.get('/api/video/')
 
         assert response.status_code == status.HTTP_200_OK
-        assert len(response.data) == 50
+        assert len(response.data['results']) == 50
+
+
+@pytest.mark.django_db
+class TestVideoListPagination:
+    """Test suite for keyset pagination of the video list."""
+
+    @pytest.fixture
+    def many_videos(self):
+        return [
+            Video.objects.create(
+                title=f'Video {i}',
+                description=f'Description {i}',
+                category='Action'
+            )
+            for i in range(7)
+        ]
+
+    def _walk(self, client, url):
+        titles = []
+        while url:
+            response = client.get(url)
+            assert response.status_code == status.HTTP_200_OK
+            titles += [video['title'] for video in response.data['results']]
+            url = response.data['next']
+        return titles
+
+    def test_first_page_has_next_cursor(self, authenticated_client, many_videos):
+        """Test that a limited page links to the next page."""
+        response = authenticated_client.get('/api/video/?limit=3')
+
+        assert response.status_code == status.HTTP_200_OK
+        assert len(response.data['results']) == 3
+        assert 'cursor=' in response.data['next']
+
+    def test_last_page_has_no_next(self, authenticated_client, many_videos):
+        """Test that the final page has no next link."""
+        response = authenticated_client.get('/api/video/?limit=10')
+
+        assert len(response.data['results']) == 7
+        assert response.data['next'] is None
+
+    def test_walk_all_pages(self, authenticated_client, many_videos):
+        """Test that following cursors returns every video exactly once."""
+        titles = self._walk(authenticated_client, '/api/video/?limit=3')
+
+        assert titles == [f'Video {i}' for i in reversed(range(7))]
+
+    def test_ties_on_created_at(self, authenticated_client, many_videos):
+        """Test that equal timestamps are paginated by id."""
+        Video.objects.update(created_at=many_videos[0].created_at)
+
+        titles = self._walk(authenticated_client, '/api/video/?limit=2')
+
+        assert titles == [f'Video {i}' for i in reversed(range(7))]
+
+    def test_limit_is_capped(self, authenticated_client, many_videos):
+        """Test that invalid or huge limits fall back to sane values."""
+        response = authenticated_client.get('/api/video/?limit=abc')
+        assert len(response.data['results']) == 7
+
+        response = authenticated_client.get('/api/video/?limit=100000')
+        assert response.status_code == status.HTTP_200_OK
+
+    def test_invalid_cursor(self, authenticated_client, many_videos):
+        """Test that malformed cursors return 404."""
+        response = authenticated_client.get('/api/video/?cursor=not-a-cursor')
+
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+
+
+@pytest.mark.django_db
+class TestVideoListFields:
+    """Test suite for sparse fieldsets on the video list."""
+
+    def test_sparse_fieldset(self, authenticated_client, multiple_videos):
+        """Test that only the requested fields are returned."""
+        response = authenticated_client.get('/api/video/?fields=id,title')
+
+        assert response.status_code == status.HTTP_200_OK
+        for video in response.data['results']:
+            assert set(video) == {'id', 'title'}
+
+    def test_unknown_field(self, authenticated_client, multiple_videos):
+        """Test that unknown fields return 400."""
+        response = authenticated_client.get('/api/video/?fields=id,password')
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+    def test_pagination_without_cursor_fields(self, authenticated_client, multiple_videos):
+        """Test that pages chain when created_at and id are not requested."""
+        first = authenticated_client.get('/api/video/?fields=title&limit=2')
+        second = authenticated_client.get(first.data['next'])
+
+        titles = [v['title'] for v in
+                  first.data['results'] + second.data['results']]
+        assert titles == ['Test Video 3', 'Test Video 2', 'Test Video 1']
+
+    def test_no_model_instances(self, authenticated_client, multiple_videos):
+        """Test that the list is built without instantiating models."""
+        with patch.object(Video, 'from_db') as from_db:
+            response = authenticated_client.get('/api/video/')
+
+        assert len(response.data['results']) == 3
+        from_db.assert_not_called()
+
+
+@pytest.mark.django_db
+@pytest.mark.usefixtures('locmem_cache')
+class TestVideoListCache:
+    """Test suite for the cached video list responses."""
+
+    def test_second_request_served_from_cache(self, authenticated_client, multiple_videos, django_assert_num_queries):
+        """Test that a repeated request does not query the database."""
+        first = authenticated_client.get('/api/video/')
+
+        with django_assert_num_queries(0):
+            second = authenticated_client.get('/api/video/')
+
+        assert second.status_code == status.HTTP_200_OK
+        assert second.content == first.content
+        assert second['ETag'] == first['ETag']
+
+    def test_cache_invalidated_on_save(self, authenticated_client, multiple_videos):
+        """Test that creating a video invalidates cached pages."""
+        authenticated_client.get('/api/video/')
+        Video.objects.create(
+            title='Brand New', description='New', category='Drama')
+
+        response = authenticated_client.get('/api/video/')
+
+        assert response.data['results'][0]['title'] == 'Brand New'
+
+    def test_cache_invalidated_on_delete(self, authenticated_client, multiple_videos):
+        """Test that deleting a video invalidates cached pages."""
+        authenticated_client.get('/api/video/')
+        multiple_videos[-1].delete()
+
+        response = authenticated_client.get('/api/video/')
+
+        assert len(response.data['results']) == 2
+
+    def test_query_params_are_part_of_key(self, authenticated_client, multiple_videos):
+        """Test that different pages are cached separately."""
+        authenticated_client.get('/api/video/?limit=1')
+
+        response = authenticated_client.get('/api/video/?limit=2')
+
+        assert len(response.data['results']) == 2
+
+    def test_not_modified(self, authenticated_client, multiple_videos):
+        """Test that a matching If-None-Match returns 304."""
+        etag = authenticated_client.get('/api/video/')['ETag']
+
+        response = authenticated_client.get(
+            '/api/video/', HTTP_IF_NONE_MATCH=etag)
+
+        assert response.status_code == status.HTTP_304_NOT_MODIFIED
+        assert response.content == b''
+
+    def test_stale_etag_gets_fresh_page(self, authenticated_client, multiple_videos):
+        """Test that an ETag from an older catalog version is ignored."""
+        etag = authenticated_client.get('/api/video/')['ETag']
+        multiple_videos[0].delete()
+
+        response = authenticated_client.get(
+            '/api/video/', HTTP_IF_NONE_MATCH=etag)
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response['ETag'] != etag
+
+    @pytest.mark.parametrize('query', ['?fields=bogus', '?cursor=bogus'])
+    def test_error_releases_rebuild_lock(self, authenticated_client, multiple_videos, query):
+        """Test that an error response does not leave the rebuild lock behind."""
+        authenticated_client.get(f'/api/video/{query}')
+
+        with patch('video_content_app.api.cache.time.sleep') as sleep:
+            response = authenticated_client.get(f'/api/video/{query}')
+
+        assert response.status_code in (
+            status.HTTP_400_BAD_REQUEST, status.HTTP_404_NOT_FOUND)
+        sleep.assert_not_called()
+
+    def test_server_error_releases_rebuild_lock(self, authenticated_client, multiple_videos):
+        """Test that the 500 fallback releases the rebuild lock."""
+        with patch('video_content_app.api.views.VideoValuesSerializer.serialize',
+                   side_effect=RuntimeError):
+            assert authenticated_client.get('/api/video/').status_code == 500
+
+        with patch('video_content_app.api.cache.time.sleep') as sleep:
+            response = authenticated_client.get('/api/video/')
+
+        assert response.status_code == status.HTTP_200_OK
+        sleep.assert_not_called()
+
+    def test_unauthenticated_not_served_from_cache(self, authenticated_client, multiple_videos):
+        """Test that the cache does not bypass authentication."""
+        authenticated_client.get('/api/video/')
+
+        response = APIClient().get('/api/video/')
+
+        assert response.status_code == status.HTTP_401_UNAUTHORIZED
+
+
+@pytest.mark.django_db
+@pytest.mark.usefixtures('locmem_cache')
+class TestVideoBatchLookup:
+    """Test suite for looking up several videos by id."""
+
+    def test_requested_order(self, authenticated_client, multiple_videos):
+        """Test that videos are returned in the requested order."""
+        ids = [multiple_videos[1].id, multiple_videos[0].id, multiple_videos[2].id]
+
+        response = authenticated_client.get(
+            '/api/video/', {'ids': ','.join(map(str, ids))})
+
+        assert response.status_code == status.HTTP_200_OK
+        assert [v['id'] for v in response.data['results']] == ids
+
+    def test_unknown_and_duplicate_ids(self, authenticated_client, multiple_videos):
+        """Test that unknown ids are skipped and duplicates collapsed."""
+        video_id = multiple_videos[0].id
+
+        response = authenticated_client.get(
+            '/api/video/', {'ids': f'{video_id},99999,{video_id}'})
+
+        assert [v['id'] for v in response.data['results']] == [video_id]
+
+    def test_single_query_then_cached(self, authenticated_client, multiple_videos, django_assert_num_queries):
+        """Test that misses cost one query and hits none."""
+        first_id, second_id = multiple_videos[0].id, multiple_videos[1].id
+
+        with django_assert_num_queries(2):
+            authenticated_client.get('/api/video/', {'ids': f'{first_id}'})
+        with django_assert_num_queries(2):
+            authenticated_client.get(
+                '/api/video/', {'ids': f'{first_id},{second_id}'})
+        with django_assert_num_queries(0):
+            response = authenticated_client.get(
+                '/api/video/', {'ids': f'{second_id},{first_id}'})
+
+        assert [v['id'] for v in response.data['results']] == [
+            second_id, first_id]
+
+    def test_cache_invalidated_on_save(self, authenticated_client, multiple_videos):
+        """Test that cached videos are refreshed after an update."""
+        video = multiple_videos[0]
+        authenticated_client.get('/api/video/', {'ids': video.id})
+
+        video.title = 'Updated Title'
+        video.save()
+        response = authenticated_client.get('/api/video/', {'ids': video.id})
+
+        assert response.data['results'][0]['title'] == 'Updated Title'
+
+    def test_sparse_fields(self, authenticated_client, multiple_videos):
+        """Test that batch lookups support sparse fieldsets."""
+        response = authenticated_client.get(
+            '/api/video/', {'ids': multiple_videos[0].id, 'fields': 'id,title'})
+
+        assert set(response.data['results'][0]) == {'id', 'title'}
+
+    def test_invalid_ids(self, authenticated_client, multiple_videos):
+        """Test that malformed or too many ids return 400."""
+        response = authenticated_client.get('/api/video/', {'ids': '1,abc'})
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+        response = authenticated_client.get(
+            '/api/video/', {'ids': ','.join(str(i) for i in range(101))})
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
@@ -0,0 +1,91 @@
+import base64
+import io
+import os
+import shutil
+from django.conf import settings
+from PIL import Image, ImageOps
+
+
+# Output formats with their file extension and Pillow save options.
+# Images are re-encoded from pixel data only, so EXIF/ICC/XMP metadata
+# of the upload is never copied.
+FORMATS = {
+    'webp': ('webp', {'format': 'WEBP', 'method': 6}),
+    'jpeg': ('jpg', {'format': 'JPEG', 'progressive': True, 'optimize': True}),
+}
+
+# Low-quality image placeholder, inlined in API responses (~200 bytes).
+PLACEHOLDER_WIDTH = 20
+PLACEHOLDER_QUALITY = 40
+
+
+def variants_dir(video_id):
+    """
+    Return the directory holding the derivatives of a video's thumbnail.
+    """
+    return os.path.join(
+        settings.MEDIA_ROOT, 'thumbnail', 'variants', str(video_id))
+
+
+def remove_variants(video_id):
+    """
+    Delete all derivatives of a video's thumbnail.
+    """
+    shutil.rmtree(variants_dir(video_id), ignore_errors=True)
+
+
+def _target_widths(original_width):
+    # Never upscale; fall back to the original width for tiny uploads.
+    widths = sorted(w for w in settings.THUMBNAIL_WIDTHS if w <= original_width)
+    return widths or [original_width]
+
+
+def _resize(image, width):
+    height = max(1, round(image.height * width / image.width))
+    return image.resize((width, height), Image.Resampling.LANCZOS)
+
+
+def open_thumbnail(source_path):
+    """
+    Load an uploaded thumbnail as upright RGB image without metadata.
+    """
+    with Image.open(source_path) as image:
+        image = ImageOps.exif_transpose(image)
+        return image.convert('RGB')
+
+
+def build_variants(video_id, image):
+    """
+    Write resized WebP and progressive JPEG versions of a thumbnail.
+
+    Returns {format: {width: name}} with names relative to MEDIA_ROOT,
+    as stored in Video.thumbnail_variants.
+    """
+    output_dir = variants_dir(video_id)
+    remove_variants(video_id)
+    os.makedirs(output_dir, exist_ok=True)
+
+    variants = {fmt: {} for fmt in FORMATS}
+    for width in _target_widths(image.width):
+        resized = _resize(image, width)
+        for fmt, (extension, options) in FORMATS.items():
+            filename = f'{width}.{extension}'
+            resized.save(
+                os.path.join(output_dir, filename),
+                quality=settings.THUMBNAIL_QUALITY, **options)
+            variants[fmt][str(width)] = os.path.relpath(
+                os.path.join(output_dir, filename),
+                settings.MEDIA_ROOT).replace(os.sep, '/')
+    return variants
+
+
+def build_placeholder(image):
+    """
+    Return a tiny blurred-looking WebP of the thumbnail as data URI.
+    Clients stretch it over the tile until the real thumbnail loads.
+    """
+    buffer = io.BytesIO()
+    _resize(image, min(PLACEHOLDER_WIDTH, image.width)).save(
+        buffer, format='WEBP', quality=PLACEHOLDER_QUALITY, method=6)
+    encoded = base64.b64encode(buffer.getvalue()).decode('ascii')
+    return f'data:image/webp;base64,{encoded}'